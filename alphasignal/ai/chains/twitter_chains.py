@@ -1,9 +1,15 @@
 from pydantic import ValidationError
 from alphasignal.ai.llm import LLM
-from alphasignal.ai.models.sentiment_response import SentimentResponse
+from alphasignal.ai.models.sentiment_response import (
+    BatchSentimentResponse,
+    SentimentResponse,
+)
 from alphasignal.models.token_info import TokenInfo
-from typing import List
-from alphasignal.ai.prompts.twitter_prompts import tweet_classification_prompt
+from typing import List, Tuple
+from alphasignal.ai.prompts.twitter_prompts import (
+    batch_tweet_classification_prompt,
+    tweet_classification_prompt,
+)
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.exceptions import OutputParserException
 
@@ -13,19 +19,41 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def get_tweet_sentiment(tweet_text: str, tokens: List[TokenInfo]) -> SentimentResponse:
+_llm = None
+_sentiment_chain = None
+_batch_sentiment_chain = None
+
+
+def get_llm():
+    """Builds the configured provider client on first use and reuses it."""
+    global _llm
+    if _llm is None:
+        _llm = LLM().llm
+    return _llm
+
+
+def get_sentiment_chain():
+    """Builds the parser and chain on first use and reuses them."""
+    global _sentiment_chain
+    if _sentiment_chain is None:
+        prompt = tweet_classification_prompt
+        parser = PydanticOutputParser(pydantic_object=SentimentResponse)
+        llm = get_llm()
+        _sentiment_chain = (prompt | llm | parser).with_retry(
+            stop_after_attempt=3,
+            retry_if_exception_type=(OutputParserException, ValidationError),
+        )
+    return _sentiment_chain
+
+
+async def get_tweet_sentiment(
+    tweet_text: str, tokens: List[TokenInfo]
+) -> SentimentResponse:
     """Returns the sentiment of a tweet along with token information."""
-    prompt = tweet_classification_prompt
-    parser = PydanticOutputParser(pydantic_object=SentimentResponse)
-    llm = LLM().llm
-    chain = (prompt | llm | parser).with_retry(
-        stop_after_attempt=3,
-        retry_if_exception_type=(OutputParserException, ValidationError),
-    )
-    logging.info("tweet_text:", tweet_text)
-    print("tweet_text:", tweet_text)
+    chain = get_sentiment_chain()
+    logger.debug("tweet_text: %s", tweet_text)
 
-    sentiment = chain.invoke(
+    sentiment = await chain.ainvoke(
         {
             "tweet_text": tweet_text,
             "tokens": tokens,
@@ -34,6 +62,44 @@ def get_tweet_sentiment(tweet_text: str, tokens: List[TokenInfo]) -> SentimentRe
     )
 
     # Log the raw output for debugging
-    logger.info("chain.invoke output: %s", sentiment.json())
+    logger.info("chain.invoke output: %s", sentiment.model_dump_json())
 
     return sentiment
+
+
+def get_batch_sentiment_chain():
+    """Chain classifying several tweets in one call; not retried, callers fall back."""
+    global _batch_sentiment_chain
+    if _batch_sentiment_chain is None:
+        parser = PydanticOutputParser(pydantic_object=BatchSentimentResponse)
+        _batch_sentiment_chain = batch_tweet_classification_prompt | get_llm() | parser
+    return _batch_sentiment_chain
+
+
+async def get_batch_tweet_sentiment(
+    tweets: List[Tuple[str, List[TokenInfo]]],
+) -> List[SentimentResponse]:
+    """
+    Returns the sentiment of several tweets from a single LLM call.
+
+    Raises if the output cannot be parsed or does not cover every tweet.
+    """
+    chain = get_batch_sentiment_chain()
+    formatted = "\n\n".join(
+        f"INDEX: {index}\nTOKENS: {tokens}\nFULL_TWEET_TEXT: {text}"
+        for index, (text, tokens) in enumerate(tweets)
+    )
+    batch = await chain.ainvoke(
+        {
+            "tweets": formatted,
+            "parsing_model": BatchSentimentResponse.model_json_schema(),
+        }
+    )
+
+    by_index = {result.index: result.response for result in batch.results}
+    missing = [index for index in range(len(tweets)) if index not in by_index]
+    if missing:
+        raise ValueError(f"Batch output is missing tweets {missing}")
+    return [
+        SentimentResponse(response=by_index[index]) for index in range(len(tweets))
+    ]
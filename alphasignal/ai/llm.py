@@ -1,9 +1,35 @@
+import importlib
 import os
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_deepseek import ChatDeepSeek
-from langchain_mistralai.chat_models import ChatMistralAI
+
+# provider -> (module, chat model class, model env var, api key env var)
+# Provider packages are heavy to import, so only the configured one is loaded
+LLM_PROVIDERS = {
+    "openai": ("langchain_openai", "ChatOpenAI", "OPENAI_LLM_MODEL", "OPENAI_API_KEY"),
+    "anthropic": (
+        "langchain_anthropic",
+        "ChatAnthropic",
+        "ANTHROPIC_LLM_MODEL",
+        "ANTHROPIC_API_KEY",
+    ),
+    "google": (
+        "langchain_google_genai",
+        "ChatGoogleGenerativeAI",
+        "GOOGLE_LLM_MODEL",
+        "GOOGLE_API_KEY",
+    ),
+    "deepseek": (
+        "langchain_deepseek",
+        "ChatDeepSeek",
+        "DEEPSEEK_LLM_MODEL",
+        "DEEPSEEK_API_KEY",
+    ),
+    "mistral": (
+        "langchain_mistralai.chat_models",
+        "ChatMistralAI",
+        "MISTRAL_LLM_MODEL",
+        "MISTRAL_API_KEY",
+    ),
+}
 
 
 class LLM:
@@ -12,29 +38,10 @@ class LLM:
         self.llm = self._get_llm()
 
     def _get_llm(self):
-        if self.llm_provider == "openai":
-            llm = ChatOpenAI(
-                model=os.getenv("OPENAI_LLM_MODEL"), api_key=os.getenv("OPENAI_API_KEY")
-            )
-        elif self.llm_provider == "anthropic":
-            llm = ChatAnthropic(
-                model=os.getenv("ANTHROPIC_LLM_MODEL"),
-                api_key=os.getenv("ANTHROPIC_API_KEY"),
-            )
-        elif self.llm_provider == "google":
-            llm = ChatGoogleGenerativeAI(
-                model=os.getenv("GOOGLE_LLM_MODEL"), api_key=os.getenv("GOOGLE_API_KEY")
-            )
-        elif self.llm_provider == "deepseek":
-            llm = ChatDeepSeek(
-                model=os.getenv("DEEPSEEK_LLM_MODEL"),
-                api_key=os.getenv("DEEPSEEK_API_KEY"),
-            )
-        elif self.llm_provider == "mistral":
-            llm = ChatMistralAI(
-                model=os.getenv("MISTRAL_LLM_MODEL"),
-                api_key=os.getenv("MISTRAL_API_KEY"),
-            )
-        else:
+        if self.llm_provider not in LLM_PROVIDERS:
             raise ValueError("Invalid LLM provider")
-        return llm
+        module_name, class_name, model_env, api_key_env = LLM_PROVIDERS[
+            self.llm_provider
+        ]
+        chat_model = getattr(importlib.import_module(module_name), class_name)
+        return chat_model(model=os.getenv(model_env), api_key=os.getenv(api_key_env))
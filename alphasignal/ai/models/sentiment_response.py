@@ -24,3 +24,19 @@ class SentimentResponse(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+class TweetSentimentResult(BaseModel):
+    index: int = Field(description="The INDEX of the tweet these sentiments belong to.")
+    response: List[TokenSentiment] = Field(
+        description="A list of token sentiments for this tweet."
+    )
+
+    class Config:
+        use_enum_values = True
+
+
+class BatchSentimentResponse(BaseModel):
+    results: List[TweetSentimentResult] = Field(
+        description="One entry per tweet in the batch."
+    )
@@ -11,6 +11,21 @@ TOKENS: [{tokens}]
 FULL_TWEET_TEXT: {tweet_text}
 
 
+Schema for output:
+{parsing_model}
+""",
+)
+
+batch_tweet_classification_prompt = PromptTemplate(
+    input_variables=["tweets"],
+    template="""You are a helpful assistant that determines the sentiment of tweets towards Solana contract addresses or tickers.
+
+Several tweets follow, each with an INDEX, its TOKENS and its FULL_TWEET_TEXT. Judge every tweet on its own text only. For each $TICKER or contract address in a tweet's TOKENS, decide whether that tweet's sentiment toward the token is positive, negative, or neutral.
+
+{tweets}
+
+Return exactly one result per tweet, carrying the tweet's INDEX.
+
 Schema for output:
 {parsing_model}
 """,
@@ -1,6 +1,8 @@
+import asyncio
 import logging
-import requests
+from typing import Dict, List
 
+from alphasignal.apis.http_transport import get_http_transport
 from alphasignal.database.db import SQLiteDB
 from alphasignal.models.constants import USDC_MINT_ADDRESS
 
@@ -8,11 +10,14 @@ from alphasignal.models.constants import USDC_MINT_ADDRESS
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
-response = requests.get(
-    "https://api.dexscreener.com/token-pairs/v1/{chainId}/{tokenAddress}",
-    headers={},
-)
-data = response.json()
+# tokens/v1 accepts at most 30 comma separated addresses per request
+TOKEN_ADDRESSES_PER_REQUEST = 30
+
+
+class NoPairsFoundError(ValueError):
+    """Raised when Dexscreener lists no traded pair for a ticker."""
+
+    pass
 
 
 class DexscreenerClient:
@@ -23,66 +28,117 @@ class DexscreenerClient:
     def __init__(self):
         self.sql_db = SQLiteDB()
 
+    async def _fetch_pairs(self, token_addresses: List[str]) -> List[dict]:
+        url = f"{self.BASE_URL}/{self.CHAIN_ID}/{','.join(token_addresses)}"
+        response = await get_http_transport().get(url)
+        response.raise_for_status()
+        return response.json() or []
+
+    def _build_token_data(self, token_address: str, token_info: dict) -> dict:
+        token_data = self.sql_db.get_token_info(mint_address=token_address)
+        # Rows stored by the decimals cache have no metadata yet
+        if token_data is None or token_data.ticker is None:
+            if token_address == USDC_MINT_ADDRESS:
+                self.sql_db.add_token_info(
+                    token_address,
+                    "USD Coin",
+                    "USDC",
+                    "https://s2.coinmarketcap.com/static/img/coins/64x64/3408.png",
+                )
+            else:
+                result = {
+                    "image_url": token_info.get("info", {}).get("imageUrl"),
+                    "base_token_symbol": token_info.get("baseToken", {}).get("symbol"),
+                    "name": token_info.get("baseToken", {}).get("name"),
+                }
+                # Store data in database
+                self.sql_db.add_token_info(
+                    token_address,
+                    result["name"],
+                    result["base_token_symbol"],
+                    result["image_url"],
+                )
+            token_data = self.sql_db.get_token_info(mint_address=token_address)
+
+        price_change = token_info.get("priceChange", {})
+        return {
+            "mint_address": token_address,
+            "image": token_data.image,
+            "token_ticker": token_data.ticker,
+            "token_name": token_data.name,
+            "priceUsd": float(token_info.get("priceUsd", None)),
+            "h24": (
+                float(price_change.get("h24"))
+                if price_change.get("h24") is not None
+                else None
+            ),
+            "h6": (
+                float(price_change.get("h6"))
+                if price_change.get("h6") is not None
+                else None
+            ),
+            "h1": (
+                float(price_change.get("h1"))
+                if price_change.get("h1") is not None
+                else None
+            ),
+            "m5": (
+                float(price_change.get("m5"))
+                if price_change.get("m5") is not None
+                else None
+            ),
+        }
+
+    async def get_tokens_pairs(self, token_addresses: List[str]) -> Dict[str, dict]:
+        """
+        Fetches token data for many tokens through the batched tokens endpoint.
+
+        Addresses are split into chunks of 30 that are requested concurrently.
+
+        :param token_addresses: The token contract addresses
+        :return: Mapping of address to token data; tokens without pairs or whose
+            chunk failed are omitted
+        """
+        addresses = list(dict.fromkeys(token_addresses))
+        chunks = [
+            addresses[i : i + TOKEN_ADDRESSES_PER_REQUEST]
+            for i in range(0, len(addresses), TOKEN_ADDRESSES_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(
+            *(self._fetch_pairs(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        # The first pair listing a token as its base carries its price and metadata
+        pairs_by_address: Dict[str, dict] = {}
+        for chunk, pairs in zip(chunks, responses):
+            if isinstance(pairs, Exception):
+                logger.error(f"Error fetching token data for {chunk}: {pairs}")
+                continue
+            for pair in pairs:
+                base = pair.get("baseToken", {}).get("address")
+                pairs_by_address.setdefault(base, pair)
+
+        results = {}
+        for address in addresses:
+            pair = pairs_by_address.get(address)
+            if pair is None:
+                continue
+            try:
+                results[address] = self._build_token_data(address, pair)
+            except Exception as e:
+                logger.error(f"Error building token data for {address}: {e}")
+        return results
+
     async def get_token_pairs(self, token_address: str):
         """
         Fetches token pair data from the Dexscreener API.
 
-        :param chain_id: The blockchain chain ID
         :param token_address: The token contract address
-        :return: JSON response with token pair details or None if request fails
+        :return: JSON response with token pair details
         """
-        url = f"{self.BASE_URL}/{self.CHAIN_ID}/{token_address}"
-
         try:
-            token_data = self.sql_db.get_token_info(mint_address=token_address)
-            response = requests.get(url, headers={})
-            data = response.json()
-            token_info = data[0]
-            if token_data is None:
-                if token_address == USDC_MINT_ADDRESS:
-                    self.sql_db.add_token_info(
-                        token_address,
-                        "USD Coin",
-                        "USDC",
-                        "https://s2.coinmarketcap.com/static/img/coins/64x64/3408.png",
-                    )
-                else:
-                    result = {
-                        "image_url": token_info.get("info", {}).get("imageUrl"),
-                        "base_token_symbol": token_info.get("baseToken", {}).get(
-                            "symbol"
-                        ),
-                        "name": token_info.get("baseToken", {}).get("name"),
-                    }
-                    # Store data in database
-                    self.sql_db.add_token_info(
-                        token_address,
-                        result["name"],
-                        result["base_token_symbol"],
-                        result["image_url"],
-                    )
-                token_data = self.sql_db.get_token_info(mint_address=token_address)
-
-            result = {
-                "mint_address": token_address,
-                "image": token_data.image,
-                "token_ticker": token_data.ticker,
-                "token_name": token_data.name,
-                "priceUsd": float(token_info.get("priceUsd", None)),
-                "h24": float(token_info.get("priceChange", {}).get("h24"))
-                if token_info.get("priceChange", {}).get("h24") is not None
-                else None,
-                "h6": float(token_info.get("priceChange", {}).get("h6"))
-                if token_info.get("priceChange", {}).get("h6") is not None
-                else None,
-                "h1": float(token_info.get("priceChange", {}).get("h1"))
-                if token_info.get("priceChange", {}).get("h1") is not None
-                else None,
-                "m5": float(token_info.get("priceChange", {}).get("m5"))
-                if token_info.get("priceChange", {}).get("m5") is not None
-                else None,
-            }
-            return result
+            pairs = await self._fetch_pairs([token_address])
+            return self._build_token_data(token_address, pairs[0])
         except Exception as e:
             logging.error(f"Error fetching token data: {e}")
             raise Exception(f"Error fetching data: {e}")
@@ -92,13 +148,15 @@ class DexscreenerClient:
         Searches DexScreener for all pairs matching `ticker` and returns
         the mint/contract address of the token (base or quote) with the
         highest 24-hour volume.
+
+        Raises NoPairsFoundError if no pair with volume matches the ticker.
         """
         if "$" in ticker:
             raise ValueError("Ticker symbol should not contain '$'")
 
         # 1) Call the DexScreener search endpoint
         url = f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
-        response = requests.get(url)
+        response = await get_http_transport().get(url)
         response.raise_for_status()  # Raise an error if request failed
 
         # Parse the JSON response
@@ -116,7 +174,7 @@ class DexscreenerClient:
                 matching_pairs.append(pair)
 
         if not matching_pairs:
-            raise ValueError(f"No pairs found for ticker: {ticker}")
+            raise NoPairsFoundError(f"No pairs found for ticker: {ticker}")
 
         # 3) Find the pair with the highest 24-hour volume
         top_pair = None
@@ -130,7 +188,9 @@ class DexscreenerClient:
                 top_pair = pair
 
         if not top_pair:
-            raise ValueError(f"No valid pair with volume found for ticker: {ticker}")
+            raise NoPairsFoundError(
+                f"No valid pair with volume found for ticker: {ticker}"
+            )
 
         # 4) Retrieve the mint address from whichever side matches the ticker
         base_token_info = top_pair.get("baseToken", {})
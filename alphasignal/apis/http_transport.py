@@ -0,0 +1,128 @@
+import asyncio
+import os
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+
+class HttpTransport:
+    """
+    Shared async HTTP transport for the external REST APIs (Jupiter, Dexscreener).
+
+    Keeps one pooled keep-alive client per host so every host gets its own
+    connection limit, and negotiates HTTP/2 where the server supports it.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections_per_host: Optional[int] = None,
+        max_keepalive_per_host: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ):
+        self.timeout = httpx.Timeout(
+            timeout or float(os.getenv("HTTP_TIMEOUT_SECONDS", "10")), connect=5.0
+        )
+        max_connections = max_connections_per_host or int(
+            os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20")
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_per_host or max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2, limits=self.limits, timeout=self.timeout
+            )
+            self._clients[origin] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self._client_for(url).request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing HTTP client: {e}")
+
+
+def retire_on_loop(
+    close: Callable[[], Awaitable[None]],
+    loop: Optional[asyncio.AbstractEventLoop],
+    name: str,
+) -> None:
+    """
+    Closes a pooled client that was replaced because it belongs to another loop.
+
+    Its connections can only be closed on the loop that opened them. If that
+    loop is still running the close is scheduled there, otherwise the
+    connections are dropped with the loop and the replacement is logged.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+
+        def report(future) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                logger.error(f"Error closing replaced {name}: {future.exception()}")
+
+        asyncio.run_coroutine_threadsafe(close(), loop).add_done_callback(report)
+    else:
+        logger.warning(
+            f"Replaced the {name} of a stopped event loop, its connections were dropped"
+        )
+
+
+_transport: Optional[HttpTransport] = None
+_transport_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_transport() -> HttpTransport:
+    """
+    Return the process wide transport, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    transport is created if this is called from a different loop and the old
+    one is closed on its own loop.
+    """
+    global _transport, _transport_loop
+    loop = asyncio.get_running_loop()
+    if _transport is None or _transport_loop is not loop:
+        if _transport is not None:
+            retire_on_loop(_transport.aclose, _transport_loop, "HTTP transport")
+        _transport = HttpTransport()
+        _transport_loop = loop
+    return _transport
+
+
+async def close_http_transport() -> None:
+    """Close the pooled connections of the process wide transport."""
+    global _transport, _transport_loop
+    transport = _transport
+    _transport = None
+    _transport_loop = None
+    if transport is not None:
+        await transport.aclose()
@@ -1,31 +1,67 @@
 import asyncio
 import os
-import requests
 import json
 import os
 import base64
 import logging
+import time
+from typing import Dict, Iterable, List, Optional
 from solana.rpc.commitment import Processed
 from solana.rpc.types import TxOpts
 from solders.transaction import VersionedTransaction
 from solders import message
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from alphasignal.apis.solana.solana_client import SolanaClient
-from alphasignal.models.constants import SOL_MINT_ADDRESS, USDC_MINT_ADDRESS
+from alphasignal.apis.http_transport import get_http_transport
+from alphasignal.apis.solana.solana_client import get_solana_client
+from alphasignal.models.constants import USDC_MINT_ADDRESS
+from alphasignal.models.swap_fill import SwapFill
 from alphasignal.schemas.responses.quote_response import QuoteResponse
 from alphasignal.models.wallet import Wallet
+from alphasignal.services.signature_confirmer import (
+    TransactionFailedError,
+    get_signature_confirmer,
+)
 from alphasignal.services.token_manager import TokenManager
-from alphasignal.services.wallet_manager import WalletManager
+from alphasignal.services.tx_prefetcher import get_tx_prefetcher
+from alphasignal.services.wallet_snapshot_cache import get_wallet_snapshot_cache
+from alphasignal.utils.swap_fill import swap_fill_from_meta
 
 logger = logging.getLogger(__name__)
 
 logger.setLevel(logging.INFO)
 
 
+# The price endpoint accepts at most 100 comma separated ids per request
+PRICE_IDS_PER_REQUEST = 100
+
+
+class SwapNotSettledError(Exception):
+    """
+    Raised when a swap was sent but its outcome is unknown.
+
+    The transaction may still land, so callers must settle the signature
+    before sending the swap again.
+    """
+
+    def __init__(self, signature: str, last_valid_block_height, message: str):
+        super().__init__(message)
+        self.signature = signature
+        self.last_valid_block_height = last_valid_block_height
+
+
 class JupiterClient:
     def __init__(self):
         self.jupiter_api_url = os.getenv("JUPITER_API_URL")
+        self.jupiter_price_api_url = os.getenv(
+            "JUPITER_PRICE_API_URL", "https://api.jup.ag/price/v2"
+        )
+        self.swap_settle_timeout = float(
+            os.getenv("SWAP_SETTLE_TIMEOUT_SECONDS", "120")
+        )
+        self.swap_settle_interval = float(
+            os.getenv("SIGNATURE_POLL_INTERVAL_SECONDS", "2")
+        )
 
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -74,7 +110,7 @@ class JupiterClient:
             "swapMode": swap_mode,
         }
 
-        response = requests.get(url, params=params)
+        response = await get_http_transport().get(url, params=params)
 
         if response.status_code != 200:
             raise Exception(f"Error fetching quotes: {response.text}")
@@ -104,13 +140,90 @@ class JupiterClient:
         decimals = await token_manager.get_token_decimals()
         input_amount_smallest_units = int(1 * (10**decimals))
         url = f"{self.jupiter_api_url}/quote?inputMint={token_mint_address}&outputMint={USDC_MINT_ADDRESS}&amount={input_amount_smallest_units}"  # Need to integrate with the decimal of the coin
-        response = requests.get(url)
+        response = await get_http_transport().get(url)
         if response.status_code == 200:
             data = response.json()
             price = float(data["swapUsdValue"])
             return price
         raise Exception(f"Unable to fetch price for mint address: {token_mint_address}")
 
+    @retry(
+        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def _fetch_price_chunk(self, mints: List[str]) -> Dict[str, float]:
+        """
+        Fetch USD prices for up to PRICE_IDS_PER_REQUEST mints in a single request.
+
+        Args:
+            mints (List[str]): The mint addresses to price.
+
+        Returns:
+            Dict[str, float]: Prices for the mints Jupiter returned a value for.
+        """
+        response = await get_http_transport().get(
+            self.jupiter_price_api_url, params={"ids": ",".join(mints)}
+        )
+        if response.status_code != 200:
+            raise Exception(f"Error fetching prices: {response.text}")
+
+        prices = {}
+        for mint, data in (response.json().get("data") or {}).items():
+            if data and data.get("price") is not None:
+                prices[mint] = float(data["price"])
+        return prices
+
+    async def fetch_token_values(
+        self, mints: Iterable[str], fallback: bool = True
+    ) -> Dict[str, float]:
+        """
+        Fetch the current USD value of many tokens with as few requests as possible.
+
+        Mints are deduplicated and priced through the batched price endpoint. Any
+        mint the price endpoint does not know about falls back to a single quote.
+        Mints that cannot be priced at all are left out of the result.
+
+        Args:
+            mints (Iterable[str]): The mint addresses of the tokens.
+            fallback (bool): Quote mints missing from the batch individually (default: True).
+
+        Returns:
+            Dict[str, float]: A mapping of mint address to USD price.
+        """
+        unique_mints = list(dict.fromkeys(m for m in mints if m))
+        prices = {}
+        if USDC_MINT_ADDRESS in unique_mints:
+            prices[USDC_MINT_ADDRESS] = float(1.0000)
+
+        to_fetch = [m for m in unique_mints if m not in prices]
+        chunks = [
+            to_fetch[i : i + PRICE_IDS_PER_REQUEST]
+            for i in range(0, len(to_fetch), PRICE_IDS_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_price_chunk(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Batched price fetch failed for {len(chunk)} mints: {result}"
+                )
+                continue
+            prices.update(result)
+
+        missing = [m for m in to_fetch if m not in prices]
+        if fallback and missing:
+            results = await asyncio.gather(
+                *(self.fetch_token_value(m) for m in missing), return_exceptions=True
+            )
+            for mint, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Unable to fetch price for {mint}: {result}")
+                    continue
+                prices[mint] = result
+
+        return prices
+
     async def create_quote(
         self,
         from_token_mint,
@@ -123,6 +236,9 @@ class JupiterClient:
         except:
             raise Exception("amount must be float or int")
 
+        # Resolve both mints' decimals in one lookup before quoting
+        await TokenManager.get_decimals([from_token_mint, to_token_mint])
+
         quote = await self.fetch_swap_quote(
             from_token_mint,
             to_token_mint,
@@ -171,7 +287,8 @@ class JupiterClient:
         input_amount,
         wallet_manager,
         slippage_bps=50,
-    ):
+        quote=None,
+    ) -> SwapFill:
         """
         Perform a token swap using Jupiter Aggregator API, dynamically handling decimals.
 
@@ -180,45 +297,112 @@ class JupiterClient:
             to_token_mint (str): Mint address of the token to swap to.
             input_amount (float): The input amount in token units (e.g., 1.0 USDC).
             slippage_bps (int): Slippage tolerance in basis points (default: 50 bps = 0.5%).
+            quote (dict): A quote fetched ahead of time, a new one is fetched if omitted.
 
         Returns:
-            amount: The amount of coin we got from the swap
+            SwapFill: The amounts the confirmed swap actually moved
         """
         try:
-            quote = await self.fetch_swap_quote(
-                from_token_mint, to_token_mint, input_amount, slippage_bps
-            )
-            # Get initial balance
-            if to_token_mint != SOL_MINT_ADDRESS:
-                initial_balance = await wallet_manager.get_token_acct_value(
-                    to_token_mint
+            if quote is None:
+                quote = await self.fetch_swap_quote(
+                    from_token_mint, to_token_mint, input_amount, slippage_bps
                 )
             # execute transaction
-            transaction_signature = await self.execute_swap(
+            transaction_signature, last_valid_block_height = await self.execute_swap(
                 quote, wallet_manager.wallet
             )
-            # Retry to get final balance if initial and final are equal -> solana takes a moment to update
-            if to_token_mint != SOL_MINT_ADDRESS:
-                num_retries = 5
-                for retry in range(num_retries):
-                    final_balance = await wallet_manager.get_token_acct_value(
-                        to_token_mint
-                    )
-                    if final_balance != initial_balance:
-                        break
-                    else:
-                        if retry == num_retries:
-                            raise Exception("Failed to get final balance")
-                        else:
-                            await asyncio.sleep(2)
-                new_token_amount = final_balance - initial_balance
-                return new_token_amount
-            else:
-                return None
-
         except ValueError as e:
             raise Exception(f"Error: {e}")
 
+        signature = str(transaction_signature)
+        try:
+            # Wait for the swap to land instead of polling the wallet
+            await get_signature_confirmer().confirm(signature)
+            return await self._fetch_fill(
+                signature, wallet_manager, from_token_mint, to_token_mint
+            )
+        except TransactionFailedError:
+            # The swap landed with an error and moved nothing, retrying is safe
+            raise
+        except Exception as e:
+            raise SwapNotSettledError(
+                signature,
+                last_valid_block_height,
+                f"Swap {signature} was sent but not settled: {e}",
+            ) from e
+
+    async def _fetch_fill(
+        self, signature: str, wallet_manager, from_token_mint, to_token_mint
+    ) -> SwapFill:
+        # The fill comes from this transaction alone, so concurrent swaps of
+        # the same mint do not affect it
+        meta = await get_solana_client().get_transaction_meta(signature)
+        return swap_fill_from_meta(
+            signature,
+            meta,
+            str(wallet_manager.wallet.public_key),
+            from_token_mint,
+            to_token_mint,
+        )
+
+    async def settle_swap(
+        self,
+        error: SwapNotSettledError,
+        wallet_manager,
+        from_token_mint,
+        to_token_mint,
+    ) -> Optional[SwapFill]:
+        """
+        Finds out what happened to a swap that was sent but not settled.
+
+        Args:
+            error (SwapNotSettledError): The error swap_tokens raised for the swap.
+            from_token_mint (str): Mint address of the token swapped from.
+            to_token_mint (str): Mint address of the token swapped to.
+
+        Returns:
+            SwapFill: The fill if the swap landed, None if it failed or expired
+            without landing, in which case it can be sent again.
+
+        Raises:
+            SwapNotSettledError: if the outcome is still unknown after the
+            settle timeout.
+        """
+        solana_client = get_solana_client()
+        confirmer = get_signature_confirmer()
+        deadline = time.monotonic() + self.swap_settle_timeout
+        while True:
+            try:
+                status = (
+                    await solana_client.get_signature_statuses([error.signature])
+                )[0]
+                if status is not None:
+                    if status.err is not None:
+                        return None
+                    if confirmer.is_confirmed(status):
+                        return await self._fetch_fill(
+                            error.signature,
+                            wallet_manager,
+                            from_token_mint,
+                            to_token_mint,
+                        )
+                elif (
+                    error.last_valid_block_height is not None
+                    and await solana_client.get_block_height()
+                    > error.last_valid_block_height
+                ):
+                    # The blockhash expired, the transaction can no longer land
+                    return None
+            except Exception as e:
+                logger.error(f"Error settling swap {error.signature}: {e}")
+            if time.monotonic() >= deadline:
+                raise SwapNotSettledError(
+                    error.signature,
+                    error.last_valid_block_height,
+                    f"Swap {error.signature} is still not settled",
+                )
+            await asyncio.sleep(self.swap_settle_interval)
+
     async def execute_swap(
         self,
         quote,
@@ -232,7 +416,8 @@ class JupiterClient:
             wallet (Keypair): Wallet Keypair object for signing the transaction.
 
         Returns:
-            str: The transaction signature.
+            tuple: The transaction signature and the last block height at which
+            the transaction can still land.
         """
         swap_url = f"{self.jupiter_api_url}/swap"
         payload = {
@@ -240,9 +425,14 @@ class JupiterClient:
             "userPublicKey": str(wallet.public_key),  # Ensure pubkey is a string
             "wrapAndUnwrapSol": True,
         }
+        # Bid what recent slots paid so the swap is not stuck behind other traffic,
+        # a zero estimate leaves the compute unit price to Jupiter
+        priority_fee = get_tx_prefetcher().get_priority_fee()
+        if priority_fee:
+            payload["computeUnitPriceMicroLamports"] = priority_fee
 
         try:
-            response = requests.post(
+            response = await get_http_transport().post(
                 swap_url, json=payload, headers={"Content-Type": "application/json"}
             )
             if response.status_code != 200:
@@ -253,8 +443,6 @@ class JupiterClient:
             if not swap_transaction:
                 raise RuntimeError("No swapTransaction provided by the /swap endpoint.")
 
-            client = SolanaClient().client
-
             raw_transaction = VersionedTransaction.from_bytes(
                 base64.b64decode(swap_transaction)
             )
@@ -266,10 +454,12 @@ class JupiterClient:
             )
 
             opts = TxOpts(skip_preflight=False, preflight_commitment=Processed)
-            result = client.send_raw_transaction(txn=bytes(signed_txn), opts=opts)
-
-            txn_signature = result.value
+            txn_signature = await get_solana_client().send_raw_transaction(
+                bytes(signed_txn), opts
+            )
+            # Balances are about to change, the next read must hit the chain
+            get_wallet_snapshot_cache().invalidate(wallet)
 
-            return txn_signature
+            return txn_signature, swap_data.get("lastValidBlockHeight")
         except Exception as e:
             raise Exception(f"Error swapping tokens: {e}")
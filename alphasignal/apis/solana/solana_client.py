@@ -1,11 +1,18 @@
+import asyncio
 import os
+from typing import Dict, List, Optional
 import base58
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.api import Client
-from tenacity import retry, stop_after_attempt, wait_exponential
+from solana.rpc.commitment import Confirmed, Processed
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_fixed
+from alphasignal.apis.http_transport import get_http_transport, retire_on_loop
 from alphasignal.models.wallet import Wallet
-from solana.rpc.types import TokenAccountOpts
+from solana.rpc.types import TokenAccountOpts, TxOpts
+from solders.account import Account
+from solders.hash import Hash
 from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction_status import TransactionStatus, UiTransactionStatusMeta
 from solders.transaction import Transaction
 from solders.system_program import transfer, TransferParams
 from solders.keypair import Keypair
@@ -18,58 +25,107 @@ import logging
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+# getMultipleAccounts accepts at most 100 accounts per request
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# getSignatureStatuses accepts at most 256 signatures per request
+MAX_SIGNATURE_STATUSES = 256
+
+TOKEN_PROGRAM_IDS = [
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+    "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",
+]
+
 
 class SolanaClient:
     def __init__(self):
         self.solana_cluster_url = os.getenv("SOLANA_CLUSTER_URL")
-        self.client = Client(self.solana_cluster_url)
+        self.solana_ws_url = os.getenv("SOLANA_WS_URL") or self._default_ws_url()
+        # One pooled async RPC client for the lifetime of this SolanaClient
+        self.client = AsyncClient(self.solana_cluster_url)
+
+    def _default_ws_url(self) -> Optional[str]:
+        # RPC nodes serve the websocket API on the same host
+        if not self.solana_cluster_url:
+            return None
+        return self.solana_cluster_url.replace("https://", "wss://", 1).replace(
+            "http://", "ws://", 1
+        )
+
+    async def close(self) -> None:
+        await self.client.close()
 
     @retry(stop=stop_after_attempt(3))
     async def get_acc_info(self, token: MintToken):
-        async with AsyncClient(self.solana_cluster_url) as async_client:
-            try:
-                response = await async_client.get_account_info(token.token_mint_pubkey)
-                account_info = response.value
-
-                if account_info is None:
-                    raise Exception(
-                        f"Invalid or non-existent mint address: {token.token_mint_address}"
-                    )
-                return account_info
+        try:
+            response = await self.client.get_account_info(token.token_mint_pubkey)
+            account_info = response.value
 
-            except Exception as e:
+            if account_info is None:
                 raise Exception(
-                    f"Error fetching decimals for mint address {token.token_mint_address}: {e}"
+                    f"Invalid or non-existent mint address: {token.token_mint_address}"
                 )
+            return account_info
+
+        except Exception as e:
+            raise Exception(
+                f"Error fetching decimals for mint address {token.token_mint_address}: {e}"
+            )
+
+    @retry(stop=stop_after_attempt(3))
+    async def get_multiple_acc_info(
+        self, pubkeys: List[Pubkey]
+    ) -> List[Optional[Account]]:
+        """
+        Fetch many accounts through getMultipleAccounts.
+
+        Args:
+            pubkeys (List[Pubkey]): The accounts to fetch.
+
+        Returns:
+            List[Optional[Account]]: The accounts in request order, None for missing ones.
+        """
+        try:
+            responses = await asyncio.gather(
+                *(
+                    self.client.get_multiple_accounts(
+                        pubkeys[i : i + MAX_MULTIPLE_ACCOUNTS]
+                    )
+                    for i in range(0, len(pubkeys), MAX_MULTIPLE_ACCOUNTS)
+                )
+            )
+            return [account for response in responses for account in response.value]
+        except Exception as e:
+            raise Exception(f"Error fetching {len(pubkeys)} accounts: {e}")
 
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=15, min=15, max=60)
     )
-    def get_owner_token_accounts(self, wallet: Wallet):
-        program_ids = [
-            "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
-            "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",
-        ]
+    async def get_owner_token_accounts(self, wallet: Wallet):
         try:
-            combined_accounts = []
-            for pid in program_ids:
-                opts = TokenAccountOpts(program_id=Pubkey.from_string(pid))
-                resp = self.client.get_token_accounts_by_owner_json_parsed(
-                    wallet.public_key, opts
+            # Both token programs are queried at the same time
+            responses = await asyncio.gather(
+                *(
+                    self.client.get_token_accounts_by_owner_json_parsed(
+                        wallet.public_key,
+                        TokenAccountOpts(program_id=Pubkey.from_string(pid)),
+                        # Confirmed swaps must show up in the next read
+                        commitment=Confirmed,
+                    )
+                    for pid in TOKEN_PROGRAM_IDS
                 )
-                # resp.value holds the list of accounts
-                combined_accounts.extend(resp.value)
-
-            return combined_accounts
+            )
+            # resp.value holds the list of accounts
+            return [account for resp in responses for account in resp.value]
         except Exception as e:
             raise Exception(
                 f"Error fetching token accounts for {wallet.public_key}: {e}"
             )
 
-    @retry(stop=stop_after_attempt(3), sleep=10)
-    def get_sol_balance(self, wallet: Wallet):
+    @retry(stop=stop_after_attempt(3), wait=wait_fixed(10))
+    async def get_sol_balance(self, wallet: Wallet):
         try:
-            response = self.client.get_balance(wallet.public_key)
+            response = await self.client.get_balance(wallet.public_key)
             # Access the 'value' field properly based on the response structure
             sol_balance = response.value / 10**9  # Convert lamports to SOL
             return sol_balance
@@ -78,6 +134,95 @@ class SolanaClient:
                 f"Error fetching SOL balance for wallet {wallet.public_key}: {e}"
             )
 
+    async def get_latest_blockhash(self) -> Hash:
+        response = await self.client.get_latest_blockhash()
+        if not response.value:
+            raise Exception("Failed to fetch the latest blockhash")
+        return response.value.blockhash
+
+    async def get_recent_prioritization_fees(
+        self, accounts: Optional[List[str]] = None
+    ) -> Dict[int, int]:
+        """
+        Fetch the prioritization fees paid in recent slots.
+
+        solana-py has no wrapper for getRecentPrioritizationFees, so the JSON-RPC
+        request is sent through the shared HTTP transport.
+
+        Args:
+            accounts (List[str]): Writable accounts the fees should be relevant to.
+
+        Returns:
+            Dict[int, int]: slot -> minimum fee paid in micro-lamports per compute unit.
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getRecentPrioritizationFees",
+            "params": [accounts] if accounts else [],
+        }
+        response = await get_http_transport().post(
+            self.solana_cluster_url, json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
+        if "error" in data:
+            raise Exception(f"Error fetching prioritization fees: {data['error']}")
+        return {entry["slot"]: entry["prioritizationFee"] for entry in data["result"]}
+
+    async def get_signature_statuses(
+        self, signatures: List[str]
+    ) -> List[Optional[TransactionStatus]]:
+        """
+        Fetch the status of many transactions through getSignatureStatuses.
+
+        Args:
+            signatures (List[str]): The transaction signatures.
+
+        Returns:
+            List[Optional[TransactionStatus]]: Statuses in request order, None for unknown ones.
+        """
+        sigs = [Signature.from_string(signature) for signature in signatures]
+        responses = await asyncio.gather(
+            *(
+                self.client.get_signature_statuses(sigs[i : i + MAX_SIGNATURE_STATUSES])
+                for i in range(0, len(sigs), MAX_SIGNATURE_STATUSES)
+            )
+        )
+        return [status for response in responses for status in response.value]
+
+    async def get_block_height(self) -> int:
+        response = await self.client.get_block_height(Confirmed)
+        return response.value
+
+    @retry(stop=stop_after_attempt(5), wait=wait_fixed(1))
+    async def get_transaction_meta(self, signature: str) -> UiTransactionStatusMeta:
+        """
+        Fetch the status metadata (fee, pre/post balances) of a confirmed transaction.
+
+        Nodes may serve a just-confirmed transaction a moment later, so a missing
+        transaction is retried.
+        """
+        response = await self.client.get_transaction(
+            Signature.from_string(signature),
+            commitment=Confirmed,
+            max_supported_transaction_version=0,
+        )
+        if response.value is None or response.value.transaction.meta is None:
+            raise Exception(f"Transaction {signature} not found")
+        return response.value.transaction.meta
+
+    async def send_raw_transaction(self, txn: bytes, opts: Optional[TxOpts] = None):
+        """
+        Send a signed, serialized transaction.
+
+        Returns:
+            Signature: The transaction signature.
+        """
+        opts = opts or TxOpts(skip_preflight=False, preflight_commitment=Processed)
+        response = await self.client.send_raw_transaction(txn=txn, opts=opts)
+        return response.value
+
     @retry(stop=stop_after_attempt(3))
     async def fund_wallet(
         self, recipient_pubkey: Pubkey, amount: float, from_private_key: str
@@ -93,14 +238,13 @@ class SolanaClient:
             str: Transaction signature.
         """
         try:
-            # Create client and sender's keypair
-            client = AsyncClient(self.solana_cluster_url)
+            # Sender's keypair
             secret_key = base58.b58decode(from_private_key)
             sender_keypair = Keypair.from_seed(secret_key)
             sender_pubkey = sender_keypair.pubkey()
 
-            min_balance_result = await client.get_minimum_balance_for_rent_exemption(
-                0
+            min_balance_result = (
+                await self.client.get_minimum_balance_for_rent_exemption(0)
             )  # 0 bytes for default account
             if min_balance_result.value is None:
                 raise Exception("Failed to fetch minimum balance for rent exemption")
@@ -113,11 +257,10 @@ class SolanaClient:
                     f"The transfer amount must be at least {min_balance_for_rent / 1e9} SOL to cover rent exemption"
                 )
 
-            # Get recent blockhash
-            recent_blockhash_result = await client.get_latest_blockhash()
-            if not recent_blockhash_result.value:
-                raise Exception("Failed to fetch the latest blockhash")
-            recent_blockhash = recent_blockhash_result.value.blockhash
+            # Get recent blockhash, usually already prefetched
+            from alphasignal.services.tx_prefetcher import get_tx_prefetcher
+
+            recent_blockhash = await get_tx_prefetcher().get_blockhash()
 
             # Create a transfer instruction
             transfer_instruction = transfer(
@@ -141,10 +284,41 @@ class SolanaClient:
             )
 
             # Send the transaction
-            response = await client.send_transaction(transaction)
-            await client.close()
+            response = await self.client.send_transaction(transaction)
 
             # Return transaction signature
             return str(recipient_pubkey), amount
         except Exception as e:
             return f"An error occurred: {str(e)}"
+
+
+_solana_client: Optional[SolanaClient] = None
+_solana_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_solana_client() -> SolanaClient:
+    """
+    Return the process wide SolanaClient, creating it on first use.
+
+    The pooled RPC connections belong to the event loop that opened them, so a
+    new client is created if this is called from a different loop and the old
+    one is closed on its own loop.
+    """
+    global _solana_client, _solana_client_loop
+    loop = asyncio.get_running_loop()
+    if _solana_client is None or _solana_client_loop is not loop:
+        if _solana_client is not None:
+            retire_on_loop(_solana_client.close, _solana_client_loop, "Solana client")
+        _solana_client = SolanaClient()
+        _solana_client_loop = loop
+    return _solana_client
+
+
+async def close_solana_client() -> None:
+    """Close the pooled connections of the process wide SolanaClient."""
+    global _solana_client, _solana_client_loop
+    client = _solana_client
+    _solana_client = None
+    _solana_client_loop = None
+    if client is not None:
+        await client.close()
@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -8,8 +9,18 @@ from alphasignal.routers.orders_router import router as order_router
 from alphasignal.routers.config_router import router as config_router
 from alphasignal.routers.profile_router import router as profile_router
 from alphasignal.routers.webhook_router import router as webhook_router
+from alphasignal.routers.stats_router import router as stats_router
 
+from alphasignal.apis.http_transport import close_http_transport
+from alphasignal.apis.solana.solana_client import close_solana_client
+from alphasignal.database.connection import connection_manager
+from alphasignal.services.price_engine import get_price_engine
+from alphasignal.services.profile_manager import ProfileManager
 from alphasignal.services.service import initialize_database
+from alphasignal.services.signal_queue import SignalQueue
+from alphasignal.services.signature_confirmer import get_signature_confirmer
+from alphasignal.services.tx_prefetcher import get_tx_prefetcher
+from alphasignal.services.twitter_monitor import TwitterMonitor
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -22,7 +33,33 @@ origins = ["http://localhost", "http://localhost:8000", "http://localhost:6969"]
 
 load_dotenv()
 
-app = FastAPI(docs_url="/api/docs")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing touches the database, wallet or network until the app starts
+    initialize_database()
+    app.state.profile_manager = ProfileManager()
+    app.state.twitter_monitor = TwitterMonitor()
+    app.state.signal_queue = SignalQueue(
+        app.state.twitter_monitor.process_tweet_webhook
+    )
+    app.state.signal_queue.start()
+    price_engine = get_price_engine()
+    price_engine.start()
+    tx_prefetcher = get_tx_prefetcher()
+    tx_prefetcher.start()
+    yield
+    await app.state.signal_queue.stop()
+    await price_engine.stop()
+    await tx_prefetcher.stop()
+    await get_signature_confirmer().close()
+    # Release pooled connections held by the shared clients
+    await close_http_transport()
+    await close_solana_client()
+    connection_manager.close_thread_connections()
+
+
+app = FastAPI(docs_url="/api/docs", lifespan=lifespan)
 
 
 @app.exception_handler(Exception)
@@ -46,6 +83,7 @@ app.include_router(order_router, tags=["Orders"])
 app.include_router(config_router, tags=["Configurations"])
 app.include_router(profile_router, tags=["Profiles"])
 app.include_router(webhook_router, tags=["Webhooks"])
+app.include_router(stats_router, tags=["Stats"])
 
 app.add_middleware(
     CORSMiddleware,
@@ -57,5 +95,4 @@ app.add_middleware(
 
 if __name__ == "__main__":
     # Use Uvicorn to run the application
-    initialize_database()
     uvicorn.run("alphasignal.app:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,64 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+
+class ConnectionManager:
+    """
+    Hands out one configured SQLite connection per database file per thread.
+
+    Every SQLiteDB in a thread shares that connection, so the event loop thread
+    holds a single connection and FastAPI threadpool workers each get their own
+    (sqlite3 connections must not be shared across threads). Connections run in
+    WAL mode with a busy timeout so the API and the order processor can read and
+    write concurrently instead of failing with "database is locked".
+    """
+
+    def __init__(
+        self,
+        busy_timeout_ms: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+    ):
+        self.busy_timeout_ms = busy_timeout_ms or int(
+            os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")
+        )
+        self.mmap_size = mmap_size or int(
+            os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))
+        )
+        self._local = threading.local()
+
+    def _connections(self) -> Dict[str, sqlite3.Connection]:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        return connections
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(db_path, timeout=self.busy_timeout_ms / 1000)
+        connection.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms};")
+        connection.execute("PRAGMA journal_mode = WAL;")
+        connection.execute("PRAGMA synchronous = NORMAL;")
+        connection.execute(f"PRAGMA mmap_size = {self.mmap_size};")
+        return connection
+
+    def get_connection(self, db_path: str) -> sqlite3.Connection:
+        """Returns this thread's connection to `db_path`, opening it on first use."""
+        connections = self._connections()
+        connection = connections.get(db_path)
+        if connection is None:
+            connection = connections[db_path] = self._connect(db_path)
+        return connection
+
+    def close_thread_connections(self) -> None:
+        """Closes the connections opened by the calling thread."""
+        connections = self._connections()
+        while connections:
+            _, connection = connections.popitem()
+            try:
+                connection.close()
+            except sqlite3.Error as e:
+                print(f"SQLite error: {e}")
+
+
+connection_manager = ConnectionManager()
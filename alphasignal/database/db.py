@@ -1,8 +1,11 @@
 import sqlite3
-from typing import List
+from typing import Dict, List, Optional, Tuple
+import time
 import uuid
 from datetime import datetime, timezone
 
+from alphasignal.database.connection import connection_manager
+from alphasignal.database.migrations import migrate
 from alphasignal.models.order import Order
 from alphasignal.models.constants import DB_PATH
 from alphasignal.models.enums import (
@@ -16,6 +19,7 @@ from alphasignal.models.enums import (
 from alphasignal.models.event import Event
 from alphasignal.models.tweet import Tweet
 from alphasignal.models.profile import Profile
+from alphasignal.models.ticker_resolution import TickerResolution
 from alphasignal.models.token_info import TokenInfo
 
 
@@ -25,95 +29,28 @@ class ProfileNotFoundError(Exception):
         self.profile_id = profile_id
 
 
+def _to_epoch(value: datetime) -> int:
+    return int(value.timestamp())
+
+
 class SQLiteDB:
-    def __init__(self):
-        self.connection = sqlite3.connect(DB_PATH)
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Resolved per call so an instance is safe to use from any thread
+        return connection_manager.get_connection(DB_PATH)
+
+    def get_data_version(self) -> int:
+        """
+        Returns SQLite's data_version for this connection. It changes whenever
+        another connection (or process) commits to the database.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA data_version;")
+        return cursor.fetchone()[0]
 
     def initialize_database(self) -> None:
-        cursor = self.connection.cursor()
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS tracked_orders (
-            id TEXT PRIMARY KEY,
-            mint_address TEXT NOT NULL,
-            last_price_max REAL,
-            sell_mode TEXT,
-            sell_value REAL,
-            sell_type TEXT,
-            time_added TEXT,
-            time_sold TEXT,
-            balance REAL, 
-            order_status INTEGER DEFAULT 0,
-            profit TEXT,
-            slippage REAL
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS token_info (
-            mint_address TEXT PRIMARY KEY,
-            name TEXT,
-            ticker TEXT,
-            image TEXT
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS profile (
-            id TEXT PRIMARY KEY,
-            platform TEXT,
-            username TEXT,
-            is_active BOOLEAN,
-            buy_type TEXT,
-            buy_amount_type TEXT,
-            buy_amount REAL,
-            buy_slippage REAL,
-            sell_mode TEXT,
-            sell_type TEXT,
-            sell_value REAL,
-            sell_slippage REAL,
-            is_visable BOOLEAN DEFAULT 1
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS tweets (
-            id TEXT PRIMARY KEY,
-            full_text TEXT,
-            is_retweet BOOLEAN,
-            is_reply BOOLEAN,
-            created_at DATETIME
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS telegrams (
-            id TEXT PRIMARY KEY,
-            telegram_user_id TEXT,
-            username TEXT,
-            chat_id TEXT,
-            full_text TEXT,
-            created_at DATETIME
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS events (
-            id TEXT PRIMARY KEY,
-            profile_id TEXT,
-            tweet_id TEXT,
-            telegram_id TEXT,
-            time_processed DATETIME,
-            FOREIGN KEY(profile_id) REFERENCES profile(id)
-            FOREIGN KEY(tweet_id) REFERENCES tweets(id)
-            FOREIGN KEY(telegram_id) REFERENCES telegrams(id)          
-        );
-        """)
-        cursor.executescript("""
-        CREATE TABLE IF NOT EXISTS extracted_tweets_data (
-            id TEXT PRIMARY KEY,
-            tweet_id TEXT,
-            tweet_type TEXT,
-            tokens TEXT,
-            token_sentiment TEXT,
-            FOREIGN KEY(tweet_id) REFERENCES tweets(id)
-        );
-        """)
-        self.connection.commit()
+        version = migrate(self.connection)
+        print(f"Database schema at version {version}.")
 
     def add_token_info(
         self,
@@ -172,6 +109,118 @@ class SQLiteDB:
             print(f"SQLite error: {e}")
         return None
 
+    def get_token_decimals(self, mint_addresses: List[str]) -> Dict[str, int]:
+        """Returns the cached decimals for the given mints that have them stored."""
+        if not mint_addresses:
+            return {}
+        try:
+            cursor = self.connection.cursor()
+            placeholders = ", ".join("?" for _ in mint_addresses)
+            cursor.execute(
+                f"""
+                SELECT mint_address, decimals
+                FROM token_info
+                WHERE decimals IS NOT NULL AND mint_address IN ({placeholders});
+            """,
+                list(mint_addresses),
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"SQLite error: {e}")
+        return {}
+
+    def add_token_decimals(self, decimals: Dict[str, int]) -> None:
+        """Stores the decimals for the given mints in a single transaction."""
+        if not decimals:
+            return
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO token_info (mint_address, decimals)
+                VALUES (?, ?)
+                ON CONFLICT(mint_address) DO UPDATE SET
+                    decimals=excluded.decimals;
+            """,
+                list(decimals.items()),
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"SQLite error: {e}")
+
+    def get_ticker_resolution(self, ticker: str) -> Optional[TickerResolution]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT ticker, mint_address, resolved_at, pinned
+            FROM ticker_resolutions
+            WHERE ticker = ?;
+            """,
+            (ticker,),
+        )
+        row = cursor.fetchone()
+        if row:
+            return TickerResolution(
+                ticker=row[0],
+                mint_address=row[1],
+                resolved_at=row[2],
+                pinned=bool(row[3]),
+            )
+        return None
+
+    def set_ticker_resolution(self, resolution: TickerResolution) -> None:
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                INSERT INTO ticker_resolutions (ticker, mint_address, resolved_at, pinned)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    mint_address = excluded.mint_address,
+                    resolved_at = excluded.resolved_at,
+                    pinned = excluded.pinned;
+                """,
+                (
+                    resolution.ticker,
+                    resolution.mint_address,
+                    int(resolution.resolved_at),
+                    int(resolution.pinned),
+                ),
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"SQLite error: {e}")
+
+    def delete_ticker_resolution(self, ticker: str) -> None:
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM ticker_resolutions WHERE ticker = ?;", (ticker,))
+        self.connection.commit()
+
+    def get_cached_sentiment(self, cache_key: str) -> Optional[Tuple[str, int]]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT response, created_at FROM sentiment_cache WHERE cache_key = ?;",
+            (cache_key,),
+        )
+        row = cursor.fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_cached_sentiment(
+        self, cache_key: str, response: str, created_at: int
+    ) -> None:
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO sentiment_cache (cache_key, response, created_at)
+                VALUES (?, ?, ?);
+                """,
+                (cache_key, response, created_at),
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"SQLite error: {e}")
+
     def create_order(
         self,
         mint_address: str,
@@ -181,17 +230,20 @@ class SQLiteDB:
         buy_in_value: float,
         balance: float,
         slippage: float,
+        buy_signature: Optional[str] = None,
+        buy_input_amount: Optional[float] = None,
     ) -> str:
         cursor = self.connection.cursor()
-        time_added = datetime.now(timezone.utc).isoformat()
+        time_added = int(time.time())
         order_id = str(uuid.uuid4())
         try:
             cursor.execute(
                 """
                 INSERT INTO tracked_orders (
                     id, mint_address, last_price_max, sell_mode, sell_value, 
-                    sell_type, time_added, time_sold, balance, order_status, profit, slippage
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?, 0, NULL, ?);
+                    sell_type, time_added, time_sold, balance, order_status, profit, slippage,
+                    buy_signature, buy_input_amount
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?, 0, NULL, ?, ?, ?);
                 """,
                 (
                     order_id,
@@ -203,6 +255,8 @@ class SQLiteDB:
                     time_added,
                     balance,
                     slippage,
+                    buy_signature,
+                    buy_input_amount,
                 ),
             )
             self.connection.commit()
@@ -211,33 +265,52 @@ class SQLiteDB:
         except sqlite3.IntegrityError as e:
             print(f"Error adding order: {e}")
 
+    @staticmethod
+    def _row_to_order(row) -> Order:
+        return Order(
+            id=row[0],
+            mint_address=row[1],
+            last_price_max=row[2],
+            sell_mode=SellMode(row[3]),
+            sell_value=row[4],
+            sell_type=SellType(row[5]),
+            time_added=datetime.fromtimestamp(row[6], timezone.utc),
+            balance=row[7],
+            status=OrderStatus(row[8]),
+            profit=row[9],
+            slippage=row[10],
+            buy_signature=row[11],
+            buy_input_amount=row[12],
+            sell_signature=row[13],
+            sell_output_amount=row[14],
+        )
+
     def get_orders(self, status: OrderStatus) -> List[Order]:
         cursor = self.connection.cursor()
         cursor.execute(
             """
-            SELECT id, mint_address, last_price_max, sell_mode, sell_value, sell_type, time_added, balance, order_status, profit, slippage
+            SELECT id, mint_address, last_price_max, sell_mode, sell_value, sell_type, time_added, balance, order_status, profit, slippage,
+                   buy_signature, buy_input_amount, sell_signature, sell_output_amount
             FROM tracked_orders
             WHERE order_status = ?
             """,
             (status.value,),
         )
-        rows = cursor.fetchall()
-        return [
-            Order(
-                id=row[0],
-                mint_address=row[1],
-                last_price_max=row[2],
-                sell_mode=SellMode(row[3]),
-                sell_value=row[4],
-                sell_type=SellType(row[5]),
-                time_added=datetime.fromisoformat(row[6]),
-                balance=row[7],
-                status=OrderStatus(row[8]),
-                profit=row[9],
-                slippage=row[10],
-            )
-            for row in rows
-        ]
+        return [self._row_to_order(row) for row in cursor.fetchall()]
+
+    def get_order(self, order_id: str) -> Optional[Order]:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT id, mint_address, last_price_max, sell_mode, sell_value, sell_type, time_added, balance, order_status, profit, slippage,
+                   buy_signature, buy_input_amount, sell_signature, sell_output_amount
+            FROM tracked_orders
+            WHERE id = ?
+            """,
+            (order_id,),
+        )
+        row = cursor.fetchone()
+        return self._row_to_order(row) if row else None
 
     def get_active_order_balance_by_mint_address(self, mint_address: str) -> float:
         cursor = self.connection.cursor()
@@ -261,6 +334,17 @@ class SQLiteDB:
         )
         self.connection.commit()
 
+    def update_orders_last_price(self, prices: Dict[str, float]) -> None:
+        """Writes the new price highs of many orders in a single transaction."""
+        cursor = self.connection.cursor()
+        cursor.executemany(
+            """
+            UPDATE tracked_orders SET last_price_max = ? WHERE id = ?
+            """,
+            [(price, order_id) for order_id, price in prices.items()],
+        )
+        self.connection.commit()
+
     def set_order_status(self, order_id: str, status: OrderStatus) -> None:
         cursor = self.connection.cursor()
         cursor.execute(
@@ -275,18 +359,28 @@ class SQLiteDB:
         self.connection.commit()
         print(f"Order with ID '{order_id}' has been canceled.")
 
-    def complete_order(self, order_id: str, profit: str = None):
-        time_sold = datetime.now(timezone.utc).isoformat()
+    def complete_order(
+        self,
+        order_id: str,
+        profit: str = None,
+        sell_signature: Optional[str] = None,
+        sell_output_amount: Optional[float] = None,
+    ):
+        time_sold = int(time.time())
 
         cursor = self.connection.cursor()
         cursor.execute(
             """
-            UPDATE tracked_orders SET order_status = ?, time_sold = ?, profit = ? WHERE id = ?
+            UPDATE tracked_orders
+            SET order_status = ?, time_sold = ?, profit = ?, sell_signature = ?, sell_output_amount = ?
+            WHERE id = ?
             """,
             (
                 OrderStatus.COMPLETE.value,
                 time_sold,
                 profit,
+                sell_signature,
+                sell_output_amount,
                 order_id,
             ),
         )
@@ -522,7 +616,7 @@ class SQLiteDB:
                     tweet.full_text,
                     tweet.is_retweet,
                     tweet.is_reply,
-                    tweet.created_at,
+                    _to_epoch(tweet.created_at),
                 ),
             )
             self.connection.commit()
@@ -544,7 +638,7 @@ class SQLiteDB:
                     event.profile_id,
                     event.tweet_id,
                     event.telegram_id,
-                    event.time_processed,
+                    _to_epoch(event.time_processed),
                 ),
             )
             self.connection.commit()
@@ -0,0 +1,272 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+# Each migration runs once, in order, inside its own transaction. The version of
+# the last applied migration is stored in SQLite's user_version pragma.
+Migration = Tuple[int, str, Callable[[sqlite3.Cursor], None]]
+
+
+def _columns(cursor: sqlite3.Cursor, table: str) -> List[str]:
+    cursor.execute(f"PRAGMA table_info({table});")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def _to_epoch(value) -> Optional[int]:
+    """Converts a stored ISO timestamp to integer epoch seconds (UTC)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    parsed = datetime.fromisoformat(str(value))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _initial_schema(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tracked_orders (
+            id TEXT PRIMARY KEY,
+            mint_address TEXT NOT NULL,
+            last_price_max REAL,
+            sell_mode TEXT,
+            sell_value REAL,
+            sell_type TEXT,
+            time_added TEXT,
+            time_sold TEXT,
+            balance REAL,
+            order_status INTEGER DEFAULT 0,
+            profit TEXT,
+            slippage REAL
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS token_info (
+            mint_address TEXT PRIMARY KEY,
+            name TEXT,
+            ticker TEXT,
+            image TEXT
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS profile (
+            id TEXT PRIMARY KEY,
+            platform TEXT,
+            username TEXT,
+            is_active BOOLEAN,
+            buy_type TEXT,
+            buy_amount_type TEXT,
+            buy_amount REAL,
+            buy_slippage REAL,
+            sell_mode TEXT,
+            sell_type TEXT,
+            sell_value REAL,
+            sell_slippage REAL,
+            is_visable BOOLEAN DEFAULT 1
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tweets (
+            id TEXT PRIMARY KEY,
+            full_text TEXT,
+            is_retweet BOOLEAN,
+            is_reply BOOLEAN,
+            created_at DATETIME
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS telegrams (
+            id TEXT PRIMARY KEY,
+            telegram_user_id TEXT,
+            username TEXT,
+            chat_id TEXT,
+            full_text TEXT,
+            created_at DATETIME
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            id TEXT PRIMARY KEY,
+            profile_id TEXT,
+            tweet_id TEXT,
+            telegram_id TEXT,
+            time_processed DATETIME,
+            FOREIGN KEY(profile_id) REFERENCES profile(id)
+            FOREIGN KEY(tweet_id) REFERENCES tweets(id)
+            FOREIGN KEY(telegram_id) REFERENCES telegrams(id)
+        );
+        """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS extracted_tweets_data (
+            id TEXT PRIMARY KEY,
+            tweet_id TEXT,
+            tweet_type TEXT,
+            tokens TEXT,
+            token_sentiment TEXT,
+            FOREIGN KEY(tweet_id) REFERENCES tweets(id)
+        );
+        """)
+
+
+def _token_decimals(cursor: sqlite3.Cursor) -> None:
+    # Databases initialized while decimals were added ad hoc may already have it
+    if "decimals" not in _columns(cursor, "token_info"):
+        cursor.execute("ALTER TABLE token_info ADD COLUMN decimals INTEGER;")
+
+
+def _epoch_timestamps(cursor: sqlite3.Cursor) -> None:
+    # Column types cannot be altered in place, so tracked_orders is rebuilt with
+    # INTEGER time columns (a TEXT column would coerce the epochs back to text)
+    cursor.execute("""
+        CREATE TABLE tracked_orders_new (
+            id TEXT PRIMARY KEY,
+            mint_address TEXT NOT NULL,
+            last_price_max REAL,
+            sell_mode TEXT,
+            sell_value REAL,
+            sell_type TEXT,
+            time_added INTEGER,
+            time_sold INTEGER,
+            balance REAL,
+            order_status INTEGER DEFAULT 0,
+            profit TEXT,
+            slippage REAL
+        );
+        """)
+    cursor.execute("""
+        SELECT id, mint_address, last_price_max, sell_mode, sell_value, sell_type,
+               time_added, time_sold, balance, order_status, profit, slippage
+        FROM tracked_orders
+        """)
+    rows = [
+        row[:6] + (_to_epoch(row[6]), _to_epoch(row[7])) + row[8:]
+        for row in cursor.fetchall()
+    ]
+    cursor.executemany(
+        """
+        INSERT INTO tracked_orders_new (
+            id, mint_address, last_price_max, sell_mode, sell_value, sell_type,
+            time_added, time_sold, balance, order_status, profit, slippage
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """,
+        rows,
+    )
+    cursor.execute("DROP TABLE tracked_orders;")
+    cursor.execute("ALTER TABLE tracked_orders_new RENAME TO tracked_orders;")
+
+    # DATETIME columns have numeric affinity, so their values convert in place
+    for table, column in (
+        ("tweets", "created_at"),
+        ("telegrams", "created_at"),
+        ("events", "time_processed"),
+    ):
+        cursor.execute(f"SELECT id, {column} FROM {table};")
+        cursor.executemany(
+            f"UPDATE {table} SET {column} = ? WHERE id = ?;",
+            [(_to_epoch(value), row_id) for row_id, value in cursor.fetchall()],
+        )
+
+
+def _hot_query_indexes(cursor: sqlite3.Cursor) -> None:
+    # get_orders filters on order_status; the balance lookup on mint + status
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tracked_orders_status "
+        "ON tracked_orders(order_status);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tracked_orders_mint_status "
+        "ON tracked_orders(mint_address, order_status);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_profile_id ON events(profile_id);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_tweet_id ON events(tweet_id);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_telegram_id ON events(telegram_id);"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_extracted_tweets_data_tweet_id "
+        "ON extracted_tweets_data(tweet_id);"
+    )
+
+
+def _ticker_resolutions(cursor: sqlite3.Cursor) -> None:
+    # mint_address is NULL for tickers that did not resolve (negative cache)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ticker_resolutions (
+            ticker TEXT PRIMARY KEY,
+            mint_address TEXT,
+            resolved_at INTEGER NOT NULL,
+            pinned INTEGER NOT NULL DEFAULT 0
+        );
+        """)
+
+
+def _sentiment_cache(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sentiment_cache (
+            cache_key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at INTEGER NOT NULL
+        );
+        """)
+
+
+def _order_fills(cursor: sqlite3.Cursor) -> None:
+    # Exact swap fills read from the confirmed transactions, NULL for older orders
+    for column, column_type in (
+        ("buy_signature", "TEXT"),
+        ("buy_input_amount", "REAL"),
+        ("sell_signature", "TEXT"),
+        ("sell_output_amount", "REAL"),
+    ):
+        if column not in _columns(cursor, "tracked_orders"):
+            cursor.execute(
+                f"ALTER TABLE tracked_orders ADD COLUMN {column} {column_type};"
+            )
+
+
+MIGRATIONS: List[Migration] = [
+    (1, "initial schema", _initial_schema),
+    (2, "token decimals", _token_decimals),
+    (3, "integer epoch timestamps", _epoch_timestamps),
+    (4, "hot query indexes", _hot_query_indexes),
+    (5, "ticker resolutions", _ticker_resolutions),
+    (6, "sentiment cache", _sentiment_cache),
+    (7, "order fills", _order_fills),
+]
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    return connection.execute("PRAGMA user_version;").fetchone()[0]
+
+
+def migrate(connection: sqlite3.Connection) -> int:
+    """
+    Brings the database up to the latest schema version.
+
+    Safe to call from several processes at once: each migration takes the write
+    lock and re-checks the version before applying.
+
+    Returns:
+        int: the schema version after migrating
+    """
+    if connection.in_transaction:
+        connection.commit()
+    for version, name, apply in MIGRATIONS:
+        if get_schema_version(connection) >= version:
+            continue
+        cursor = connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE;")
+        try:
+            if get_schema_version(connection) < version:
+                apply(cursor)
+                cursor.execute(f"PRAGMA user_version = {version};")
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            raise Exception(f"Migration {version} ({name}) failed: {e}") from e
+    return get_schema_version(connection)
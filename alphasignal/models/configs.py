@@ -1,6 +1,14 @@
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
-from alphasignal.models.enums import AmountType, BuyType, SellMode, SellType
+from alphasignal.models.enums import (
+    AmountType,
+    BuyType,
+    SellMode,
+    SellType,
+    TweetSentiment,
+    TweetType,
+)
 
 
 class AutoBuyConfig(BaseModel):
@@ -20,3 +28,20 @@ class AutoSellConfig(BaseModel):
 class BaseSellConfig(BaseModel):
     sell_type: SellType
     slippage: float
+
+
+class ProfilePrefilterConfig(BaseModel):
+    tweet_types: Optional[List[TweetType]] = None  # None keeps the global setting
+    blocked_keywords: List[str] = []
+
+
+class PrefilterConfig(BaseModel):
+    excluded_tickers: List[str] = []  # without '$', case insensitive
+    excluded_mints: List[str] = []
+    tweet_types: List[TweetType] = [TweetType.POST, TweetType.REPLY, TweetType.RETWEET]
+    blocked_keywords: List[str] = []
+    # Replies are dropped unless they contain one of these; empty disables the rule
+    reply_call_to_action: List[str] = []
+    # Sentiment assigned to tweets that are nothing but token mentions; None sends them to the LLM
+    bare_mention_sentiment: Optional[TweetSentiment] = None
+    profiles: Dict[str, ProfilePrefilterConfig] = {}  # keyed by username
@@ -5,3 +5,4 @@ TYPE_TO_MINT = {"SOL": SOL_MINT_ADDRESS, "USDC": USDC_MINT_ADDRESS}
 AUTO_BUY_CONFIG_PATH = "alphasignal/config/auto_buy_config.json"
 AUTO_SELL_CONFIG_PATH = "alphasignal/config/auto_sell_config.json"
 BASE_SELL_CONFIG_PATH = "alphasignal/config/sell_config.json"
+PREFILTER_CONFIG_PATH = "alphasignal/config/prefilter_config.json"
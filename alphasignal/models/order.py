@@ -17,3 +17,7 @@ class Order(BaseModel):
     status: OrderStatus
     profit: Optional[str]
     slippage: float
+    buy_signature: Optional[str] = None
+    buy_input_amount: Optional[float] = None  # ui amount spent on the buy
+    sell_signature: Optional[str] = None
+    sell_output_amount: Optional[float] = None  # ui amount received from the sell
@@ -0,0 +1,11 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from alphasignal.ai.models.sentiment_response import SentimentResponse
+from alphasignal.models.token_info import TokenInfo
+
+
+class PrefilterResult(BaseModel):
+    tokens: List[TokenInfo]  # tokens left for classification, empty if dropped
+    sentiment: Optional[SentimentResponse] = None  # set when a rule decided the tweet
+    rule: Optional[str] = None  # rule that dropped or decided the tweet
@@ -0,0 +1,15 @@
+from typing import Any, Dict
+from pydantic import BaseModel
+
+from alphasignal.models.enums import AmountType
+
+
+class PreparedBuy(BaseModel):
+    mint_address: str
+    from_mint_address: str
+    swap_balance: float  # input amount in token units
+    buy_amount_type: AmountType  # profile buy size the quote was sized for
+    buy_amount: float
+    slippage_bps: float
+    quote: Dict[str, Any]  # Jupiter quote for the swap
+    prepared_at: float  # epoch seconds
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class PricePoint(BaseModel):
+    mint_address: str
+    price: float
+    updated_at: float  # epoch seconds
+    source: str
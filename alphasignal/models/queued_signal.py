@@ -0,0 +1,8 @@
+from typing import Any
+from pydantic import BaseModel
+
+
+class QueuedSignal(BaseModel):
+    profile_key: str  # signals with the same key are processed in order
+    payload: Any
+    received_at: float  # epoch seconds the signal was created, or submitted
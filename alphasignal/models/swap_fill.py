@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class SwapFill(BaseModel):
+    signature: str
+    input_mint: str
+    output_mint: str
+    input_amount: float  # ui amount that left the wallet
+    output_amount: float  # ui amount that arrived in the wallet
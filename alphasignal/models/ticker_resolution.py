@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TickerResolution(BaseModel):
+    ticker: str
+    mint_address: Optional[str]  # None when the ticker did not resolve
+    resolved_at: float  # epoch seconds
+    pinned: bool = False
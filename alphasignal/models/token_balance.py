@@ -0,0 +1,8 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TokenBalance(BaseModel):
+    mint_address: str
+    balance: float  # ui amount
+    value: Optional[float] = None  # USD price, only set when requested
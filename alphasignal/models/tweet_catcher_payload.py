@@ -1,6 +1,10 @@
 # alphasignal/models/minimal_tweet_webhook.py
+from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Union
+
+# Twitter's created_at format, e.g. "Wed Oct 10 20:19:24 +0000 2018"
+TWITTER_TIME_FORMAT = "%a %b %d %H:%M:%S %z %Y"
 
 
 class DataMinimal(BaseModel):
@@ -8,10 +12,31 @@ class DataMinimal(BaseModel):
     text: Optional[str] = None
     is_retweet: bool
     is_reply: bool
+    created_at: Optional[Union[str, float]] = None  # when the tweet was posted
 
     class Config:
         extra = "ignore"
 
+    def posted_at(self) -> Optional[float]:
+        """Returns when the tweet was posted in epoch seconds, None if unknown."""
+        value = self.created_at
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            # Epoch milliseconds are common in webhook payloads
+            return value / 1000 if value > 1e11 else float(value)
+        for parse in (
+            lambda v: datetime.strptime(v, TWITTER_TIME_FORMAT),
+            lambda v: datetime.fromisoformat(v.replace("Z", "+00:00")),
+        ):
+            try:
+                parsed = parse(value)
+            except ValueError:
+                continue
+            if parsed.tzinfo is not None:
+                return parsed.timestamp()
+        return None
+
 
 class TaskMinimal(BaseModel):
     user: str
@@ -0,0 +1,11 @@
+from typing import Dict
+from pydantic import BaseModel
+
+
+class WalletSnapshot(BaseModel):
+    owner: str
+    balances: Dict[str, float]  # mint address -> ui amount
+    fetched_at: float  # epoch seconds
+
+    def get_balance(self, mint_address: str) -> float:
+        return self.balances.get(mint_address, 0.0)
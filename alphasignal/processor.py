@@ -1,30 +1,31 @@
-# import ngrok python sdk
 import asyncio
+import signal
 from dotenv import load_dotenv
-from datetime import datetime
-import time
 
-from alphasignal.services.order_manager import OrderManager
+from alphasignal.services.order_processor import OrderProcessor
 from alphasignal.services.service import initialize_database  # Added import
 
 load_dotenv()
 
-if __name__ == "__main__":
+
+async def main() -> None:
     initialize_database()  # Initialize database to create necessary tables
-    order_manager = OrderManager()
+    processor = OrderProcessor()
+
+    # Finish the in-flight tick before exiting on Ctrl+C / docker stop
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, processor.stop)
+        except NotImplementedError:
+            pass
 
+    await processor.run()
+
+
+if __name__ == "__main__":
     try:
-        while True:
-            now = datetime.now()
-            current_time = now.strftime("%H:%M:%S")
-            send_logs = True if now.second % 30 == 0 else False
-            if send_logs:
-                print(f"Starting order processing: {current_time}", flush=True)
-            asyncio.run(order_manager.process_orders())
-            now = datetime.now()
-            current_time = now.strftime("%H:%M:%S")
-            if send_logs:
-                print(f"Finished order processing: {current_time}", flush=True)
-            time.sleep(5)
+        asyncio.run(main())
     except KeyboardInterrupt:
-        print("Closing processor")
+        pass
+    print("Closing processor")
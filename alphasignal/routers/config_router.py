@@ -1,15 +1,23 @@
-from fastapi import APIRouter
-
-from alphasignal.models.configs import AutoBuyConfig, AutoSellConfig, BaseSellConfig
+from fastapi import APIRouter, HTTPException
+from solders.pubkey import Pubkey
+
+from alphasignal.models.configs import (
+    AutoBuyConfig,
+    AutoSellConfig,
+    BaseSellConfig,
+    PrefilterConfig,
+)
 from alphasignal.models.constants import (
     AUTO_BUY_CONFIG_PATH,
     AUTO_SELL_CONFIG_PATH,
     BASE_SELL_CONFIG_PATH,
+    PREFILTER_CONFIG_PATH,
 )
 from alphasignal.models.enums import AmountType, BuyType, SellMode, SellType
 from alphasignal.schemas.requests.auto_buy_config_request import AutoBuyConfigRequest
 from alphasignal.schemas.requests.auto_sell_config_request import AutoSellConfigRequest
 from alphasignal.schemas.requests.base_sell_config_request import BaseSellConfigRequest
+from alphasignal.schemas.requests.ticker_pin_request import TickerPinRequest
 from alphasignal.schemas.responses.auto_buy_config_response import AutoBuyConfigResponse
 from alphasignal.schemas.responses.auto_sell_config_response import (
     AutoSellConfigResponse,
@@ -17,6 +25,8 @@ from alphasignal.schemas.responses.auto_sell_config_response import (
 from alphasignal.schemas.responses.base_sell_config_response import (
     BaseSellConfigResponse,
 )
+from alphasignal.services.ticker_resolver import get_ticker_resolver
+from alphasignal.services.tweet_prefilter import get_tweet_prefilter
 from alphasignal.utils.utils import load_config, update_config
 
 router = APIRouter()
@@ -95,3 +105,35 @@ async def update_base_sell_config(request: BaseSellConfigRequest):
     update_config(BASE_SELL_CONFIG_PATH, request.model_dump())
 
     return True
+
+
+@router.get("/config/prefilter", response_model=PrefilterConfig)
+async def get_prefilter_config():
+    return load_config(PREFILTER_CONFIG_PATH, PrefilterConfig)
+
+
+@router.post("/config/prefilter", response_model=bool)
+async def update_prefilter_config(request: PrefilterConfig):
+    update_config(PREFILTER_CONFIG_PATH, request.model_dump(mode="json"))
+    get_tweet_prefilter().reload()
+
+    return True
+
+
+@router.post("/config/tickers/pin", response_model=bool)
+async def pin_ticker(request: TickerPinRequest):
+    try:
+        Pubkey.from_string(request.mint_address)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid mint address")
+
+    get_ticker_resolver().pin(request.ticker, request.mint_address)
+
+    return True
+
+
+@router.delete("/config/tickers/pin/{ticker}", response_model=bool)
+async def unpin_ticker(ticker: str):
+    get_ticker_resolver().unpin(ticker)
+
+    return True
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
+from alphasignal.apis.dexscreener.dexscreener_client import DexscreenerClient
 from alphasignal.models.enums import OrderStatus, SellMode, SellType
 from alphasignal.schemas.requests.add_order_request import AddOrderRequest
 from alphasignal.schemas.responses.orders_response import OrdersResponse, OrderResponse
@@ -8,6 +9,7 @@ from alphasignal.services.order_manager import (
     TokenBalanceNotAvalible,
     TokenNotFoundError,
 )
+from alphasignal.services.price_engine import get_price_engine
 
 router = APIRouter()
 
@@ -31,17 +33,36 @@ async def get_tracked_orders(status: int):
             status=order.status.value,
             profit=order.profit,
             slippage=order.slippage,
+            buy_signature=order.buy_signature,
+            buy_input_amount=order.buy_input_amount,
+            sell_signature=order.sell_signature,
+            sell_output_amount=order.sell_output_amount,
         )
         orders_return.append(current_order)
 
     return OrdersResponse(orders=orders_return)
 
 
+async def _order_token_value(mint_address: str) -> float:
+    # Jupiter cannot price every held token, Dexscreener still lists most
+    try:
+        return await get_price_engine().get_price(mint_address)
+    except Exception:
+        pass
+    try:
+        token_data = await DexscreenerClient().get_token_pairs(mint_address)
+        return float(token_data["priceUsd"])
+    except Exception:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No price found for mint address '{mint_address}'.",
+        )
+
+
 @router.post("/orders/add", response_model=str)
 async def add_order(request: AddOrderRequest):
     order_manager = OrderManager()
-    tokens = await order_manager.wallet.get_tokens()
-    token = next((t for t in tokens if t.mint_address == request.mint_address), None)
+    token = await order_manager.wallet.get_token_balance(request.mint_address)
 
     if not token:
         raise TokenNotFoundError(
@@ -63,7 +84,7 @@ async def add_order(request: AddOrderRequest):
         request.sell_value,
         SellType(request.sell_type),
         request.balance,
-        token.value,
+        await _order_token_value(request.mint_address),
         request.slippage,
     )
 
@@ -73,8 +94,7 @@ async def add_order(request: AddOrderRequest):
 @router.get("/orders/balance/{mint_address}", response_model=float)
 async def get_avalible_balance(mint_address: str):
     order_manager = OrderManager()
-    tokens = await order_manager.wallet.get_tokens()
-    token = next((t for t in tokens if t.mint_address == mint_address), None)
+    token = await order_manager.wallet.get_token_balance(mint_address)
 
     if not token:
         raise TokenNotFoundError(
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from alphasignal.database.db import ProfileNotFoundError
 from alphasignal.models.enums import BuyType, AmountType, Platform, SellMode, SellType
 from alphasignal.schemas.requests.create_profile import ProfileCreateRequest
@@ -8,11 +8,18 @@ from alphasignal.schemas.responses.profile_respones import ProfileResponse
 from alphasignal.services.profile_manager import ProfileManager
 
 router = APIRouter()
-profile_manager = ProfileManager()
+
+
+def get_profile_manager(request: Request) -> ProfileManager:
+    # Built once in the app lifespan
+    return request.app.state.profile_manager
 
 
 @router.post("/profile", response_model=str)
-async def add_profile(request: ProfileCreateRequest):
+async def add_profile(
+    request: ProfileCreateRequest,
+    profile_manager: ProfileManager = Depends(get_profile_manager),
+):
     """
     Create a new profile with default buy/sell settings.
     """
@@ -23,7 +30,9 @@ async def add_profile(request: ProfileCreateRequest):
 
 
 @router.patch("/profile/{profile_id}/activate", response_model=bool)
-async def activate_profile(profile_id: str):
+async def activate_profile(
+    profile_id: str, profile_manager: ProfileManager = Depends(get_profile_manager)
+):
     """
     Activate a profile by its ID.
     """
@@ -32,7 +41,9 @@ async def activate_profile(profile_id: str):
 
 
 @router.patch("/profile/{profile_id}/deactivate", response_model=bool)
-async def deactivate_profile(profile_id: str):
+async def deactivate_profile(
+    profile_id: str, profile_manager: ProfileManager = Depends(get_profile_manager)
+):
     """
     Deactivate a profile by its ID.
     """
@@ -41,7 +52,11 @@ async def deactivate_profile(profile_id: str):
 
 
 @router.put("/profile/{profile_id}", response_model=bool)
-async def update_profile(profile_id: str, request: ProfileUpdateRequest):
+async def update_profile(
+    profile_id: str,
+    request: ProfileUpdateRequest,
+    profile_manager: ProfileManager = Depends(get_profile_manager),
+):
     """
     Update an existing profile with new buy/sell settings.
     """
@@ -60,7 +75,9 @@ async def update_profile(profile_id: str, request: ProfileUpdateRequest):
 
 
 @router.get("/profile/{profile_id}", response_model=ProfileResponse)
-async def get_profile(profile_id: str):
+async def get_profile(
+    profile_id: str, profile_manager: ProfileManager = Depends(get_profile_manager)
+):
     """
     Retrieve a profile based on platform and username.
     """
@@ -85,7 +102,9 @@ async def get_profile(profile_id: str):
 
 
 @router.delete("/profile/{profile_id}", response_model=bool)
-async def delete_profile(profile_id: str):
+async def delete_profile(
+    profile_id: str, profile_manager: ProfileManager = Depends(get_profile_manager)
+):
     """
     Delete a profile by its ID.
     """
@@ -97,7 +116,9 @@ async def delete_profile(profile_id: str):
 
 
 @router.get("/profiles", response_model=List[ProfileResponse])
-async def get_profiles():
+async def get_profiles(
+    profile_manager: ProfileManager = Depends(get_profile_manager),
+):
     """
     Retrieve all available profiles.
     """
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Request
+
+from alphasignal.schemas.responses.prefilter_stats_response import (
+    PrefilterStatsResponse,
+)
+from alphasignal.schemas.responses.sentiment_cache_stats_response import (
+    SentimentCacheStatsResponse,
+)
+from alphasignal.schemas.responses.signal_queue_stats_response import (
+    SignalQueueStatsResponse,
+)
+from alphasignal.services.sentiment_cache import get_sentiment_cache
+from alphasignal.services.tweet_prefilter import get_tweet_prefilter
+
+router = APIRouter()
+
+
+@router.get("/stats/signal-queue", response_model=SignalQueueStatsResponse)
+async def get_signal_queue_stats(request: Request):
+    return request.app.state.signal_queue.stats()
+
+
+@router.get("/stats/sentiment-cache", response_model=SentimentCacheStatsResponse)
+async def get_sentiment_cache_stats():
+    return get_sentiment_cache().stats()
+
+
+@router.get("/stats/prefilter", response_model=PrefilterStatsResponse)
+async def get_prefilter_stats():
+    return get_tweet_prefilter().stats()
@@ -1,21 +1,42 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from alphasignal.models.tweet_catcher_payload import TweetWebhookMinimal
-from alphasignal.services.twitter_monitor import TwitterMonitor
+from alphasignal.services.signal_queue import SignalQueue
 
 router = APIRouter()
 
-twitter_monitor = TwitterMonitor()
 
+def get_signal_queue(request: Request) -> SignalQueue:
+    # Built once in the app lifespan
+    return request.app.state.signal_queue
 
-@router.post("/webhooks/tweetcatcher/tweet-process", response_model=bool)
-async def process_tweet_webhook(body: TweetWebhookMinimal) -> bool:
+
+@router.post(
+    "/webhooks/tweetcatcher/tweet-process",
+    response_model=bool,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def process_tweet_webhook(
+    body: TweetWebhookMinimal,
+    signal_queue: SignalQueue = Depends(get_signal_queue),
+) -> bool:
     """
-    Process a tweet webhook payload from TweetCatcher.
+    Accept a tweet webhook payload from TweetCatcher for processing.
+
+    The payload is validated and queued; sentiment, resolution and auto-buy run
+    on the signal workers after the response is sent.
 
     Args:
-        tweetPayload (TweetCatcherWebhookPayload): The webhook payload received from TweetCatcher.
+        body (TweetWebhookMinimal): The webhook payload received from TweetCatcher.
 
     Returns:
-        bool: True if the tweet was successfully processed
+        bool: True if the tweet was queued
     """
-    return await twitter_monitor.process_tweet_webhook(body)
+    # Freshness counts from when the tweet was posted, not when it reached us
+    if not signal_queue.submit(
+        f"twitter:{body.task.user}", body, received_at=body.data.posted_at()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Signal queue is full",
+        )
+    return True
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class TickerPinRequest(BaseModel):
+    ticker: str
+    mint_address: str
@@ -15,6 +15,10 @@ class OrderResponse(BaseModel):
     status: int
     profit: Optional[str]
     slippage: float
+    buy_signature: Optional[str] = None
+    buy_input_amount: Optional[float] = None
+    sell_signature: Optional[str] = None
+    sell_output_amount: Optional[float] = None
 
 
 class OrdersResponse(BaseModel):
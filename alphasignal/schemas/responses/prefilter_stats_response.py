@@ -0,0 +1,8 @@
+from typing import Dict
+from pydantic import BaseModel
+
+
+class PrefilterStatsResponse(BaseModel):
+    evaluated: int
+    llm_calls_avoided: int
+    rules: Dict[str, int]  # rule name -> tweets it dropped or decided
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class SentimentCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    memory_entries: int
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class SignalQueueStatsResponse(BaseModel):
+    workers: int
+    depth: int
+    in_flight: int
+    accepted: int
+    rejected: int
+    processed: int
+    failed: int
+    dropped_stale: int
+    avg_wait_seconds: float
+    max_wait_seconds: float
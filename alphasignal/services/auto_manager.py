@@ -1,11 +1,18 @@
-from alphasignal.apis.jupiter.jupiter_client import JupiterClient
-from alphasignal.apis.solana.solana_client import SolanaClient
+import os
+import time
+from typing import Optional
+
+from alphasignal.apis.jupiter.jupiter_client import JupiterClient, SwapNotSettledError
+from alphasignal.apis.solana.solana_client import get_solana_client
 from alphasignal.database.db import SQLiteDB
 from alphasignal.models.constants import (
     TYPE_TO_MINT,
 )
 from alphasignal.models.enums import AmountType, BuyType, Platform
+from alphasignal.models.prepared_buy import PreparedBuy
+from alphasignal.models.profile import Profile
 from alphasignal.services.order_manager import OrderManager
+from alphasignal.services.price_engine import get_price_engine
 from alphasignal.services.profile_manager import ProfileManager
 from alphasignal.services.wallet_manager import WalletManager
 import logging
@@ -14,6 +21,11 @@ import logging
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+# A speculative quote older than this is fetched again before swapping
+SPECULATIVE_QUOTE_MAX_AGE_SECONDS = float(
+    os.getenv("SPECULATIVE_QUOTE_MAX_AGE_SECONDS", "10")
+)
+
 
 class AutoManager:
     def __init__(self):
@@ -22,53 +34,23 @@ class AutoManager:
         self.wallet_manager = WalletManager()
         self.orders = OrderManager()
         self.profiles = ProfileManager()
-        self.solana_client = SolanaClient()
-
-    async def auto_buy(
-        self,
-        mint_address: str,
-        platform: Platform,
-        username: str,
-    ) -> str | None:
-        """
-        Auto buy a token using the profile settings.
-
-        Args:
-            mint_address (str): The mint address of the token.
-            platform (str): The platform associated with the username.
-            username (str): The trading username.
-        """
-
-        # Retrieve profile based on platform and username
-        profile = self.profiles.get_profile(platform.value, username)
-
-        if profile is None:
-            raise Exception(
-                f"No profile found for platform '{platform.value}' and username '{username}'."
-            )
-
-        if not profile.is_active:
-            return None
-
-        tokens = await self.wallet_manager.get_tokens()
 
+    async def _get_swap_amount(self, profile: Profile) -> float:
+        """Work out how much of the profile's buy token a buy spends."""
         # Determine the mint address for the selected buy type
         from_mint_address = TYPE_TO_MINT[profile.buy_type.value]
         if profile.buy_type == BuyType.SOL:
-            token_balance = self.solana_client.get_sol_balance(
+            token_balance = await get_solana_client().get_sol_balance(
                 self.wallet_manager.wallet
             )
         else:
             # Find balance of the required token
-            token_balance = None
-            for token in tokens:
-                if token.mint_address == from_mint_address:
-                    token_balance = token.balance
-                    break
-            if token_balance is None:
+            token = await self.wallet_manager.get_token_balance(from_mint_address)
+            if token is None:
                 raise Exception(
                     f"Token balance not found for mint address: {from_mint_address}"
                 )
+            token_balance = token.balance
 
         swap_balance = 0
 
@@ -85,15 +67,112 @@ class AutoManager:
             # Calculate swap amount based on balance percentage
             swap_balance = token_balance * (profile.buy_amount / 100)
 
-        amount = await self.jupiter.swap_tokens(
-            from_token_mint=from_mint_address,
-            to_token_mint=mint_address,
-            input_amount=swap_balance,
-            wallet_manager=self.wallet_manager,
+        return swap_balance
+
+    async def prepare_buy(
+        self,
+        mint_address: str,
+        platform: Platform,
+        username: str,
+    ) -> Optional[PreparedBuy]:
+        """
+        Fetch everything a buy needs ahead of the decision to buy.
+
+        The balance, decimals and Jupiter quote are fetched as if auto_buy was
+        called now, so a positive signal can go straight to the swap.
+
+        Args:
+            mint_address (str): The mint address of the token.
+            platform (str): The platform associated with the username.
+            username (str): The trading username.
+
+        Returns:
+            Optional[PreparedBuy]: None when the profile is missing or inactive.
+        """
+        try:
+            profile = self.profiles.get_profile(platform.value, username)
+        except Exception:
+            return None
+        if profile is None or not profile.is_active:
+            return None
+
+        from_mint_address = TYPE_TO_MINT[profile.buy_type.value]
+        swap_balance = await self._get_swap_amount(profile)
+        quote = await self.jupiter.fetch_swap_quote(
+            from_mint_address, mint_address, swap_balance, profile.buy_slippage
+        )
+        return PreparedBuy(
+            mint_address=mint_address,
+            from_mint_address=from_mint_address,
+            swap_balance=swap_balance,
+            buy_amount_type=profile.buy_amount_type,
+            buy_amount=profile.buy_amount,
             slippage_bps=profile.buy_slippage,
+            quote=quote,
+            prepared_at=time.time(),
         )
 
-        final_balance = float(f"{float(amount):.6f}")
+    async def auto_buy(
+        self,
+        mint_address: str,
+        platform: Platform,
+        username: str,
+        prepared: Optional[PreparedBuy] = None,
+    ) -> str | None:
+        """
+        Auto buy a token using the profile settings.
+
+        Args:
+            mint_address (str): The mint address of the token.
+            platform (str): The platform associated with the username.
+            username (str): The trading username.
+            prepared (Optional[PreparedBuy]): A quote from prepare_buy, used while fresh.
+        """
+
+        # Retrieve profile based on platform and username
+        profile = self.profiles.get_profile(platform.value, username)
+
+        if profile is None:
+            raise Exception(
+                f"No profile found for platform '{platform.value}' and username '{username}'."
+            )
+
+        if not profile.is_active:
+            return None
+
+        # The profile may have changed since the quote was prepared
+        from_mint_address = TYPE_TO_MINT[profile.buy_type.value]
+        if (
+            prepared is None
+            or prepared.mint_address != mint_address
+            or prepared.from_mint_address != from_mint_address
+            or prepared.slippage_bps != profile.buy_slippage
+            or prepared.buy_amount_type != profile.buy_amount_type
+            or prepared.buy_amount != profile.buy_amount
+            or time.time() - prepared.prepared_at > SPECULATIVE_QUOTE_MAX_AGE_SECONDS
+        ):
+            prepared = None
+            swap_balance = await self._get_swap_amount(profile)
+        else:
+            swap_balance = prepared.swap_balance
+
+        try:
+            fill = await self.jupiter.swap_tokens(
+                from_token_mint=from_mint_address,
+                to_token_mint=mint_address,
+                input_amount=swap_balance,
+                wallet_manager=self.wallet_manager,
+                slippage_bps=profile.buy_slippage,
+                quote=prepared.quote if prepared else None,
+            )
+        except SwapNotSettledError as e:
+            # A buy that landed late still needs an order tracking it
+            fill = await self.jupiter.settle_swap(
+                e, self.wallet_manager, from_mint_address, mint_address
+            )
+            if fill is None:
+                raise Exception(f"Buy of {mint_address} did not land: {e}")
+        final_balance = float(f"{fill.output_amount:.6f}")
 
         # Create an order using profile's sell configurations
         order_id = self.orders.add_order(
@@ -102,8 +181,9 @@ class AutoManager:
             sell_value=profile.sell_value,
             sell_type=profile.sell_type,
             balance=int(final_balance),
-            token_value=await self.jupiter.fetch_token_value(mint_address),
+            token_value=await get_price_engine().get_price(mint_address),
             slippage=profile.sell_slippage,
+            fill=fill,
         )
 
         # Log order creation
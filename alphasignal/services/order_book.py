@@ -0,0 +1,143 @@
+import threading
+from typing import Dict, List, Optional, Set
+
+from alphasignal.database.db import SQLiteDB
+from alphasignal.models.enums import OrderStatus
+from alphasignal.models.order import Order
+
+# Statuses the book keeps in memory; anything else is finished
+OPEN_STATUSES = (OrderStatus.ACTIVE, OrderStatus.PROCESSING)
+
+
+class OrderBook:
+    """
+    In-memory index of open orders by id and by mint.
+
+    Loaded from SQLite once, then kept in sync by OrderManager. New price highs
+    only touch memory and are written back by flush() in one transaction.
+    """
+
+    def __init__(self):
+        self._orders: Dict[str, Order] = {}
+        self._by_mint: Dict[str, Set[str]] = {}
+        self._dirty_prices: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.loaded = False
+
+    def load(self, db: SQLiteDB) -> None:
+        """Loads the open orders from the database if that has not happened yet."""
+        with self._lock:
+            if self.loaded:
+                return
+            for status in OPEN_STATUSES:
+                for order in db.get_orders(status):
+                    self._index(order)
+            self.loaded = True
+
+    def sync(self, db: SQLiteDB) -> None:
+        """
+        Reconciles the book with orders another process created, canceled or
+        finished. Unflushed price highs are kept.
+        """
+        with self._lock:
+            stored = {
+                order.id: order
+                for status in OPEN_STATUSES
+                for order in db.get_orders(status)
+            }
+            for order_id in list(self._orders):
+                if order_id not in stored:
+                    self._unindex(order_id)
+            for order_id, order in stored.items():
+                current = self._orders.get(order_id)
+                if current is None:
+                    self._index(order)
+                else:
+                    current.status = order.status
+                    current.last_price_max = max(
+                        current.last_price_max, order.last_price_max
+                    )
+            self.loaded = True
+
+    def _index(self, order: Order) -> None:
+        self._orders[order.id] = order
+        self._by_mint.setdefault(order.mint_address, set()).add(order.id)
+
+    def _unindex(self, order_id: str) -> Optional[Order]:
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            ids = self._by_mint.get(order.mint_address)
+            if ids is not None:
+                ids.discard(order_id)
+                if not ids:
+                    del self._by_mint[order.mint_address]
+        return order
+
+    def add(self, order: Order) -> None:
+        with self._lock:
+            self._index(order)
+
+    def get(self, order_id: str) -> Optional[Order]:
+        with self._lock:
+            return self._orders.get(order_id)
+
+    def get_by_mint(self, mint_address: str) -> List[Order]:
+        with self._lock:
+            return [self._orders[i] for i in self._by_mint.get(mint_address, ())]
+
+    def active_orders(self) -> List[Order]:
+        with self._lock:
+            return [o for o in self._orders.values() if o.status == OrderStatus.ACTIVE]
+
+    def set_status(self, order_id: str, status: OrderStatus) -> None:
+        with self._lock:
+            if status not in OPEN_STATUSES:
+                self._unindex(order_id)
+            elif order_id in self._orders:
+                self._orders[order_id].status = status
+
+    def remove(self, order_id: str) -> None:
+        with self._lock:
+            self._unindex(order_id)
+
+    def update_last_price(self, order_id: str, price: float) -> None:
+        """Records a new price high in memory; it is persisted by the next flush."""
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is None:
+                return
+            order.last_price_max = price
+            self._dirty_prices[order_id] = price
+
+    def flush(self, db: SQLiteDB) -> int:
+        """
+        Writes every pending price high in a single transaction.
+
+        Returns:
+            int: the number of orders written
+        """
+        with self._lock:
+            pending = self._dirty_prices
+            self._dirty_prices = {}
+        if not pending:
+            return 0
+        try:
+            db.update_orders_last_price(pending)
+        except Exception:
+            # Keep the values for the next flush unless a newer high replaced them
+            with self._lock:
+                for order_id, price in pending.items():
+                    self._dirty_prices.setdefault(order_id, price)
+            raise
+        return len(pending)
+
+
+_order_book: Optional[OrderBook] = None
+
+
+def get_order_book() -> OrderBook:
+    """Return the process wide OrderBook."""
+    global _order_book
+    if _order_book is None:
+        _order_book = OrderBook()
+    return _order_book
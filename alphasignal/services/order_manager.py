@@ -1,11 +1,15 @@
 import asyncio
+import os
 from datetime import datetime, timedelta, timezone
-from typing import List
-from alphasignal.apis.jupiter.jupiter_client import JupiterClient
+from typing import Callable, List, Optional, Set
+from alphasignal.apis.jupiter.jupiter_client import JupiterClient, SwapNotSettledError
 from alphasignal.database.db import SQLiteDB
 from alphasignal.models.order import Order
 from alphasignal.models.constants import SOL_MINT_ADDRESS, USDC_MINT_ADDRESS
 from alphasignal.models.enums import OrderStatus, SellMode, SellType
+from alphasignal.models.swap_fill import SwapFill
+from alphasignal.services.order_book import get_order_book
+from alphasignal.services.price_engine import get_price_engine
 from alphasignal.services.wallet_manager import WalletManager
 
 
@@ -22,10 +26,45 @@ class TokenBalanceNotAvalible(Exception):
 
 
 class OrderManager:
-    def __init__(self):
+    # Called whenever an order is created or canceled in this process
+    _change_listeners: List[Callable[[], None]] = []
+
+    def __init__(
+        self,
+        evaluation_concurrency: Optional[int] = None,
+        sell_concurrency: Optional[int] = None,
+    ):
         self.db = SQLiteDB()
         self.jupiter = JupiterClient()
+        self.prices = get_price_engine()
+        self.book = get_order_book()
         self.wallet = WalletManager()
+        self.evaluation_semaphore = asyncio.Semaphore(
+            evaluation_concurrency
+            or int(os.getenv("ORDER_EVALUATION_CONCURRENCY", "20"))
+        )
+        self.sell_semaphore = asyncio.Semaphore(
+            sell_concurrency or int(os.getenv("ORDER_SELL_CONCURRENCY", "3"))
+        )
+        # Sells outlive the tick that triggered them
+        self._sell_tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def add_change_listener(cls, listener: Callable[[], None]) -> None:
+        cls._change_listeners.append(listener)
+
+    @classmethod
+    def remove_change_listener(cls, listener: Callable[[], None]) -> None:
+        if listener in cls._change_listeners:
+            cls._change_listeners.remove(listener)
+
+    @classmethod
+    def _notify_change(cls) -> None:
+        for listener in list(cls._change_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Order change listener failed: {e}")
 
     def get_orders(self, status: OrderStatus) -> List[Order]:
         orders = self.db.get_orders(status)
@@ -41,6 +80,7 @@ class OrderManager:
         balance: float,
         token_value: float,
         slippage: float,
+        fill: Optional[SwapFill] = None,
     ) -> str:
         """
         Add a order to the tracked_orders table after verifying the wallet and fetching current price.
@@ -52,6 +92,7 @@ class OrderManager:
             balance (float): Amount of the order to be added.
             token_value: value of the token
             slippage: allowed slippage
+            fill: the buy that acquired the balance, if the order came from one
         """
 
         id = self.db.create_order(
@@ -62,7 +103,28 @@ class OrderManager:
             buy_in_value=token_value,
             balance=balance,
             slippage=slippage,
+            buy_signature=fill.signature if fill else None,
+            buy_input_amount=fill.input_amount if fill else None,
         )
+        if id is not None and self.book.loaded:
+            self.book.add(
+                Order(
+                    id=id,
+                    mint_address=mint_address,
+                    last_price_max=token_value,
+                    sell_mode=sell_mode,
+                    sell_value=sell_value,
+                    sell_type=sell_type,
+                    time_added=datetime.now(timezone.utc),
+                    balance=balance,
+                    status=OrderStatus.ACTIVE,
+                    profit=None,
+                    slippage=slippage,
+                    buy_signature=fill.signature if fill else None,
+                    buy_input_amount=fill.input_amount if fill else None,
+                )
+            )
+        self._notify_change()
 
         return id
 
@@ -73,14 +135,36 @@ class OrderManager:
         Args:
             id: id of the order
         """
-        active_orders = self.db.get_orders(OrderStatus.ACTIVE)
+        order = self.db.get_order(id)
 
-        order = next((c for c in active_orders if c.id == id), None)
-
-        if not order:
+        if not order or order.status != OrderStatus.ACTIVE:
             raise TokenNotFoundError(f"No active order found with Id '{id}'.")
 
-        self.db.set_order_status(id, OrderStatus.CANCELED)
+        self.set_order_status(id, OrderStatus.CANCELED)
+        self._notify_change()
+
+    def set_order_status(self, id: str, status: OrderStatus) -> None:
+        self.db.set_order_status(id, status)
+        self.book.set_status(id, status)
+
+    def complete_order(
+        self, id: str, profit: str = None, fill: Optional[SwapFill] = None
+    ) -> None:
+        self.db.complete_order(
+            id,
+            profit,
+            sell_signature=fill.signature if fill else None,
+            sell_output_amount=fill.output_amount if fill else None,
+        )
+        self.book.remove(id)
+
+    def sync_orders(self) -> None:
+        """Picks up orders created, canceled or finished by another process."""
+        self.book.sync(self.db)
+
+    def flush_orders(self) -> int:
+        """Persists the price highs recorded since the last flush."""
+        return self.book.flush(self.db)
 
     def get_remaining_trackable_balance(self, mint_address: str, total_balance: float):
         """
@@ -97,47 +181,116 @@ class OrderManager:
         return remaining_balance
 
     async def process_orders(self) -> None:
-        active_orders = self.db.get_orders(OrderStatus.ACTIVE)
-        tasks = []
-
-        for order in active_orders:
-            current_value = await self.jupiter.fetch_token_value(order.mint_address)
-
-            if order.sell_mode == SellMode.TIME_BASED:
-                elapsed_time = datetime.now(timezone.utc) - order.time_added
-                if elapsed_time >= timedelta(minutes=order.sell_value):
-                    self.db.set_order_status(order.id, OrderStatus.PROCESSING)
-                    print(f"Sell {order.mint_address}: Time-based trigger reached.")
-                    await self.sell_order(order)
-                elif current_value > order.last_price_max:
-                    self.db.update_order_last_price(order.id, current_value)
-
-            elif order.sell_mode == SellMode.STOP_LOSS:
-                if current_value > order.last_price_max:
-                    self.db.update_order_last_price(order.id, current_value)
-                else:
-                    decrease_percentage = (
-                        (order.last_price_max - current_value) / order.last_price_max
-                    ) * 100
-                    if decrease_percentage >= order.sell_value:
-                        print(
-                            f"Sell condition detected for {order.mint_address}: Starting monitoring..."
-                        )
-                        self.db.set_order_status(order.id, OrderStatus.PROCESSING)
-                        tasks.append(asyncio.create_task(self.determine_sell(order)))
-
-        # Wait for all stop-loss tasks to finish
-        await asyncio.gather(*tasks)
+        self.book.load(self.db)
+        active_orders = self.book.active_orders()
+
+        # Keep the price engine refreshing exactly the mints we hold orders for
+        self.prices.set_watchlist(
+            "orders", (order.mint_address for order in active_orders)
+        )
+        if not active_orders:
+            return
+
+        # Price every mint once per tick instead of once per order. Mints missing
+        # from the batch are retried individually inside their own evaluation so a
+        # slow mint only holds up the orders that depend on it.
+        prices = await self.prices.get_prices(
+            (order.mint_address for order in active_orders), fallback=False
+        )
+
+        async def evaluate(order: Order) -> None:
+            async with self.evaluation_semaphore:
+                try:
+                    current_value = prices.get(order.mint_address)
+                    if current_value is None:
+                        try:
+                            # Concurrent lookups of the same mint share one fetch
+                            current_value = await self.prices.get_price(
+                                order.mint_address
+                            )
+                        except Exception as e:
+                            print(f"No price for {order.mint_address}: {e}")
+
+                    self.evaluate_order(order, current_value)
+                except Exception as e:
+                    print(f"Error evaluating order {order.id}: {e}")
+
+        # Triggered sells run detached so one slow swap does not hold up the tick
+        await asyncio.gather(*(evaluate(order) for order in active_orders))
+
+    def _start_sell(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._sell_tasks.add(task)
+        task.add_done_callback(self._sell_done)
+        return task
+
+    def _sell_done(self, task: asyncio.Task) -> None:
+        self._sell_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error selling order: {task.exception()}")
+
+    async def wait_for_sells(self) -> None:
+        """Waits for every sell that is still in flight."""
+        while self._sell_tasks:
+            await asyncio.gather(*self._sell_tasks, return_exceptions=True)
+
+    def evaluate_order(
+        self, order: Order, current_value: Optional[float]
+    ) -> Optional[asyncio.Task]:
+        """
+        Check a single order against its sell condition.
+
+        Args:
+            order: the active order
+            current_value: the current USD price of the order's token, None if unknown
+
+        Returns:
+            The task selling (or monitoring) the order if a sell was triggered.
+        """
+        if order.sell_mode == SellMode.TIME_BASED:
+            elapsed_time = datetime.now(timezone.utc) - order.time_added
+            if elapsed_time >= timedelta(minutes=order.sell_value):
+                self.set_order_status(order.id, OrderStatus.PROCESSING)
+                print(f"Sell {order.mint_address}: Time-based trigger reached.")
+                return self._start_sell(self.sell_order(order))
+            elif current_value is not None and current_value > order.last_price_max:
+                self.book.update_last_price(order.id, current_value)
+
+        elif current_value is None:
+            print(f"No price for {order.mint_address}, skipping order {order.id}.")
+
+        elif order.sell_mode == SellMode.STOP_LOSS:
+            if current_value > order.last_price_max:
+                self.book.update_last_price(order.id, current_value)
+            else:
+                decrease_percentage = (
+                    (order.last_price_max - current_value) / order.last_price_max
+                ) * 100
+                if decrease_percentage >= order.sell_value:
+                    print(
+                        f"Sell condition detected for {order.mint_address}: Starting monitoring..."
+                    )
+                    self.set_order_status(order.id, OrderStatus.PROCESSING)
+                    return self._start_sell(self.determine_sell(order))
+
+        return None
 
     async def determine_sell(self, order: Order, interval: int = 10) -> None:
         """
         Monitor the order's value for the given interval (in seconds) to confirm or cancel a sell decision.
         If the decrease percentage meets or exceeds the order's sell_value consistently, finalize the sell.
         """
+        # Confirmation holds a sell slot, so at most sell_concurrency orders are
+        # watched or sold at once
+        async with self.sell_semaphore:
+            await self._determine_sell(order, interval)
+
+    async def _determine_sell(self, order: Order, interval: int) -> None:
         decrease_threshold_met = True
 
         for _ in range(interval):
-            current_value = await self.jupiter.fetch_token_value(order.mint_address)
+            # Confirmation samples once a second, so never accept an older price
+            current_value = await self.prices.get_price(order.mint_address, max_age=1)
             decrease_percentage = (
                 (order.last_price_max - current_value) / order.last_price_max
             ) * 100
@@ -152,14 +305,19 @@ class OrderManager:
             await asyncio.sleep(1)
 
         if decrease_threshold_met:
-            await self.sell_order(order)
+            await self._sell_order(order)
         else:
             print(
                 f"Sell condition revoked for {order.mint_address}. Reactivating tracking."
             )
-            self.db.set_order_status(order.id, OrderStatus.ACTIVE)
+            self.set_order_status(order.id, OrderStatus.ACTIVE)
 
     async def sell_order(self, order: Order):
+        # Bound the number of swaps in flight; waiting sells do not hold up checks
+        async with self.sell_semaphore:
+            await self._sell_order(order)
+
+    async def _sell_order(self, order: Order):
         sell_address = None
 
         if order.sell_type == SellType.SOL:
@@ -167,10 +325,10 @@ class OrderManager:
         elif order.sell_type == SellType.USDC:
             sell_address = USDC_MINT_ADDRESS
 
-        amount = None
+        fill = None
         for attempt in range(5):  # Try to sell the order with multiple attempts
             try:
-                amount = await self.jupiter.swap_tokens(
+                fill = await self.jupiter.swap_tokens(
                     order.mint_address,
                     sell_address,
                     order.balance - int(attempt),
@@ -178,22 +336,35 @@ class OrderManager:
                     order.slippage,
                 )
                 break  # Exit loop if successful
+            except SwapNotSettledError as e:
+                # The swap may still land, sending it again could sell twice
+                try:
+                    fill = await self.jupiter.settle_swap(
+                        e, self.wallet, order.mint_address, sell_address
+                    )
+                except SwapNotSettledError as settle_error:
+                    print(
+                        f"Order {order.id} left processing, its sell is unresolved: {settle_error}"
+                    )
+                    return
+                if fill is not None:
+                    break
+                print(f"Attempt {attempt + 1} did not land for order {order.id}: {e}")
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed for order {order.id}: {e}")
                 await asyncio.sleep(1)  # wait before retrying
 
-        if amount is None:
+        if fill is None:
             print(
                 f"All attempts to sell order {order.id} failed. Reactivating tracking."
             )
-            self.db.set_order_status(order.id, OrderStatus.ACTIVE)
+            self.set_order_status(order.id, OrderStatus.ACTIVE)
             return
 
         try:
-            final_balance = 0 if amount is None else float(amount)
-            profit = final_balance * await self.jupiter.fetch_token_value(sell_address)
-            self.db.complete_order(order.id, profit)
+            profit = fill.output_amount * await self.prices.get_price(sell_address)
+            self.complete_order(order.id, profit, fill)
         except Exception as e:
-            self.db.complete_order(order.id)
+            self.complete_order(order.id, fill=fill)
             print(f"There was an error getting the profit for {order.id}.")
             raise e
@@ -0,0 +1,138 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import Optional
+
+from alphasignal.apis.http_transport import close_http_transport
+from alphasignal.apis.solana.solana_client import close_solana_client
+from alphasignal.database.connection import connection_manager
+from alphasignal.services.order_manager import OrderManager
+from alphasignal.services.price_engine import get_price_engine
+
+
+class OrderProcessor:
+    """
+    Runs OrderManager.process_orders on a single long-lived event loop.
+
+    A tick runs every `tick_interval` seconds, or immediately when an order is
+    created or canceled, either through an OrderManager in this process or by
+    another process (the API) writing to the database.
+    """
+
+    def __init__(
+        self,
+        order_manager: Optional[OrderManager] = None,
+        tick_interval: Optional[float] = None,
+        change_poll_interval: Optional[float] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self.order_manager = order_manager or OrderManager()
+        self.tick_interval = tick_interval or float(
+            os.getenv("ORDER_PROCESS_INTERVAL_SECONDS", "5")
+        )
+        self.change_poll_interval = change_poll_interval or float(
+            os.getenv("ORDER_CHANGE_POLL_SECONDS", "0.5")
+        )
+        self.flush_interval = flush_interval or float(
+            os.getenv("ORDER_FLUSH_INTERVAL_SECONDS", "10")
+        )
+        self._external_change = False
+        self._last_flush = 0.0
+        self._wake_event: Optional[asyncio.Event] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self.ticks = 0
+        self.overruns = 0
+
+    def wake(self) -> None:
+        """Runs the next tick now instead of waiting out the interval."""
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def stop(self) -> None:
+        """Lets the current tick finish, then exits run()."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self.wake()
+
+    async def _watch_external_changes(self) -> None:
+        # data_version only moves when another connection commits, so writes made
+        # by this processor's own connection never wake it
+        db = self.order_manager.db
+        version = db.get_data_version()
+        while True:
+            await asyncio.sleep(self.change_poll_interval)
+            try:
+                current = db.get_data_version()
+            except Exception as e:
+                print(f"Error polling for order changes: {e}", flush=True)
+                continue
+            if current != version:
+                version = current
+                self._external_change = True
+                self.wake()
+
+    async def _tick(self) -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            if self._external_change:
+                self._external_change = False
+                self.order_manager.sync_orders()
+            await self.order_manager.process_orders()
+        except Exception as e:
+            print(f"Error processing orders: {e}", flush=True)
+        if started - self._last_flush >= self.flush_interval:
+            self._flush()
+            self._last_flush = started
+        elapsed = loop.time() - started
+        self.ticks += 1
+        if elapsed > self.tick_interval:
+            self.overruns += 1
+            print(
+                f"Order processing tick overran: took {elapsed:.2f}s, "
+                f"interval is {self.tick_interval:.2f}s ({self.overruns} overruns)",
+                flush=True,
+            )
+        return elapsed
+
+    def _flush(self) -> None:
+        try:
+            self.order_manager.flush_orders()
+        except Exception as e:
+            print(f"Error flushing order prices: {e}", flush=True)
+
+    async def run(self) -> None:
+        self._wake_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        price_engine = get_price_engine()
+        price_engine.start()
+        OrderManager.add_change_listener(self.wake)
+        watcher = asyncio.create_task(self._watch_external_changes())
+        print(f"Order processor started: {datetime.now():%H:%M:%S}", flush=True)
+
+        try:
+            while not self._stop_event.is_set():
+                self._wake_event.clear()
+                elapsed = await self._tick()
+                try:
+                    await asyncio.wait_for(
+                        self._wake_event.wait(),
+                        timeout=max(0.0, self.tick_interval - elapsed),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Let sells that were already sent finish before the clients close
+            await self.order_manager.wait_for_sells()
+            self._flush()
+            OrderManager.remove_change_listener(self.wake)
+            watcher.cancel()
+            try:
+                await watcher
+            except asyncio.CancelledError:
+                pass
+            await price_engine.stop()
+            await close_http_transport()
+            await close_solana_client()
+            connection_manager.close_thread_connections()
+            print(f"Order processor stopped: {datetime.now():%H:%M:%S}", flush=True)
@@ -0,0 +1,220 @@
+import asyncio
+import os
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from alphasignal.apis.jupiter.jupiter_client import JupiterClient
+from alphasignal.models.price_point import PricePoint
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+PriceCallback = Callable[[PricePoint], None]
+
+
+class PriceEngine:
+    """
+    In-process source of truth for token prices.
+
+    Keeps the latest price of every mint with a timestamp, serves it while it is
+    younger than the TTL, and coalesces concurrent fetches of the same mint. A
+    background loop refreshes only the mints that are watched or subscribed to.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        refresh_interval: Optional[float] = None,
+    ):
+        self.ttl = ttl or float(os.getenv("PRICE_TTL_SECONDS", "5"))
+        self.refresh_interval = refresh_interval or float(
+            os.getenv("PRICE_REFRESH_INTERVAL_SECONDS", "2")
+        )
+        self.jupiter = JupiterClient()
+        self._prices: Dict[str, PricePoint] = {}
+        self._watchlists: Dict[str, Set[str]] = {}
+        self._subscribers: Dict[str, List[PriceCallback]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _is_fresh(self, point: Optional[PricePoint], max_age: Optional[float]) -> bool:
+        if point is None:
+            return False
+        max_age = self.ttl if max_age is None else max_age
+        return time.time() - point.updated_at <= max_age
+
+    def peek(
+        self, mint_address: str, max_age: Optional[float] = None
+    ) -> Optional[float]:
+        """Returns the cached price if it is fresh, without fetching."""
+        point = self._prices.get(mint_address)
+        return point.price if self._is_fresh(point, max_age) else None
+
+    def update(self, mint_address: str, price: float, source: str = "jupiter") -> None:
+        """Records a price and notifies the mint's subscribers."""
+        point = PricePoint(
+            mint_address=mint_address,
+            price=float(price),
+            updated_at=time.time(),
+            source=source,
+        )
+        self._prices[mint_address] = point
+        for callback in list(self._subscribers.get(mint_address, [])):
+            try:
+                callback(point)
+            except Exception as e:
+                logger.error(f"Price subscriber for {mint_address} failed: {e}")
+
+    async def get_prices(
+        self,
+        mint_addresses: Iterable[str],
+        max_age: Optional[float] = None,
+        fallback: bool = True,
+    ) -> Dict[str, float]:
+        """
+        Returns USD prices for the given mints, fetching only the stale ones.
+
+        Args:
+            mint_addresses: mint addresses of the tokens
+            max_age: maximum age in seconds of a cached price (default: the TTL)
+            fallback: quote mints missing from the batched price fetch individually
+
+        Returns:
+            Dict[str, float]: mapping of mint address to price, unpriceable mints omitted
+        """
+        mints = list(dict.fromkeys(mint_addresses))
+        prices = {}
+        waiting = {}
+        to_fetch = []
+        for mint in mints:
+            price = self.peek(mint, max_age)
+            if price is not None:
+                prices[mint] = price
+            elif mint in self._inflight:
+                waiting[mint] = self._inflight[mint]
+            else:
+                to_fetch.append(mint)
+
+        if to_fetch:
+            loop = asyncio.get_running_loop()
+            futures = {mint: loop.create_future() for mint in to_fetch}
+            self._inflight.update(futures)
+            try:
+                fetched = await self.jupiter.fetch_token_values(
+                    to_fetch, fallback=fallback
+                )
+                for mint, price in fetched.items():
+                    self.update(mint, price)
+                for mint, future in futures.items():
+                    future.set_result(fetched.get(mint))
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                    # Callers waiting on the same fetch see the error, mark it retrieved
+                    future.exception()
+                raise
+            finally:
+                for mint, future in futures.items():
+                    if not future.done():
+                        future.cancel()
+                    if self._inflight.get(mint) is future:
+                        del self._inflight[mint]
+            prices.update(fetched)
+
+        for mint, future in waiting.items():
+            try:
+                price = await future
+            except Exception as e:
+                logger.error(f"Unable to fetch price for {mint}: {e}")
+                continue
+            if price is not None:
+                prices[mint] = price
+
+        return prices
+
+    async def get_price(
+        self, mint_address: str, max_age: Optional[float] = None
+    ) -> float:
+        """Returns the USD price of a single mint, raising if it cannot be priced."""
+        prices = await self.get_prices([mint_address], max_age)
+        if mint_address not in prices:
+            raise Exception(f"Unable to fetch price for mint address: {mint_address}")
+        return prices[mint_address]
+
+    def set_watchlist(self, owner: str, mint_addresses: Iterable[str]) -> None:
+        """Replaces the set of mints an owner wants kept fresh."""
+        self._watchlists[owner] = set(mint_addresses)
+
+    def subscribe(
+        self, mint_address: str, callback: PriceCallback
+    ) -> Callable[[], None]:
+        """
+        Calls `callback` with every new price of the mint and keeps it refreshed.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        self._subscribers.setdefault(mint_address, []).append(callback)
+
+        def unsubscribe() -> None:
+            callbacks = self._subscribers.get(mint_address, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._subscribers.pop(mint_address, None)
+
+        return unsubscribe
+
+    def watched_mints(self) -> Set[str]:
+        watched = set(self._subscribers)
+        for mints in self._watchlists.values():
+            watched |= mints
+        return watched
+
+    async def refresh(self) -> None:
+        """Refreshes every watched mint whose price is older than the refresh interval."""
+        stale = [
+            mint
+            for mint in self.watched_mints()
+            if not self._is_fresh(self._prices.get(mint), self.refresh_interval)
+        ]
+        if stale:
+            await self.get_prices(stale, max_age=self.refresh_interval)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing prices: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Starts the background refresh loop on the running event loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_price_engine: Optional[PriceEngine] = None
+
+
+def get_price_engine() -> PriceEngine:
+    """Return the process wide PriceEngine, creating it on first use."""
+    global _price_engine
+    if _price_engine is None:
+        _price_engine = PriceEngine()
+    return _price_engine
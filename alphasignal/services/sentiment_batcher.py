@@ -0,0 +1,116 @@
+import asyncio
+import os
+import logging
+from typing import List, Optional, Set, Tuple
+
+from alphasignal.ai.models.sentiment_response import SentimentResponse
+from alphasignal.models.token_info import TokenInfo
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+PendingRequest = Tuple[str, List[TokenInfo], asyncio.Future]
+
+
+class SentimentBatcher:
+    """
+    Collects classification requests for a short window and sends them to the
+    LLM as one multi-tweet prompt, so a burst of tweets shares one prompt and
+    schema instead of paying for them per tweet.
+
+    A batch whose output cannot be parsed or does not cover every tweet is
+    retried as individual calls.
+    """
+
+    def __init__(self, window: Optional[float] = None, max_size: Optional[int] = None):
+        self.window = (
+            window
+            if window is not None
+            else float(os.getenv("SENTIMENT_BATCH_WINDOW_MS", "250")) / 1000
+        )
+        self.max_size = max_size or int(os.getenv("SENTIMENT_BATCH_MAX_SIZE", "8"))
+        self._pending: List[PendingRequest] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.fallbacks = 0
+
+    async def classify(
+        self, tweet_text: str, tokens: List[TokenInfo]
+    ) -> SentimentResponse:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((tweet_text, tokens, future))
+        if len(self._pending) >= self.max_size:
+            self._schedule_flush(0)
+        elif self._flush_handle is None:
+            self._schedule_flush(self.window)
+        return await future
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_flush
+        )
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush())
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self) -> None:
+        self._flush_handle = None
+        pending = self._pending[: self.max_size]
+        self._pending = self._pending[self.max_size :]
+        if self._pending:
+            full = len(self._pending) >= self.max_size
+            self._schedule_flush(0 if full else self.window)
+        if not pending:
+            return
+
+        # langchain is imported on first use to keep startup fast
+        from alphasignal.ai.chains.twitter_chains import (
+            get_batch_tweet_sentiment,
+            get_tweet_sentiment,
+        )
+
+        if len(pending) > 1:
+            try:
+                results = await get_batch_tweet_sentiment(
+                    [(text, tokens) for text, tokens, _ in pending]
+                )
+                self.batches += 1
+                for (_, _, future), result in zip(pending, results):
+                    if not future.done():
+                        future.set_result(result)
+                return
+            except Exception as e:
+                self.fallbacks += 1
+                logger.error(
+                    f"Batch classification of {len(pending)} tweets failed, "
+                    f"falling back to single calls: {e}"
+                )
+
+        async def classify_single(text, tokens, future) -> None:
+            try:
+                result = await get_tweet_sentiment(text, tokens)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+
+        await asyncio.gather(*(classify_single(*request) for request in pending))
+
+
+_sentiment_batcher: Optional[SentimentBatcher] = None
+
+
+def get_sentiment_batcher() -> SentimentBatcher:
+    """Return the process wide SentimentBatcher, creating it on first use."""
+    global _sentiment_batcher
+    if _sentiment_batcher is None:
+        _sentiment_batcher = SentimentBatcher()
+    return _sentiment_batcher
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import List, Optional
+
+from alphasignal.ai.models.sentiment_response import SentimentResponse
+from alphasignal.database.db import SQLiteDB
+from alphasignal.models.token_info import TokenInfo
+from alphasignal.schemas.responses.sentiment_cache_stats_response import (
+    SentimentCacheStatsResponse,
+)
+from alphasignal.utils.lru_cache import LRUCache
+
+_RETWEET_PREFIX = re.compile(r"^rt @\w+:\s*")
+_URL = re.compile(r"https?://\S+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_tweet_text(text: str) -> str:
+    """Lowercases and drops what differs between copies of the same post."""
+    text = _RETWEET_PREFIX.sub("", text.strip().lower())
+    text = _URL.sub("", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def sentiment_cache_key(text: str, tokens: List[TokenInfo]) -> str:
+    token_keys = sorted(
+        token.mint_address or (token.ticker or "").lower() for token in tokens
+    )
+    content = normalize_tweet_text(text) + "\n" + ",".join(token_keys)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class SentimentCache:
+    """
+    Cache of LLM sentiment results keyed by normalized tweet text and tokens.
+
+    Lookups go through an in-memory LRU, then the sentiment_cache table, so
+    retweets and copy-pasted posts are classified once per TTL.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl or float(os.getenv("SENTIMENT_CACHE_TTL_SECONDS", "21600"))
+        self.db = SQLiteDB()
+        self._cache = LRUCache(
+            maxsize=maxsize or int(os.getenv("SENTIMENT_CACHE_SIZE", "2048"))
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, text: str, tokens: List[TokenInfo]) -> Optional[SentimentResponse]:
+        key = sentiment_cache_key(text, tokens)
+        entry = self._cache.get(key)
+        if entry is None:
+            stored = self.db.get_cached_sentiment(key)
+            if stored is not None:
+                entry = (SentimentResponse.model_validate_json(stored[0]), stored[1])
+                self._cache.set(key, entry)
+
+        if entry is not None and time.time() - entry[1] <= self.ttl:
+            self._count(hit=True)
+            # Callers fill in mint addresses on the tokens, hand out a copy
+            return entry[0].model_copy(deep=True)
+        self._count(hit=False)
+        return None
+
+    def set(
+        self, text: str, tokens: List[TokenInfo], response: SentimentResponse
+    ) -> None:
+        key = sentiment_cache_key(text, tokens)
+        created_at = int(time.time())
+        self._cache.set(key, (response.model_copy(deep=True), created_at))
+        self.db.set_cached_sentiment(key, response.model_dump_json(), created_at)
+
+    def stats(self) -> SentimentCacheStatsResponse:
+        lookups = self.hits + self.misses
+        return SentimentCacheStatsResponse(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+            memory_entries=len(self._cache),
+        )
+
+
+_sentiment_cache: Optional[SentimentCache] = None
+
+
+def get_sentiment_cache() -> SentimentCache:
+    """Return the process wide SentimentCache, creating it on first use."""
+    global _sentiment_cache
+    if _sentiment_cache is None:
+        _sentiment_cache = SentimentCache()
+    return _sentiment_cache
@@ -1,5 +1,5 @@
 from alphasignal.apis.jupiter.jupiter_client import JupiterClient
-from alphasignal.apis.solana.solana_client import SolanaClient
+from alphasignal.apis.solana.solana_client import get_solana_client
 from alphasignal.database.db import SQLiteDB
 from alphasignal.models.wallet_token import WalletToken
 from alphasignal.schemas.responses.swap_confirmation_response import (
@@ -7,6 +7,7 @@ from alphasignal.schemas.responses.swap_confirmation_response import (
 )
 from alphasignal.models.token_value import TokenValue
 from alphasignal.schemas.responses.wallet_value_response import WalletValueResponse
+from alphasignal.services.price_engine import get_price_engine
 from alphasignal.services.wallet_manager import WalletManager
 
 import logging
@@ -36,7 +37,7 @@ async def fund(amt, wallet, funding_key):
         in_amt = float(amt)
     except Exception as e:
         raise Exception("In amount must be float.")
-    solana_client = SolanaClient()
+    solana_client = get_solana_client()
     return await solana_client.fund_wallet(
         wallet.wallet.public_key, in_amt, funding_key
     )
@@ -47,8 +48,7 @@ def load_wallet():
 
 
 async def get_token_value(token_mint_address):
-    client = JupiterClient()
-    price = await client.fetch_token_value(token_mint_address)
+    price = await get_price_engine().get_price(token_mint_address)
     return TokenValue(token_mint_address=token_mint_address, price=price)
 
 
@@ -62,12 +62,12 @@ async def get_swap_quote(from_token, to_token, amt):
 async def swap_tokens(from_token, to_token, amt, wallet_manager):
     client = JupiterClient()
 
-    amount = await client.swap_tokens(from_token, to_token, amt, wallet_manager)
+    fill = await client.swap_tokens(from_token, to_token, amt, wallet_manager)
 
     return SwapConfirmationResponse(
         from_token_mint_address=from_token,
         to_token_mint_address=to_token,
-        amount=str(amount),
+        amount=str(fill.output_amount),
     )
 
 
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+import zlib
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, List, Optional
+
+from alphasignal.models.queued_signal import QueuedSignal
+from alphasignal.schemas.responses.signal_queue_stats_response import (
+    SignalQueueStatsResponse,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+SignalHandler = Callable[[Any], Awaitable[Any]]
+
+# Wait times of the most recent signals kept for the stats
+WAIT_SAMPLES = 200
+
+
+class SignalQueue:
+    """
+    Decouples webhook ingestion from signal processing.
+
+    Signals are sharded over a fixed pool of workers by profile, so a burst is
+    processed concurrently while signals from one profile keep their order.
+    Signals older than the freshness deadline are dropped. Age counts from when
+    the signal was created if the caller knows it, otherwise from submission.
+    """
+
+    def __init__(
+        self,
+        handler: SignalHandler,
+        workers: Optional[int] = None,
+        max_age: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.handler = handler
+        self.clock = clock
+        self.workers = workers or int(os.getenv("SIGNAL_WORKERS", "4"))
+        self.max_age = max_age or float(os.getenv("SIGNAL_MAX_AGE_SECONDS", "30"))
+        self.maxsize = maxsize or int(os.getenv("SIGNAL_QUEUE_MAXSIZE", "1000"))
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self.in_flight = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped_stale = 0
+
+    def _shard(self, profile_key: str) -> asyncio.Queue:
+        # crc32 is stable across processes, unlike hash() on str
+        index = zlib.crc32(profile_key.encode()) % len(self._queues)
+        return self._queues[index]
+
+    def depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    def submit(
+        self, profile_key: str, payload: Any, received_at: Optional[float] = None
+    ) -> bool:
+        """
+        Enqueues a signal for processing.
+
+        Args:
+            received_at: epoch seconds the signal was created at its source,
+                defaults to now
+
+        Returns:
+            bool: False if the queue is full or not running
+        """
+        if not self._queues or self.depth() >= self.maxsize:
+            self.rejected += 1
+            return False
+        now = self.clock()
+        # A source clock running ahead must not make the signal look fresher
+        received_at = now if received_at is None else min(received_at, now)
+        self._shard(profile_key).put_nowait(
+            QueuedSignal(
+                profile_key=profile_key, payload=payload, received_at=received_at
+            )
+        )
+        self.accepted += 1
+        return True
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            signal = await queue.get()
+            try:
+                waited = self.clock() - signal.received_at
+                self._waits.append(waited)
+                if waited > self.max_age:
+                    self.dropped_stale += 1
+                    logger.warning(
+                        f"Dropping signal from {signal.profile_key}, "
+                        f"{waited:.1f}s old (deadline {self.max_age}s)"
+                    )
+                    continue
+                self.in_flight += 1
+                try:
+                    await self.handler(signal.payload)
+                    self.processed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.error(
+                        f"Error processing signal from {signal.profile_key}: {e}"
+                    )
+                finally:
+                    self.in_flight -= 1
+            finally:
+                queue.task_done()
+
+    def start(self) -> None:
+        """Starts the worker pool on the running event loop."""
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue() for _ in range(self.workers)]
+        self._tasks = [
+            asyncio.create_task(self._worker(queue)) for queue in self._queues
+        ]
+
+    async def join(self) -> None:
+        """Waits until every queued signal has been handled."""
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    async def stop(self) -> None:
+        tasks = self._tasks
+        self._tasks = []
+        self._queues = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> SignalQueueStatsResponse:
+        waits = list(self._waits)
+        return SignalQueueStatsResponse(
+            workers=self.workers,
+            depth=self.depth(),
+            in_flight=self.in_flight,
+            accepted=self.accepted,
+            rejected=self.rejected,
+            processed=self.processed,
+            failed=self.failed,
+            dropped_stale=self.dropped_stale,
+            avg_wait_seconds=sum(waits) / len(waits) if waits else 0.0,
+            max_wait_seconds=max(waits, default=0.0),
+        )
@@ -0,0 +1,229 @@
+import asyncio
+import itertools
+import os
+import logging
+from typing import Dict, Optional
+
+from solana.rpc.core import _COMMITMENT_TO_SOLDERS
+from solana.rpc.websocket_api import SubscriptionError, connect
+from solders.rpc.config import RpcSignatureSubscribeConfig
+from solders.rpc.requests import SignatureSubscribe
+from solders.rpc.responses import SignatureNotification, SubscriptionResult
+from solders.signature import Signature
+from solders.transaction_status import TransactionStatus
+
+from alphasignal.apis.solana.solana_client import get_solana_client
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+# Ordered like solders' TransactionConfirmationStatus
+COMMITMENT_LEVELS = ["processed", "confirmed", "finalized"]
+
+
+class SignatureConfirmationError(Exception):
+    """Raised when a transaction failed or was not confirmed in time."""
+
+    pass
+
+
+class TransactionFailedError(SignatureConfirmationError):
+    """Raised when a transaction landed with an error, so it had no effect."""
+
+    pass
+
+
+class SignatureConfirmer:
+    """
+    Waits for sent transactions to reach a commitment level.
+
+    Every pending signature is watched through one shared signatureSubscribe
+    websocket, so a waiter wakes up as soon as its transaction confirms. A
+    getSignatureStatuses poller covering all pending signatures runs next to it
+    and takes over when the websocket is unavailable. Both stop once nothing
+    is pending.
+    """
+
+    def __init__(
+        self,
+        commitment: Optional[str] = None,
+        timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        ws_url: Optional[str] = None,
+    ):
+        self.commitment = commitment or os.getenv("SIGNATURE_COMMITMENT", "confirmed")
+        if self.commitment not in COMMITMENT_LEVELS:
+            raise ValueError(f"Invalid commitment level: {self.commitment}")
+        self.timeout = timeout or float(
+            os.getenv("SIGNATURE_CONFIRM_TIMEOUT_SECONDS", "60")
+        )
+        self.poll_interval = poll_interval or float(
+            os.getenv("SIGNATURE_POLL_INTERVAL_SECONDS", "2")
+        )
+        self.ws_url = ws_url
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._ws = None
+        self._ws_task: Optional[asyncio.Task] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._request_ids = itertools.count(1)
+        self._requests: Dict[int, str] = {}  # request id -> signature
+        self._subscriptions: Dict[int, str] = {}  # subscription id -> signature
+
+    def _resolve(self, signature: str, err) -> None:
+        future = self._waiters.pop(signature, None)
+        if future is None or future.done():
+            return
+        if err is None:
+            future.set_result(None)
+        else:
+            future.set_exception(
+                TransactionFailedError(f"Transaction {signature} failed: {err}")
+            )
+
+    def is_confirmed(self, status: TransactionStatus) -> bool:
+        """Returns whether the status reached the configured commitment level."""
+        # Nodes leave confirmationStatus out for rooted transactions
+        if status.confirmation_status is None:
+            return status.confirmations is None
+        return int(status.confirmation_status) >= COMMITMENT_LEVELS.index(
+            self.commitment
+        )
+
+    async def _subscribe(self, ws, signature: str) -> None:
+        request_id = next(self._request_ids)
+        self._requests[request_id] = signature
+        config = RpcSignatureSubscribeConfig(
+            commitment=_COMMITMENT_TO_SOLDERS[self.commitment]
+        )
+        await ws.send_data(
+            SignatureSubscribe(Signature.from_string(signature), config, request_id)
+        )
+
+    def _handle_message(self, message) -> None:
+        if isinstance(message, SubscriptionResult):
+            signature = self._requests.pop(message.id, None)
+            if signature is not None:
+                self._subscriptions[message.result] = signature
+        elif isinstance(message, SignatureNotification):
+            signature = self._subscriptions.pop(message.subscription, None)
+            if signature is not None:
+                self._resolve(signature, message.result.value.err)
+
+    async def _run_websocket(self) -> None:
+        url = self.ws_url or get_solana_client().solana_ws_url
+        while self._waiters:
+            try:
+                async with connect(url) as ws:
+                    self._ws = ws
+                    for signature in list(self._waiters):
+                        await self._subscribe(ws, signature)
+                    while self._waiters:
+                        try:
+                            # Wakes up regularly to notice that nothing is pending
+                            messages = await asyncio.wait_for(
+                                ws.recv(), self.poll_interval
+                            )
+                        except asyncio.TimeoutError:
+                            continue
+                        except SubscriptionError as e:
+                            logger.error(f"Signature subscription failed: {e}")
+                            continue
+                        for message in messages:
+                            self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Signature websocket failed, polling statuses: {e}")
+                await asyncio.sleep(self.poll_interval)
+            finally:
+                self._ws = None
+                self._requests.clear()
+                self._subscriptions.clear()
+
+    async def _run_poller(self) -> None:
+        while self._waiters:
+            await asyncio.sleep(self.poll_interval)
+            signatures = list(self._waiters)
+            if not signatures:
+                break
+            try:
+                statuses = await get_solana_client().get_signature_statuses(signatures)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error polling signature statuses: {e}")
+                continue
+            for signature, status in zip(signatures, statuses):
+                if status is None:
+                    continue
+                if status.err is not None:
+                    self._resolve(signature, status.err)
+                elif self.is_confirmed(status):
+                    self._resolve(signature, None)
+
+    def _ensure_running(self) -> None:
+        if self._ws_task is None or self._ws_task.done():
+            self._ws_task = asyncio.create_task(self._run_websocket())
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._run_poller())
+
+    async def confirm(self, signature, timeout: Optional[float] = None) -> None:
+        """
+        Waits until the transaction reaches the configured commitment level.
+
+        Args:
+            signature: the transaction signature
+            timeout: seconds to wait before giving up (default: the configured timeout)
+
+        Raises:
+            SignatureConfirmationError: if the transaction failed or timed out
+        """
+        signature = str(signature)
+        timeout = timeout or self.timeout
+        future = self._waiters.get(signature)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[signature] = future
+            if self._ws is not None:
+                try:
+                    await self._subscribe(self._ws, signature)
+                except Exception as e:
+                    logger.error(f"Unable to subscribe to {signature}: {e}")
+            self._ensure_running()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if self._waiters.get(signature) is future:
+                del self._waiters[signature]
+                future.cancel()
+            raise SignatureConfirmationError(
+                f"Transaction {signature} was not confirmed within {timeout}s"
+            )
+
+    async def close(self) -> None:
+        """Stops watching and cancels every pending waiter."""
+        for future in self._waiters.values():
+            future.cancel()
+        self._waiters.clear()
+        tasks = [t for t in (self._ws_task, self._poll_task) if t is not None]
+        self._ws_task = None
+        self._poll_task = None
+        for task in tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_signature_confirmer: Optional[SignatureConfirmer] = None
+
+
+def get_signature_confirmer() -> SignatureConfirmer:
+    """Return the process wide SignatureConfirmer, creating it on first use."""
+    global _signature_confirmer
+    if _signature_confirmer is None:
+        _signature_confirmer = SignatureConfirmer()
+    return _signature_confirmer
@@ -0,0 +1,130 @@
+import os
+import time
+import logging
+from typing import Optional
+
+from alphasignal.apis.dexscreener.dexscreener_client import (
+    DexscreenerClient,
+    NoPairsFoundError,
+)
+from alphasignal.database.db import SQLiteDB
+from alphasignal.models.ticker_resolution import TickerResolution
+from alphasignal.utils.lru_cache import LRUCache
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+
+def normalize_ticker(ticker: str) -> str:
+    return ticker[1:] if ticker.startswith("$") else ticker
+
+
+class TickerResolver:
+    """
+    Resolves tickers to mint addresses through a memory map backed by the
+    ticker_resolutions table, searching Dexscreener only on a miss.
+
+    Tickers that do not resolve are cached for a shorter negative TTL. Pinned
+    tickers never expire and are never searched.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+    ):
+        self.ttl = ttl or float(os.getenv("TICKER_CACHE_TTL_SECONDS", "3600"))
+        self.negative_ttl = negative_ttl or float(
+            os.getenv("TICKER_NEGATIVE_TTL_SECONDS", "300")
+        )
+        self.db = SQLiteDB()
+        self.dexscreener_client = DexscreenerClient()
+        self._cache = LRUCache(
+            maxsize=maxsize or int(os.getenv("TICKER_CACHE_SIZE", "4096"))
+        )
+
+    def _is_fresh(self, resolution: Optional[TickerResolution]) -> bool:
+        if resolution is None:
+            return False
+        if resolution.pinned:
+            return True
+        ttl = self.ttl if resolution.mint_address else self.negative_ttl
+        return time.time() - resolution.resolved_at <= ttl
+
+    def _store(self, resolution: TickerResolution) -> None:
+        self._cache.set(resolution.ticker, resolution)
+        self.db.set_ticker_resolution(resolution)
+
+    def lookup(self, ticker: str) -> Optional[TickerResolution]:
+        """Returns the fresh cached resolution of a ticker without searching."""
+        ticker = normalize_ticker(ticker)
+        resolution = self._cache.get(ticker)
+        if self._is_fresh(resolution):
+            return resolution
+        resolution = self.db.get_ticker_resolution(ticker)
+        if self._is_fresh(resolution):
+            self._cache.set(ticker, resolution)
+            return resolution
+        return None
+
+    async def resolve(self, ticker: str) -> Optional[str]:
+        """
+        Returns the mint address of a ticker, or None if it does not resolve.
+
+        Args:
+            ticker: the ticker, with or without a leading '$'
+        """
+        ticker = normalize_ticker(ticker)
+        resolution = self.lookup(ticker)
+        if resolution is not None:
+            return resolution.mint_address
+
+        try:
+            mint_address = await self.dexscreener_client.get_top_volume_mint_address(
+                ticker
+            )
+        except NoPairsFoundError:
+            # No matching pairs, remember the miss
+            mint_address = None
+        except Exception as e:
+            # Network errors and bad responses are not cached so the next
+            # mention retries
+            logger.error(f"Error resolving ticker {ticker}: {e}")
+            return None
+
+        self._store(
+            TickerResolution(
+                ticker=ticker, mint_address=mint_address, resolved_at=time.time()
+            )
+        )
+        return mint_address
+
+    def pin(self, ticker: str, mint_address: str) -> None:
+        """Pins a ticker to a mint address until it is unpinned."""
+        self._store(
+            TickerResolution(
+                ticker=normalize_ticker(ticker),
+                mint_address=mint_address,
+                resolved_at=time.time(),
+                pinned=True,
+            )
+        )
+
+    def unpin(self, ticker: str) -> None:
+        """Removes a ticker's resolution so the next mention searches again."""
+        ticker = normalize_ticker(ticker)
+        self._cache.pop(ticker)
+        self.db.delete_ticker_resolution(ticker)
+
+
+_ticker_resolver: Optional[TickerResolver] = None
+
+
+def get_ticker_resolver() -> TickerResolver:
+    """Return the process wide TickerResolver, creating it on first use."""
+    global _ticker_resolver
+    if _ticker_resolver is None:
+        _ticker_resolver = TickerResolver()
+    return _ticker_resolver
@@ -1,9 +1,16 @@
+import os
 import struct
+from typing import Dict, Iterable
 
-from alphasignal.apis.solana.solana_client import SolanaClient
+from alphasignal.apis.solana.solana_client import get_solana_client
+from alphasignal.database.db import SQLiteDB
 from alphasignal.models.mint_token import MintToken
 from solders.pubkey import Pubkey
 from alphasignal.models.constants import USDC_MINT_ADDRESS
+from alphasignal.utils.lru_cache import LRUCache
+
+# Decimals of a mint never change, so once known they are served from memory
+_decimals_cache = LRUCache(maxsize=int(os.getenv("TOKEN_DECIMALS_CACHE_SIZE", "4096")))
 
 
 class TokenManager:
@@ -15,9 +22,58 @@ class TokenManager:
 
     async def get_token_decimals(self):
         try:
-            solana_client = SolanaClient()
-            account_info = await solana_client.get_acc_info(self.token)
-
-            return struct.unpack_from("B", account_info.data, offset=44)[0]
+            decimals = await TokenManager.get_decimals([self.token.token_mint_address])
+            return decimals[self.token.token_mint_address]
         except Exception as e:
             raise Exception(f"Could not gather token decimals: {e}")
+
+    @staticmethod
+    async def get_decimals(mint_addresses: Iterable[str]) -> Dict[str, int]:
+        """
+        Returns the decimals for every given mint.
+
+        Lookups go through the in-memory LRU, then the token_info table, and any
+        mint still unknown is fetched in bulk with getMultipleAccounts and stored.
+
+        Args:
+            mint_addresses: mint addresses of the tokens
+
+        Returns:
+            Dict[str, int]: mapping of mint address to decimals
+        """
+        mints = list(dict.fromkeys(mint_addresses))
+        decimals = {}
+        for mint in mints:
+            cached = _decimals_cache.get(mint)
+            if cached is not None:
+                decimals[mint] = cached
+
+        missing = [m for m in mints if m not in decimals]
+        if not missing:
+            return decimals
+
+        db = SQLiteDB()
+        stored = db.get_token_decimals(missing)
+        for mint, value in stored.items():
+            _decimals_cache.set(mint, value)
+        decimals.update(stored)
+
+        missing = [m for m in missing if m not in decimals]
+        if not missing:
+            return decimals
+
+        accounts = await get_solana_client().get_multiple_acc_info(
+            [Pubkey.from_string(m) for m in missing]
+        )
+        fetched = {}
+        for mint, account in zip(missing, accounts):
+            if account is None:
+                raise Exception(f"Invalid or non-existent mint address: {mint}")
+            fetched[mint] = struct.unpack_from("B", account.data, offset=44)[0]
+
+        db.add_token_decimals(fetched)
+        for mint, value in fetched.items():
+            _decimals_cache.set(mint, value)
+        decimals.update(fetched)
+
+        return decimals
@@ -0,0 +1,154 @@
+import re
+import threading
+from collections import Counter
+from typing import List, Optional
+
+from alphasignal.ai.models.sentiment_response import SentimentResponse, TokenSentiment
+from alphasignal.models.configs import PrefilterConfig
+from alphasignal.models.constants import PREFILTER_CONFIG_PATH
+from alphasignal.models.enums import TweetType
+from alphasignal.models.prefilter_result import PrefilterResult
+from alphasignal.models.token_info import TokenInfo
+from alphasignal.schemas.responses.prefilter_stats_response import (
+    PrefilterStatsResponse,
+)
+from alphasignal.utils.utils import load_config
+
+_WORD = re.compile(r"[a-z0-9']+")
+# What a tweet that only mentions tokens may contain besides the mentions
+_FILLER = re.compile(r"(?:ca|contract|[\s\W_])*", re.IGNORECASE)
+
+
+def _contains_any(text: str, keywords: List[str]) -> bool:
+    words = set(_WORD.findall(text.lower()))
+    lowered = text.lower()
+    return any(
+        (kw.lower() in words) if " " not in kw else (kw.lower() in lowered)
+        for kw in keywords
+    )
+
+
+class TweetPrefilter:
+    """
+    Rule stage run before sentiment classification.
+
+    Drops tweets the bot would never trade on and removes base assets from the
+    token list, so only tweets that need judgement reach the LLM. Counts how
+    often each rule fired.
+    """
+
+    def __init__(self, config: Optional[PrefilterConfig] = None):
+        self.config = config or load_config(PREFILTER_CONFIG_PATH, PrefilterConfig)
+        self._lock = threading.Lock()
+        self.evaluated = 0
+        self.rule_counts: Counter = Counter()
+
+    def reload(self) -> None:
+        self.config = load_config(PREFILTER_CONFIG_PATH, PrefilterConfig)
+
+    def _result(self, rule: str, tokens=None, sentiment=None) -> PrefilterResult:
+        with self._lock:
+            self.rule_counts[rule] += 1
+        return PrefilterResult(tokens=tokens or [], sentiment=sentiment, rule=rule)
+
+    def _is_excluded(self, token: TokenInfo) -> bool:
+        if token.mint_address:
+            return token.mint_address in self.config.excluded_mints
+        ticker = (token.ticker or "").lstrip("$").upper()
+        return ticker in {t.upper() for t in self.config.excluded_tickers}
+
+    def _is_bare_mention(self, text: str, tokens: List[TokenInfo]) -> bool:
+        for token in tokens:
+            text = text.replace(token.mint_address or token.ticker or "", " ")
+        return _FILLER.fullmatch(text.strip()) is not None
+
+    def apply(
+        self,
+        username: str,
+        tweet_type: TweetType,
+        text: str,
+        tokens: List[TokenInfo],
+    ) -> PrefilterResult:
+        """
+        Runs the rules over a tweet that mentions at least one token.
+
+        Returns:
+            PrefilterResult: the tokens still to classify, or the rule that
+                dropped the tweet or decided its sentiment
+        """
+        with self._lock:
+            self.evaluated += 1
+        config = self.config
+        profile = next(
+            (
+                p
+                for name, p in config.profiles.items()
+                if name.lower() == username.lower()
+            ),
+            None,
+        )
+
+        tweet_types = (
+            profile.tweet_types
+            if profile and profile.tweet_types is not None
+            else config.tweet_types
+        )
+        if tweet_type not in tweet_types:
+            return self._result(f"tweet_type:{tweet_type.value}")
+
+        blocked = config.blocked_keywords + (
+            profile.blocked_keywords if profile else []
+        )
+        if blocked and _contains_any(text, blocked):
+            return self._result("blocked_keyword")
+
+        if (
+            tweet_type == TweetType.REPLY
+            and config.reply_call_to_action
+            and not _contains_any(text, config.reply_call_to_action)
+        ):
+            return self._result("reply_without_call_to_action")
+
+        remaining = [token for token in tokens if not self._is_excluded(token)]
+        if tokens and not remaining:
+            return self._result("excluded_tokens")
+
+        if (
+            remaining
+            and config.bare_mention_sentiment is not None
+            and self._is_bare_mention(text, tokens)
+        ):
+            return self._result(
+                "bare_mention",
+                tokens=remaining,
+                sentiment=SentimentResponse(
+                    response=[
+                        TokenSentiment(
+                            token=token, sentiment=config.bare_mention_sentiment
+                        )
+                        for token in remaining
+                    ]
+                ),
+            )
+
+        return PrefilterResult(tokens=remaining)
+
+    def stats(self) -> PrefilterStatsResponse:
+        with self._lock:
+            rules = dict(self.rule_counts)
+            return PrefilterStatsResponse(
+                evaluated=self.evaluated,
+                llm_calls_avoided=sum(rules.values()),
+                rules=rules,
+            )
+
+
+_tweet_prefilter: Optional[TweetPrefilter] = None
+
+
+def get_tweet_prefilter() -> TweetPrefilter:
+    """Return the process wide TweetPrefilter, creating it on first use."""
+    global _tweet_prefilter
+    if _tweet_prefilter is None:
+        _tweet_prefilter = TweetPrefilter()
+    return _tweet_prefilter
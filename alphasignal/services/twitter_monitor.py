@@ -1,12 +1,12 @@
-import re
+import asyncio
 import uuid
 import logging
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
-from alphasignal.ai.chains.twitter_chains import get_tweet_sentiment
 from alphasignal.ai.models.sentiment_response import SentimentResponse, TokenSentiment
 from alphasignal.database.db import ProfileNotFoundError, SQLiteDB
+from alphasignal.models.prepared_buy import PreparedBuy
 from alphasignal.models.token_info import TokenInfo
 from alphasignal.models.tweet_data_extraction import ExtractedTweetData
 from alphasignal.services.auto_manager import AutoManager
@@ -15,6 +15,11 @@ from alphasignal.models.tweet import Tweet
 from alphasignal.models.event import Event
 from alphasignal.models.enums import Platform, TweetSentiment, TweetType
 from alphasignal.services.profile_manager import ProfileManager
+from alphasignal.services.sentiment_batcher import get_sentiment_batcher
+from alphasignal.services.sentiment_cache import get_sentiment_cache
+from alphasignal.services.ticker_resolver import get_ticker_resolver, normalize_ticker
+from alphasignal.services.tweet_prefilter import get_tweet_prefilter
+from alphasignal.utils.token_extractor import extract_tokens
 from alphasignal.apis.dexscreener.dexscreener_client import DexscreenerClient
 
 
@@ -24,24 +29,18 @@ class TwitterMonitor:
         self.profile_manager = ProfileManager()
         self.auto_manager = AutoManager()
         self.dexscreener_client = DexscreenerClient()
+        self.ticker_resolver = get_ticker_resolver()
+        self.sentiment_cache = get_sentiment_cache()
+        self.sentiment_batcher = get_sentiment_batcher()
+        self.prefilter = get_tweet_prefilter()
 
     def _find_tickers(self, message: str) -> List[TokenInfo]:
         """Returns all matches for stock tickers in the text."""
-        ticker_pattern = re.compile(r"\$[A-Za-z]{1,15}")
-        tickers = ticker_pattern.findall(message)
-        return [
-            TokenInfo(ticker=ticker, mint_address=None, name=None, image=None)
-            for ticker in tickers
-        ]
+        return extract_tokens(message)[0]
 
     def _find_mint_addresses(self, message: str) -> List[TokenInfo]:
-        """Returns all matches for potential Solana mint addresses."""
-        solana_pattern = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
-        addresses = solana_pattern.findall(message)
-        return [
-            TokenInfo(mint_address=address, ticker=None, name=None, image=None)
-            for address in addresses
-        ]
+        """Returns all valid Solana mint addresses in the text."""
+        return extract_tokens(message)[1]
 
     def _determine_tweet_type(self, tweetPayload) -> TweetType:
         """
@@ -120,36 +119,61 @@ class TwitterMonitor:
             token_sentiment=str(token_sentiments),
         )
 
-    def _classify_tokens_sentiment(
+    async def _classify_tokens_sentiment(
         self, tweet_text: str, tokens: List[TokenInfo]
     ) -> SentimentResponse:
-        # Initialize the LLM
-        token_sentiment = get_tweet_sentiment(tweet_text, tokens)
+        # Retweets and copy-pasted posts were already classified
+        cached = self.sentiment_cache.get(tweet_text, tokens)
+        if cached is not None:
+            return cached
+
+        # Tweets arriving together are classified in one LLM call
+        token_sentiment = await self.sentiment_batcher.classify(tweet_text, tokens)
+        self.sentiment_cache.set(tweet_text, tokens, token_sentiment)
         return token_sentiment
 
-    def _extract_tweet_info(self, tweetPayload) -> ExtractedTweetData:
+    async def _extract_tweet_info(
+        self,
+        tweetPayload,
+        on_tokens: Optional[Callable[[List[TokenInfo]], None]] = None,
+    ) -> ExtractedTweetData:
         """
         1) Determine if this tweet is a Retweet, Reply, or a Post using the helper function.
         2) Extract the main text to parse out tickers and Solana addresses.
         3) Classify sentiment for tickers and Solana addresses.
         4) Return structured data for further processing.
+
+        on_tokens is called with the tokens that passed the prefilter before
+        sentiment is classified, so work that only needs the tokens can overlap
+        the LLM call.
         """
 
         # Determine the tweet type using the helper function
         tweet_type = self._determine_tweet_type(tweetPayload)
         full_text = tweetPayload.data.full_text or tweetPayload.data.text or ""
 
-        # Extract tickers and Solana addresses
-        tickers = self._find_tickers(full_text)
-        solana_addresses = self._find_mint_addresses(full_text)
+        # Extract tickers and Solana addresses in a single pass
+        tickers, solana_addresses = extract_tokens(full_text)
 
         # Combine tickers and Solana addresses into a single list of TokenInfo
         tokens = tickers + solana_addresses
 
-        # Classify sentiment for tokens
+        # Classify sentiment for tokens, unless a rule drops or decides the tweet
         token_sentiments = SentimentResponse(response=[])
         if tokens != []:
-            token_sentiments = self._classify_tokens_sentiment(full_text, tokens)
+            prefiltered = self.prefilter.apply(
+                tweetPayload.task.user, tweet_type, full_text, tokens
+            )
+            tokens = prefiltered.tokens
+            # Dropped tweets have no tokens left and start no work
+            if on_tokens is not None and tokens:
+                on_tokens(tokens)
+            if prefiltered.sentiment is not None:
+                token_sentiments = prefiltered.sentiment
+            elif tokens != []:
+                token_sentiments = await self._classify_tokens_sentiment(
+                    full_text, tokens
+                )
 
         return ExtractedTweetData(
             tweet_type=tweet_type,
@@ -161,16 +185,36 @@ class TwitterMonitor:
         """
         A helper function to find the mint address of a token from its ticker.
         """
-        if ticker.startswith("$"):
-            ticker = ticker[1:]
+        mint_address = await self.ticker_resolver.resolve(ticker)
+        return mint_address or ""
+
+    def _token_key(self, token: TokenInfo) -> str:
+        """Identifies a token by its mint address, or its ticker until resolved."""
+        return token.mint_address or normalize_ticker(token.ticker or "")
+
+    async def _prepare_token_buy(
+        self, token: TokenInfo, username: str
+    ) -> Tuple[str, Optional[PreparedBuy]]:
+        """
+        Resolve the token's mint address, then speculatively quote a buy of it.
+
+        Returns:
+            Tuple[str, Optional[PreparedBuy]]: the mint address ("" if unknown)
+            and the prepared buy, None when the profile would not buy.
+        """
+        mint_address = token.mint_address or await self._find_mint_address_from_ticker(
+            token.ticker or ""
+        )
+        if not mint_address:
+            return "", None
         try:
-            mint_address = await self.dexscreener_client.get_top_volume_mint_address(
-                ticker
+            prepared = await self.auto_manager.prepare_buy(
+                mint_address, platform=Platform.TWITTER, username=username
             )
-            return mint_address
         except Exception as e:
-            logging.error(f"Error finding mint address for ticker {ticker}: {e}")
-            return ""
+            logging.warning(f"Speculative quote failed for {mint_address}: {e}")
+            prepared = None
+        return mint_address, prepared
 
     async def process_tweet_webhook(self, tweetPayload) -> bool:
         """
@@ -185,46 +229,78 @@ class TwitterMonitor:
         # log the incoming payload
         logging.info("Received tweet payload: %s", tweetPayload)
 
-        # perform data extraction and sentiment classification
-        extracted_data = self._extract_tweet_info(tweetPayload)
+        # Mint resolution and the buy quote run while sentiment is classified
+        prepared_buys: Dict[str, asyncio.Task] = {}
 
-        # log the extracted data
-        logging.info("Extracted tweet data: %s", extracted_data)
+        def prepare_buys(tokens: List[TokenInfo]) -> None:
+            for token in tokens:
+                key = self._token_key(token)
+                if key not in prepared_buys:
+                    prepared_buys[key] = asyncio.create_task(
+                        self._prepare_token_buy(token, tweetPayload.task.user)
+                    )
 
-        # add to db
-        self._add_tweet_event_to_db(tweetPayload, extracted_data)
+        try:
+            # perform data extraction and sentiment classification
+            extracted_data = await self._extract_tweet_info(
+                tweetPayload, on_tokens=prepare_buys
+            )
 
-        # if any token missing mint_address, update the model with the mint_address
-        for token in extracted_data.tokens:
-            if not token.mint_address:
+            # log the extracted data
+            logging.info("Extracted tweet data: %s", extracted_data)
+
+            # add to db
+            self._add_tweet_event_to_db(tweetPayload, extracted_data)
+
+            sentiments = (
+                extracted_data.token_sentiment.response
+                if hasattr(extracted_data.token_sentiment, "response")
+                else []
+            )
+            # Sentiments hold enum values, not TweetSentiment members
+            if sentiments and sentiments[0].sentiment == TweetSentiment.POSITIVE.value:
+                await self._auto_buy_tokens(
+                    extracted_data.tokens, tweetPayload.task.user, prepared_buys
+                )
+        finally:
+            # Speculative work for tweets that do not buy is thrown away
+            for task in prepared_buys.values():
+                if not task.cancel() and not task.cancelled():
+                    task.exception()
+        return True
+
+    async def _auto_buy_tokens(
+        self,
+        tokens: List[TokenInfo],
+        username: str,
+        prepared_buys: Dict[str, asyncio.Task],
+    ) -> None:
+        """
+        Buy the first token with a known mint address, using its prepared quote.
+        """
+        for token in tokens:
+            prepared = None
+            task = prepared_buys.get(self._token_key(token))
+            if task is not None:
+                token.mint_address, prepared = await task
+            elif not token.mint_address:
                 token.mint_address = await self._find_mint_address_from_ticker(
                     token.ticker or ""
                 )
-
-        # perform auto-buy for positive sentiment tokens, skipping if no mint_address
-        sentiments = (
-            extracted_data.token_sentiment.response
-            if hasattr(extracted_data.token_sentiment, "response")
-            else []
-        )
-        if sentiments and sentiments[0].sentiment == TweetSentiment.POSITIVE:
-            for token in extracted_data.tokens:
-                if not token.mint_address:
-                    logging.warning(
-                        f"Skipping auto_buy: no mint_address for token {token}"
-                    )
-                    continue
-                try:
-                    order_id = await self.auto_manager.auto_buy(
-                        token.mint_address,
-                        platform=Platform.TWITTER,
-                        username=tweetPayload.task.user,
+            if not token.mint_address:
+                logging.warning(f"Skipping auto_buy: no mint_address for token {token}")
+                continue
+            try:
+                order_id = await self.auto_manager.auto_buy(
+                    token.mint_address,
+                    platform=Platform.TWITTER,
+                    username=username,
+                    prepared=prepared,
+                )
+                if not order_id:
+                    logging.error(
+                        f"Auto buy returned no order for {token.mint_address}"
                     )
-                    if not order_id:
-                        logging.error(
-                            f"Auto buy returned no order for {token.mint_address}"
-                        )
-                    break
-                except Exception as e:
-                    logging.error(f"Auto buy failed for {token.mint_address}: {e}")
-        return True
+                break
+            except Exception as e:
+                logging.error(f"Auto buy failed for {token.mint_address}: {e}")
@@ -0,0 +1,148 @@
+import asyncio
+import math
+import os
+import time
+import logging
+from typing import Dict, List, Optional
+
+from solders.hash import Hash
+
+from alphasignal.apis.solana.solana_client import get_solana_client
+from alphasignal.models.constants import SOL_MINT_ADDRESS, USDC_MINT_ADDRESS
+from alphasignal.services.order_book import get_order_book
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+# getRecentPrioritizationFees reports at most the last 150 slots
+PRIORITY_FEE_WINDOW_SLOTS = 150
+# getRecentPrioritizationFees accepts at most 128 accounts
+PRIORITY_FEE_MAX_ACCOUNTS = 128
+JUPITER_PROGRAM_ID = "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QUb4yZ1gH"
+
+
+class TxPrefetcher:
+    """
+    Keeps what every outgoing transaction needs from the cluster in memory.
+
+    A background loop refreshes the latest blockhash and a rolling window of
+    recent prioritization fees, so transaction builders read both without a
+    round-trip. A blockhash older than max_blockhash_age is fetched inline.
+    Fees are sampled for the accounts swaps write to, the Jupiter program and
+    the mints of open orders, since cluster wide samples are mostly zero.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: Optional[float] = None,
+        max_blockhash_age: Optional[float] = None,
+        fee_percentile: Optional[float] = None,
+        max_priority_fee: Optional[int] = None,
+    ):
+        self.refresh_interval = refresh_interval or float(
+            os.getenv("TX_PREFETCH_INTERVAL_SECONDS", "2")
+        )
+        self.max_blockhash_age = max_blockhash_age or float(
+            os.getenv("BLOCKHASH_MAX_AGE_SECONDS", "20")
+        )
+        self.fee_percentile = fee_percentile or float(
+            os.getenv("PRIORITY_FEE_PERCENTILE", "75")
+        )
+        self.max_priority_fee = max_priority_fee or int(
+            os.getenv("PRIORITY_FEE_MAX_MICROLAMPORTS", "1000000")
+        )
+        self._blockhash: Optional[Hash] = None
+        self._blockhash_at = 0.0
+        self.jupiter_program_id = os.getenv("JUPITER_PROGRAM_ID", JUPITER_PROGRAM_ID)
+        self._fees: Dict[int, int] = {}  # slot -> micro-lamports per compute unit
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def refresh_blockhash(self) -> Hash:
+        blockhash = await get_solana_client().get_latest_blockhash()
+        self._blockhash = blockhash
+        self._blockhash_at = time.time()
+        return blockhash
+
+    def _fee_accounts(self) -> List[str]:
+        accounts = [self.jupiter_program_id, SOL_MINT_ADDRESS, USDC_MINT_ADDRESS]
+        for order in get_order_book().active_orders():
+            if order.mint_address not in accounts:
+                accounts.append(order.mint_address)
+        return accounts[:PRIORITY_FEE_MAX_ACCOUNTS]
+
+    async def refresh_fees(self) -> None:
+        fees = await get_solana_client().get_recent_prioritization_fees(
+            self._fee_accounts()
+        )
+        self._fees.update(fees)
+        for slot in sorted(self._fees)[:-PRIORITY_FEE_WINDOW_SLOTS]:
+            del self._fees[slot]
+
+    async def get_blockhash(self) -> Hash:
+        """Returns a recent blockhash, fetching one only if the prefetched one is stale."""
+        if (
+            self._blockhash is not None
+            and time.time() - self._blockhash_at <= self.max_blockhash_age
+        ):
+            return self._blockhash
+        return await self.refresh_blockhash()
+
+    def get_priority_fee(self) -> Optional[int]:
+        """
+        Returns the compute unit price to pay in micro-lamports.
+
+        This is the configured percentile of the fees paid in recent slots,
+        capped at max_priority_fee. Returns None before any fees were sampled;
+        0 means recent slots did not compete for the sampled accounts.
+        """
+        if not self._fees:
+            return None
+        fees = sorted(self._fees.values())
+        rank = math.ceil(self.fee_percentile / 100 * len(fees))
+        fee = fees[min(max(rank, 1), len(fees)) - 1]
+        return min(fee, self.max_priority_fee)
+
+    async def refresh(self) -> None:
+        results = await asyncio.gather(
+            self.refresh_blockhash(), self.refresh_fees(), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error prefetching transaction data: {result}")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error prefetching transaction data: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Starts the background refresh loop on the running event loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_tx_prefetcher: Optional[TxPrefetcher] = None
+
+
+def get_tx_prefetcher() -> TxPrefetcher:
+    """Return the process wide TxPrefetcher, creating it on first use."""
+    global _tx_prefetcher
+    if _tx_prefetcher is None:
+        _tx_prefetcher = TxPrefetcher()
+    return _tx_prefetcher
@@ -1,6 +1,5 @@
 from tenacity import retry, stop_after_attempt, wait_exponential
-import asyncio
-from typing import List
+from typing import List, Optional
 import base58
 import os
 import json
@@ -11,10 +10,14 @@ from solders.transaction import Transaction
 from solders.message import MessageV0
 from solders.transaction import VersionedTransaction
 from alphasignal.apis.dexscreener.dexscreener_client import DexscreenerClient
-from alphasignal.apis.solana.solana_client import SolanaClient
+from alphasignal.apis.solana.solana_client import get_solana_client
 from alphasignal.database.db import SQLiteDB
+from alphasignal.models.token_balance import TokenBalance
 from alphasignal.models.wallet import Wallet
 from alphasignal.models.wallet_token import WalletToken
+from alphasignal.services.price_engine import get_price_engine
+from alphasignal.services.tx_prefetcher import get_tx_prefetcher
+from alphasignal.services.wallet_snapshot_cache import get_wallet_snapshot_cache
 from alphasignal.schemas.responses.wallet_value_response import WalletValueResponse
 
 import logging
@@ -28,14 +31,26 @@ logger = logging.getLogger(__name__)
 SOLANA_CLUSTER_URL = "https://api.mainnet-beta.solana.com"  # Mainnet cluster URL
 
 
+def _display_price(mint_address: str, dexscreener_price) -> float:
+    """
+    Prefers the price engine's fresh price over a Dexscreener pair price.
+
+    Dexscreener prices lag Jupiter's, so they are only used for display and never
+    written to the engine that sell decisions read from.
+    """
+    engine_price = get_price_engine().peek(mint_address)
+    if engine_price is not None:
+        return engine_price
+    return float(dexscreener_price)
+
+
 class WalletManager:
     def __init__(self, make_wallet: bool = False):
         self.make_wallet = make_wallet
         self.wallet_save_file = os.getenv("WALLET_SAVE_FILE", "wallet_keypair.json")
         if not os.path.exists(self.wallet_save_file):
-            self.wallet = asyncio.run(self.create_wallet())
-        else:
-            self.wallet = self.load_wallet()
+            self.create_wallet()
+        self.wallet = self.load_wallet()
 
     def load_wallet(self):
         """Load the wallet's public and secret keys."""
@@ -51,7 +66,7 @@ class WalletManager:
         except Exception as e:
             raise Exception(f"Error loading wallet keys: {e}")
 
-    async def create_wallet(self):
+    def create_wallet(self):
         wallet = Keypair()
         public_key = str(wallet.pubkey())
         secret_key = base58.b58encode(wallet.secret()).decode()
@@ -72,27 +87,25 @@ class WalletManager:
         """
         # Solana RPC endpoint
         try:
-            solana_client = SolanaClient()
             dexscreener_client = DexscreenerClient()
 
-            accts = solana_client.get_owner_token_accounts(self.wallet)
-            if not accts:
+            snapshot = await get_wallet_snapshot_cache().get_snapshot(self.wallet)
+            if not snapshot.balances:
                 return []
+            # One batched Dexscreener lookup for every held mint
+            tokens_data = await dexscreener_client.get_tokens_pairs(
+                list(snapshot.balances)
+            )
             tokens = []
-            for token_info in accts:
-                mint_address = token_info.account.data.parsed["info"]["mint"]
-                bal = float(
-                    token_info.account.data.parsed["info"]["tokenAmount"]["uiAmount"]
-                )
-
+            for mint_address, bal in snapshot.balances.items():
+                token_data = tokens_data.get(mint_address)
+                if not token_data:
+                    logger.warning(f"No Dexscreener data for {mint_address}, skipping")
+                    continue
                 try:
-                    token_data = await dexscreener_client.get_token_pairs(mint_address)
-                    # if your client might return None on no data, guard that too:
-                    if not token_data:
-                        logger.warning(
-                            f"No Dexscreener data for {mint_address}, skipping"
-                        )
-                        continue
+                    token_data["priceUsd"] = _display_price(
+                        mint_address, token_data["priceUsd"]
+                    )
 
                     tokens.append(
                         WalletToken(
@@ -136,13 +149,6 @@ class WalletManager:
                         )
                     )
 
-                except IndexError:
-                    # this is the empty-list case
-                    logger.warning(
-                        f"No pairs found on Dexscreener for {mint_address}, skipping"
-                    )
-                    continue
-
                 except Exception as e:
                     logger.error(f"Error getting token data for {mint_address}: {e}")
                     continue
@@ -180,47 +186,70 @@ class WalletManager:
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
     )
-    async def get_token_acct_value(self, mint_address: str):
+    async def get_token_acct_value(
+        self, mint_address: str, max_age: Optional[float] = None
+    ):
         """
         Return the balance for a specific token account in the wallet.
 
         Args:
             mint_address (str): The mint address of the token.
+            max_age (float): Maximum age in seconds of the cached wallet snapshot;
+                0 forces a fresh read.
 
         Returns:
             float: The balance of the specified token.
         """
         try:
-            solana_client = SolanaClient()
-            accts = solana_client.get_owner_token_accounts(self.wallet)
-            if not accts:
-                raise Exception("Failed to get token accounts")
-
-            for token_info in accts:
-                token_mint_address = token_info.account.data.parsed["info"]["mint"]
-                if token_mint_address == mint_address:
-                    balance = float(
-                        token_info.account.data.parsed["info"]["tokenAmount"][
-                            "uiAmount"
-                        ]
-                    )
-                    return balance
-
-            # If the mint address is not found in the wallet
-            return 0
+            return await get_wallet_snapshot_cache().get_balance(
+                self.wallet, mint_address, max_age
+            )
         except Exception as e:
             logger.error(f"Error getting wallet value: {e}")
             raise Exception(f"Error getting wallet value: {e}")
 
+    async def get_token_balance(
+        self,
+        mint_address: str,
+        with_price: bool = False,
+        max_age: Optional[float] = None,
+    ) -> Optional[TokenBalance]:
+        """
+        Return one token's balance, and optionally its price, without get_tokens.
+
+        The balance comes from the cached wallet snapshot and the price from the
+        price engine, so the cost does not grow with the number of holdings.
+
+        Args:
+            mint_address (str): The mint address of the token.
+            with_price (bool): Also fetch the token's USD price.
+            max_age (float): Maximum age in seconds of the cached wallet snapshot.
+
+        Returns:
+            Optional[TokenBalance]: None if the wallet holds no account for the mint.
+        """
+        snapshot = await get_wallet_snapshot_cache().get_snapshot(self.wallet, max_age)
+        if mint_address not in snapshot.balances:
+            return None
+        value = None
+        if with_price:
+            value = await get_price_engine().get_price(mint_address)
+        return TokenBalance(
+            mint_address=mint_address,
+            balance=snapshot.get_balance(mint_address),
+            value=value,
+        )
+
     async def get_sol_value(self):
         try:
-            solana_client = SolanaClient()
+            solana_client = get_solana_client()
             dexscreener_client = DexscreenerClient()
             solana_mint = "So11111111111111111111111111111111111111112"
-            sol_bal = solana_client.get_sol_balance(self.wallet)
+            sol_bal = await solana_client.get_sol_balance(self.wallet)
             token_data = await dexscreener_client.get_token_pairs(solana_mint)
             if sol_bal is None or token_data["priceUsd"] is None:
                 raise ValueError("Retrieved SOL balance or price is None")
+            token_data["priceUsd"] = _display_price(solana_mint, token_data["priceUsd"])
             return WalletToken(
                 mint_address=token_data["mint_address"],
                 token_name=token_data["token_name"],
@@ -275,10 +304,10 @@ class WalletManager:
         Send your entire SOL balance from this wallet to the given destination.
         Returns the transaction signature.
         """
-        solana_client = SolanaClient()
+        solana_client = get_solana_client()
 
         # 1) Fetch current SOL balance (in SOL)
-        # sol_balance = solana_client.get_sol_balance(self.wallet)
+        # sol_balance = await solana_client.get_sol_balance(self.wallet)
         # if sol_balance is None or sol_balance <= 0:
         #     raise ValueError("No SOL available to send.")
 
@@ -296,8 +325,7 @@ class WalletManager:
             )
         )
         # 4) Build versioned transaction using MessageV0 and VersionedTransaction
-        recent_resp = solana_client.client.get_latest_blockhash()
-        blockhash = recent_resp.value.blockhash
+        blockhash = await get_tx_prefetcher().get_blockhash()
 
         msg = MessageV0.try_compile(
             payer=sender_pubkey,
@@ -308,5 +336,6 @@ class WalletManager:
         tx = VersionedTransaction(msg, [self.wallet.wallet_keypair])
 
         # 5) Serialize and send
-        resp = solana_client.client.send_transaction(tx)
+        resp = await solana_client.client.send_transaction(tx)
+        get_wallet_snapshot_cache().invalidate(self.wallet)
         return resp.value
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import time
+import logging
+from typing import Dict, Optional
+
+from alphasignal.apis.solana.solana_client import get_solana_client
+from alphasignal.models.wallet import Wallet
+from alphasignal.models.wallet_snapshot import WalletSnapshot
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger(__name__)
+
+
+class WalletSnapshotCache:
+    """
+    Short lived cache of every token account a wallet holds, indexed by mint.
+
+    Balance reads within the TTL are served from memory, concurrent reads of a
+    stale wallet share one RPC fetch, and submitting a transaction invalidates
+    the wallet so the next read sees the new balances.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl or float(os.getenv("WALLET_SNAPSHOT_TTL_SECONDS", "3"))
+        self._snapshots: Dict[str, WalletSnapshot] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped on invalidation so a fetch started earlier is not cached
+        self._generations: Dict[str, int] = {}
+
+    def _is_fresh(
+        self, snapshot: Optional[WalletSnapshot], max_age: Optional[float]
+    ) -> bool:
+        if snapshot is None:
+            return False
+        max_age = self.ttl if max_age is None else max_age
+        return time.time() - snapshot.fetched_at <= max_age
+
+    def invalidate(self, wallet: Wallet) -> None:
+        """Drops the wallet's snapshot, e.g. after a swap or transfer was sent."""
+        owner = str(wallet.public_key)
+        self._snapshots.pop(owner, None)
+        self._inflight.pop(owner, None)
+        self._generations[owner] = self._generations.get(owner, 0) + 1
+
+    async def _fetch(self, wallet: Wallet) -> WalletSnapshot:
+        accts = await get_solana_client().get_owner_token_accounts(wallet)
+        balances: Dict[str, float] = {}
+        for token_info in accts:
+            info = token_info.account.data.parsed["info"]
+            amount = float(info["tokenAmount"]["uiAmount"] or 0)
+            balances[info["mint"]] = balances.get(info["mint"], 0.0) + amount
+        return WalletSnapshot(
+            owner=str(wallet.public_key), balances=balances, fetched_at=time.time()
+        )
+
+    async def get_snapshot(
+        self, wallet: Wallet, max_age: Optional[float] = None
+    ) -> WalletSnapshot:
+        """
+        Returns the wallet's token balances, fetching them if the snapshot is stale.
+
+        Args:
+            wallet: the wallet to read
+            max_age: maximum age in seconds of a cached snapshot (default: the TTL)
+        """
+        owner = str(wallet.public_key)
+        snapshot = self._snapshots.get(owner)
+        if self._is_fresh(snapshot, max_age):
+            return snapshot
+
+        # A shared fetch started before this call is only as old as max_age allows
+        future = self._inflight.get(owner)
+        if future is not None and (max_age is None or max_age > 0):
+            return await asyncio.shield(future)
+
+        generation = self._generations.get(owner, 0)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[owner] = future
+        try:
+            snapshot = await self._fetch(wallet)
+            future.set_result(snapshot)
+            if self._generations.get(owner, 0) == generation:
+                self._snapshots[owner] = snapshot
+            return snapshot
+        except Exception as e:
+            future.set_exception(e)
+            # Callers waiting on the same fetch see the error, mark it retrieved
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            if self._inflight.get(owner) is future:
+                del self._inflight[owner]
+
+    async def get_balance(
+        self, wallet: Wallet, mint_address: str, max_age: Optional[float] = None
+    ) -> float:
+        snapshot = await self.get_snapshot(wallet, max_age)
+        return snapshot.get_balance(mint_address)
+
+
+_wallet_snapshot_cache: Optional[WalletSnapshotCache] = None
+
+
+def get_wallet_snapshot_cache() -> WalletSnapshotCache:
+    """Return the process wide WalletSnapshotCache, creating it on first use."""
+    global _wallet_snapshot_cache
+    if _wallet_snapshot_cache is None:
+        _wallet_snapshot_cache = WalletSnapshotCache()
+    return _wallet_snapshot_cache
@@ -0,0 +1,112 @@
+import asyncio
+
+from alphasignal.models.enums import AmountType, BuyType, Platform, SellMode, SellType
+from alphasignal.models.profile import Profile
+from alphasignal.models.swap_fill import SwapFill
+from alphasignal.models.token_balance import TokenBalance
+from alphasignal.services import auto_manager
+from alphasignal.services.auto_manager import AutoManager
+
+MINT = "Mint111111111111111111111111111111111111111"
+
+
+class FakeProfiles:
+    def __init__(self, profile):
+        self.profile = profile
+
+    def get_profile(self, platform, username):
+        return self.profile
+
+
+class FakeWalletManager:
+    async def get_token_balance(self, mint_address):
+        return TokenBalance(mint_address=mint_address, balance=1000.0)
+
+
+class FakeJupiter:
+    def __init__(self):
+        self.swaps = []
+
+    async def fetch_swap_quote(self, from_mint, to_mint, amount, slippage_bps):
+        return {"inAmount": amount}
+
+    async def swap_tokens(
+        self,
+        from_token_mint,
+        to_token_mint,
+        input_amount,
+        wallet_manager,
+        slippage_bps=50,
+        quote=None,
+    ):
+        self.swaps.append((input_amount, quote))
+        return SwapFill(
+            signature="sig",
+            input_mint=from_token_mint,
+            output_mint=to_token_mint,
+            input_amount=input_amount,
+            output_amount=5.0,
+        )
+
+
+class FakeOrders:
+    def add_order(self, **kwargs):
+        return "order-1"
+
+
+class FakePriceEngine:
+    async def get_price(self, mint_address):
+        return 1.0
+
+
+def _profile(buy_amount):
+    return Profile(
+        id="p1",
+        platform=Platform.TWITTER,
+        username="testuser",
+        is_active=True,
+        buy_type=BuyType.USDC,
+        buy_amount_type=AmountType.AMOUNT,
+        buy_amount=buy_amount,
+        buy_slippage=50,
+        sell_mode=SellMode.TIME_BASED,
+        sell_value=10,
+        sell_type=SellType.USDC,
+        sell_slippage=50,
+        is_visable=True,
+    )
+
+
+def _auto_manager(profile):
+    manager = AutoManager.__new__(AutoManager)
+    manager.profiles = FakeProfiles(profile)
+    manager.wallet_manager = FakeWalletManager()
+    manager.jupiter = FakeJupiter()
+    manager.orders = FakeOrders()
+    return manager
+
+
+def test_prepared_quote_is_used_while_the_profile_is_unchanged(monkeypatch):
+    monkeypatch.setattr(auto_manager, "get_price_engine", lambda: FakePriceEngine())
+    manager = _auto_manager(_profile(10))
+
+    async def run():
+        prepared = await manager.prepare_buy(MINT, Platform.TWITTER, "testuser")
+        await manager.auto_buy(MINT, Platform.TWITTER, "testuser", prepared=prepared)
+
+    asyncio.run(run())
+    assert manager.jupiter.swaps == [(10, {"inAmount": 10})]
+
+
+def test_prepared_quote_is_dropped_when_the_buy_size_changes(monkeypatch):
+    monkeypatch.setattr(auto_manager, "get_price_engine", lambda: FakePriceEngine())
+    manager = _auto_manager(_profile(10))
+
+    async def run():
+        prepared = await manager.prepare_buy(MINT, Platform.TWITTER, "testuser")
+        manager.profiles.profile = _profile(25)
+        await manager.auto_buy(MINT, Platform.TWITTER, "testuser", prepared=prepared)
+
+    asyncio.run(run())
+    # The swap is sized from the edited profile and fetches a new quote
+    assert manager.jupiter.swaps == [(25, None)]
@@ -0,0 +1,26 @@
+import threading
+
+from alphasignal.database.connection import ConnectionManager
+
+
+def test_connections_are_configured_and_scoped_per_thread(tmp_path):
+    manager = ConnectionManager(busy_timeout_ms=1234)
+    db_path = str(tmp_path / "test.db")
+
+    connection = manager.get_connection(db_path)
+    assert manager.get_connection(db_path) is connection
+    assert connection.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    assert connection.execute("PRAGMA busy_timeout;").fetchone()[0] == 1234
+    # NORMAL
+    assert connection.execute("PRAGMA synchronous;").fetchone()[0] == 1
+
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(manager.get_connection(db_path))
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not connection
+
+    manager.close_thread_connections()
+    assert manager.get_connection(db_path) is not connection
@@ -0,0 +1,68 @@
+import asyncio
+
+from alphasignal.apis.dexscreener import dexscreener_client
+from alphasignal.apis.dexscreener.dexscreener_client import DexscreenerClient
+from alphasignal.models.token_info import TokenInfo
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeTransport:
+    def __init__(self):
+        self.urls = []
+
+    async def get(self, url):
+        self.urls.append(url)
+        addresses = url.rsplit("/", 1)[1].split(",")
+        return FakeResponse(
+            [
+                {
+                    "baseToken": {"address": a, "symbol": a.upper(), "name": a},
+                    "quoteToken": {"address": "quote"},
+                    "priceUsd": "1.5",
+                    "priceChange": {"h24": 10},
+                }
+                for a in addresses
+                if a not in ("unlisted", "quote")
+            ]
+        )
+
+
+class FakeDB:
+    def __init__(self):
+        self.tokens = {}
+
+    def get_token_info(self, mint_address):
+        return self.tokens.get(mint_address)
+
+    def add_token_info(self, mint_address, name, ticker, image):
+        self.tokens[mint_address] = TokenInfo(
+            mint_address=mint_address, name=name, ticker=ticker, image=image
+        )
+
+
+def test_token_pairs_are_fetched_in_concurrent_batches(monkeypatch):
+    transport = FakeTransport()
+    monkeypatch.setattr(dexscreener_client, "get_http_transport", lambda: transport)
+    client = DexscreenerClient()
+    client.sql_db = FakeDB()
+    addresses = [f"mint{i}" for i in range(65)] + ["unlisted", "quote"]
+
+    results = asyncio.run(client.get_tokens_pairs(addresses))
+
+    assert len(transport.urls) == 3
+    # A token only seen as the quote side of other pairs is not priced from them
+    assert set(results) == set(addresses) - {"unlisted", "quote"}
+    assert "quote" not in client.sql_db.tokens
+    assert results["mint7"]["token_ticker"] == "MINT7"
+    assert results["mint7"]["priceUsd"] == 1.5
+    assert results["mint7"]["h24"] == 10.0
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+from alphasignal.apis import http_transport
+from alphasignal.apis.http_transport import get_http_transport
+
+
+def test_transport_replaced_for_a_new_loop_is_closed_on_its_own_loop(monkeypatch):
+    monkeypatch.setattr(http_transport, "_transport", None)
+    monkeypatch.setattr(http_transport, "_transport_loop", None)
+    closed_on = []
+
+    async def aclose(self):
+        closed_on.append(asyncio.get_running_loop())
+
+    monkeypatch.setattr(http_transport.HttpTransport, "aclose", aclose)
+
+    # A loop that keeps running in another thread owns the first transport
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+
+        async def first():
+            return get_http_transport()
+
+        old = asyncio.run_coroutine_threadsafe(first(), other_loop).result(1)
+
+        async def second():
+            return get_http_transport()
+
+        new = asyncio.run(second())
+        # The close was scheduled on the owning loop; wait for it to run
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(1)
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+    assert new is not old
+    assert closed_on == [other_loop]
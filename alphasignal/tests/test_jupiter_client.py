@@ -0,0 +1,102 @@
+import asyncio
+
+from tenacity import wait_none
+
+from alphasignal.apis.jupiter import jupiter_client
+from alphasignal.apis.jupiter.jupiter_client import (
+    PRICE_IDS_PER_REQUEST,
+    JupiterClient,
+)
+from alphasignal.models.constants import USDC_MINT_ADDRESS
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.text = str(data)
+
+    def json(self):
+        return self.data
+
+
+class FakeTransport:
+    def __init__(self):
+        self.requests = []
+
+    async def get(self, url, params=None):
+        ids = params["ids"].split(",")
+        self.requests.append(ids)
+        if "broken" in ids:
+            return FakeResponse(500, "unavailable")
+        return FakeResponse(
+            200,
+            {
+                "data": {
+                    mint: None if mint == "unlisted" else {"price": "2.5"}
+                    for mint in ids
+                }
+            },
+        )
+
+
+def _client(monkeypatch):
+    transport = FakeTransport()
+    monkeypatch.setattr(jupiter_client, "get_http_transport", lambda: transport)
+    # A failed chunk is retried, without waiting between attempts here
+    monkeypatch.setattr(JupiterClient._fetch_price_chunk.retry, "wait", wait_none())
+    client = JupiterClient()
+    quoted = []
+
+    async def fetch_token_value(mint):
+        quoted.append(mint)
+        return 7.0
+
+    client.fetch_token_value = fetch_token_value
+    return client, transport, quoted
+
+
+def test_prices_are_fetched_in_deduplicated_chunks(monkeypatch):
+    client, transport, quoted = _client(monkeypatch)
+    mints = [f"mint{i}" for i in range(PRICE_IDS_PER_REQUEST + 5)]
+
+    prices = asyncio.run(
+        client.fetch_token_values(mints + mints[:10] + [USDC_MINT_ADDRESS, ""])
+    )
+
+    assert sorted(len(ids) for ids in transport.requests) == [
+        5,
+        PRICE_IDS_PER_REQUEST,
+    ]
+    # USDC is pegged and never requested
+    assert all(USDC_MINT_ADDRESS not in ids for ids in transport.requests)
+    assert prices[USDC_MINT_ADDRESS] == 1.0
+    assert len(prices) == len(mints) + 1
+    assert prices["mint0"] == 2.5
+    assert quoted == []
+
+
+def test_failed_chunk_leaves_other_chunks_and_falls_back(monkeypatch):
+    client, transport, quoted = _client(monkeypatch)
+    good = [f"mint{i}" for i in range(PRICE_IDS_PER_REQUEST)]
+    bad = ["broken", "other"]
+
+    prices = asyncio.run(client.fetch_token_values(good + bad + ["unlisted"]))
+
+    assert all(prices[mint] == 2.5 for mint in good)
+    # The failed chunk and the mint the endpoint did not price are quoted
+    assert sorted(quoted) == ["broken", "other", "unlisted"]
+    assert prices["broken"] == 7.0
+
+
+def test_fallback_can_be_switched_off(monkeypatch):
+    client, transport, quoted = _client(monkeypatch)
+
+    prices = asyncio.run(
+        client.fetch_token_values(["mint0", "unlisted", "broken"], fallback=False)
+    )
+
+    assert prices == {}
+    assert quoted == []
+    # The chunk containing "broken" was retried before giving up
+    assert len(transport.requests) == 3
@@ -0,0 +1,76 @@
+import sqlite3
+from datetime import datetime, timezone
+
+from alphasignal.database import db as db_module
+from alphasignal.database.connection import connection_manager
+from alphasignal.database.migrations import MIGRATIONS, get_schema_version, migrate
+from alphasignal.models.enums import OrderStatus, SellMode, SellType
+
+
+def test_migrate_upgrades_legacy_database(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript("""
+        CREATE TABLE tracked_orders (
+            id TEXT PRIMARY KEY, mint_address TEXT NOT NULL, last_price_max REAL,
+            sell_mode TEXT, sell_value REAL, sell_type TEXT, time_added TEXT,
+            time_sold TEXT, balance REAL, order_status INTEGER DEFAULT 0,
+            profit TEXT, slippage REAL
+        );
+        CREATE TABLE token_info (
+            mint_address TEXT PRIMARY KEY, name TEXT, ticker TEXT, image TEXT
+        );
+        INSERT INTO tracked_orders VALUES (
+            'order-1', 'mint', 1.5, 'stop_loss', 20, 'SOL',
+            '2024-01-02T03:04:05+00:00', NULL, 10, 0, NULL, 0.5
+        );
+        """)
+    legacy.commit()
+    legacy.close()
+
+    connection = sqlite3.connect(db_path)
+    assert migrate(connection) == MIGRATIONS[-1][0]
+    # Running again is a no-op
+    assert migrate(connection) == get_schema_version(connection)
+
+    columns = {
+        row[1]: row[2]
+        for row in connection.execute("PRAGMA table_info(tracked_orders);")
+    }
+    assert columns["time_added"] == "INTEGER"
+    assert "decimals" in [
+        row[1] for row in connection.execute("PRAGMA table_info(token_info);")
+    ]
+    indexes = [
+        row[1] for row in connection.execute("PRAGMA index_list(tracked_orders);")
+    ]
+    assert "idx_tracked_orders_status" in indexes
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tracked_orders WHERE order_status = 0"
+    ).fetchall()
+    assert "idx_tracked_orders_status" in str(plan)
+    connection.close()
+
+
+def test_orders_round_trip_epoch_timestamps(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "orders.db"))
+    try:
+        db = db_module.SQLiteDB()
+        db.initialize_database()
+        order_id = db.create_order(
+            "mint", SellMode.STOP_LOSS, 20, SellType.SOL, 1.5, 10, 0.5
+        )
+
+        order = db.get_order(order_id)
+        assert order.status == OrderStatus.ACTIVE
+        assert order.time_added.tzinfo == timezone.utc
+        assert abs((datetime.now(timezone.utc) - order.time_added).total_seconds()) < 5
+        assert db.get_order("missing") is None
+        assert order.buy_signature is None
+
+        db.complete_order(order_id, "3.0", "sell-sig", 0.25)
+        order = db.get_order(order_id)
+        assert order.status == OrderStatus.COMPLETE
+        assert (order.sell_signature, order.sell_output_amount) == ("sell-sig", 0.25)
+    finally:
+        connection_manager.close_thread_connections()
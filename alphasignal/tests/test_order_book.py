@@ -0,0 +1,57 @@
+import alphasignal.database.db as db_module
+from alphasignal.database.db import SQLiteDB
+from alphasignal.models.enums import OrderStatus, SellMode, SellType
+from alphasignal.services.order_book import OrderBook
+
+
+def _create_order(db: SQLiteDB, mint_address: str, price: float) -> str:
+    return db.create_order(
+        mint_address=mint_address,
+        sell_mode=SellMode.STOP_LOSS,
+        sell_value=10,
+        sell_type=SellType.USDC,
+        buy_in_value=price,
+        balance=100,
+        slippage=50,
+    )
+
+
+def test_price_highs_are_written_behind_in_one_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "test.db"))
+    db = SQLiteDB()
+    db.initialize_database()
+    first = _create_order(db, "mint_a", 1.0)
+    second = _create_order(db, "mint_a", 2.0)
+
+    book = OrderBook()
+    book.load(db)
+    assert {o.id for o in book.get_by_mint("mint_a")} == {first, second}
+
+    book.update_last_price(first, 1.5)
+    book.update_last_price(second, 2.5)
+    stored = {o.id: o.last_price_max for o in db.get_orders(OrderStatus.ACTIVE)}
+    assert stored == {first: 1.0, second: 2.0}
+
+    assert book.flush(db) == 2
+    assert book.flush(db) == 0
+    stored = {o.id: o.last_price_max for o in db.get_orders(OrderStatus.ACTIVE)}
+    assert stored == {first: 1.5, second: 2.5}
+
+
+def test_sync_picks_up_changes_from_other_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "test.db"))
+    db = SQLiteDB()
+    db.initialize_database()
+    canceled = _create_order(db, "mint_a", 1.0)
+
+    book = OrderBook()
+    book.load(db)
+    book.update_last_price(canceled, 3.0)
+
+    # Another process cancels one order and creates a new one
+    db.set_order_status(canceled, OrderStatus.CANCELED)
+    created = _create_order(db, "mint_b", 4.0)
+
+    book.sync(db)
+    assert [o.id for o in book.active_orders()] == [created]
+    assert book.get_by_mint("mint_a") == []
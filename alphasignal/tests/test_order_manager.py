@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from alphasignal.models.enums import SellMode
+from alphasignal.services.order_manager import OrderManager
+
+
+class FakeBook:
+    def __init__(self, orders):
+        self.orders = orders
+
+    def load(self, db):
+        pass
+
+    def active_orders(self):
+        return list(self.orders)
+
+
+class FakePrices:
+    def set_watchlist(self, name, mints):
+        pass
+
+    async def get_prices(self, mints, fallback=True):
+        return {mint: 1.0 for mint in mints}
+
+    async def get_price(self, mint, max_age=None):
+        return 0.5
+
+
+def _order_manager(orders, sell_concurrency=1):
+    manager = OrderManager.__new__(OrderManager)
+    manager.db = None
+    manager.book = FakeBook(orders)
+    manager.prices = FakePrices()
+    manager.evaluation_semaphore = asyncio.Semaphore(10)
+    manager.sell_semaphore = asyncio.Semaphore(sell_concurrency)
+    manager._sell_tasks = set()
+    manager.set_order_status = lambda order_id, status: None
+    return manager
+
+
+def _order(order_id, sell_mode=SellMode.TIME_BASED):
+    return SimpleNamespace(
+        id=order_id,
+        mint_address=f"mint-{order_id}",
+        sell_mode=sell_mode,
+        sell_value=0 if sell_mode == SellMode.TIME_BASED else 10,
+        time_added=datetime.now(timezone.utc) - timedelta(minutes=1),
+        last_price_max=1.0,
+    )
+
+
+def test_tick_does_not_wait_for_triggered_sells():
+    manager = _order_manager([_order("1")])
+    release = asyncio.Event()
+    sold = []
+
+    async def sell(order):
+        await release.wait()
+        sold.append(order.id)
+
+    manager._sell_order = sell
+
+    async def run():
+        await asyncio.wait_for(manager.process_orders(), timeout=1)
+        assert sold == []
+        assert len(manager._sell_tasks) == 1
+
+        release.set()
+        await manager.wait_for_sells()
+        assert sold == ["1"]
+        assert not manager._sell_tasks
+
+    asyncio.run(run())
+
+
+def test_confirmations_share_the_sell_slots():
+    manager = _order_manager(
+        [_order("1", SellMode.STOP_LOSS), _order("2", SellMode.STOP_LOSS)]
+    )
+    manager.prices.get_prices = lambda mints, fallback=True: _prices(mints, 0.5)
+    in_flight = 0
+    peak = 0
+    confirmed = []
+
+    async def determine(order, interval):
+        nonlocal in_flight, peak
+        confirmed.append(order.id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    manager._determine_sell = determine
+
+    async def run():
+        await manager.process_orders()
+        await manager.wait_for_sells()
+
+    asyncio.run(run())
+    assert sorted(confirmed) == ["1", "2"]
+    assert peak == 1
+
+
+async def _prices(mints, price):
+    return {mint: price for mint in mints}
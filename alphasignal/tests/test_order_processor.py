@@ -0,0 +1,45 @@
+import asyncio
+
+from alphasignal.services.order_manager import OrderManager
+from alphasignal.services.order_processor import OrderProcessor
+
+
+class FakeDB:
+    def get_data_version(self):
+        return 1
+
+
+class FakeOrderManager:
+    def __init__(self):
+        self.db = FakeDB()
+        self.ticks = []
+
+    async def process_orders(self):
+        self.ticks.append(asyncio.get_running_loop().time())
+
+    def sync_orders(self):
+        pass
+
+    def flush_orders(self):
+        return 0
+
+    async def wait_for_sells(self):
+        pass
+
+
+def test_order_change_wakes_processor_before_interval():
+    manager = FakeOrderManager()
+    processor = OrderProcessor(order_manager=manager, tick_interval=60)
+
+    async def run():
+        task = asyncio.create_task(processor.run())
+        await asyncio.sleep(0.05)
+        # Any OrderManager in this process announces new or canceled orders
+        OrderManager._notify_change()
+        await asyncio.sleep(0.05)
+        processor.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+    asyncio.run(run())
+    assert len(manager.ticks) == 2
+    assert OrderManager._change_listeners == []
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from alphasignal.app import app
+from alphasignal.models.token_balance import TokenBalance
+
+client = TestClient(app)
+
+ORDER = {
+    "mint_address": "mint",
+    "sell_mode": "stop_loss",
+    "sell_value": 10,
+    "sell_type": "USDC",
+    "balance": 5,
+    "slippage": 50,
+}
+
+
+class FakeWallet:
+    async def get_token_balance(self, mint_address):
+        return TokenBalance(mint_address=mint_address, balance=10)
+
+
+class FakeOrderManager:
+    added = []
+
+    def __init__(self):
+        self.wallet = FakeWallet()
+
+    def get_remaining_trackable_balance(self, mint_address, balance):
+        return balance
+
+    def add_order(self, *args):
+        FakeOrderManager.added.append(args)
+        return "order-1"
+
+
+class FakePriceEngine:
+    async def get_price(self, mint_address):
+        raise Exception(f"Unable to fetch price for mint address: {mint_address}")
+
+
+class FakeDexscreener:
+    price = "0.25"
+
+    async def get_token_pairs(self, mint_address):
+        if self.price is None:
+            raise Exception("Error fetching data: no pairs")
+        return {"priceUsd": self.price}
+
+
+@patch("alphasignal.routers.orders_router.DexscreenerClient", FakeDexscreener)
+@patch("alphasignal.routers.orders_router.get_price_engine", FakePriceEngine)
+@patch("alphasignal.routers.orders_router.OrderManager", FakeOrderManager)
+def test_add_order_falls_back_to_dexscreener_price():
+    FakeOrderManager.added = []
+
+    response = client.post("/orders/add", json=ORDER)
+
+    assert response.status_code == 200
+    assert response.json() == "order-1"
+    # token_value is the sixth positional argument
+    assert FakeOrderManager.added[0][5] == 0.25
+
+
+@patch("alphasignal.routers.orders_router.DexscreenerClient", FakeDexscreener)
+@patch("alphasignal.routers.orders_router.get_price_engine", FakePriceEngine)
+@patch("alphasignal.routers.orders_router.OrderManager", FakeOrderManager)
+def test_add_order_without_any_price_is_not_found():
+    FakeOrderManager.added = []
+
+    with patch.object(FakeDexscreener, "price", None):
+        response = client.post("/orders/add", json=ORDER)
+
+    assert response.status_code == 404
+    assert "detail" in response.json()
+    assert FakeOrderManager.added == []
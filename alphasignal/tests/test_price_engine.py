@@ -0,0 +1,69 @@
+import asyncio
+
+from alphasignal.services.price_engine import PriceEngine
+
+
+class FakeJupiter:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    async def fetch_token_values(self, mints, fallback=True):
+        mints = list(mints)
+        self.calls.append(mints)
+        await asyncio.sleep(0.01)
+        return {m: self.prices[m] for m in mints if m in self.prices}
+
+
+def test_fresh_prices_are_served_from_memory():
+    engine = PriceEngine(ttl=60)
+    engine.jupiter = FakeJupiter({"a": 1.0, "b": 2.0})
+
+    async def run():
+        first = await engine.get_prices(["a", "b", "a"])
+        second = await engine.get_prices(["a", "b"])
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"a": 1.0, "b": 2.0}
+    assert engine.jupiter.calls == [["a", "b"]]
+
+
+def test_concurrent_lookups_share_one_fetch():
+    engine = PriceEngine(ttl=60)
+    engine.jupiter = FakeJupiter({"a": 1.0})
+
+    async def run():
+        return await asyncio.gather(*(engine.get_price("a") for _ in range(5)))
+
+    assert asyncio.run(run()) == [1.0] * 5
+    assert engine.jupiter.calls == [["a"]]
+
+
+def test_refresh_only_touches_watched_mints_and_notifies_subscribers():
+    engine = PriceEngine(ttl=60, refresh_interval=0.001)
+    engine.jupiter = FakeJupiter({"a": 1.0, "b": 2.0, "c": 3.0})
+    seen = []
+    engine.set_watchlist("orders", ["a"])
+    unsubscribe = engine.subscribe("b", lambda point: seen.append(point.price))
+
+    asyncio.run(engine.refresh())
+    assert sorted(engine.jupiter.calls[0]) == ["a", "b"]
+    assert seen == [2.0]
+
+    unsubscribe()
+    engine.set_watchlist("orders", [])
+    assert engine.watched_mints() == set()
+
+
+def test_wallet_display_prices_are_not_published(monkeypatch):
+    from alphasignal.services import wallet_manager
+
+    engine = PriceEngine(ttl=60)
+    monkeypatch.setattr(wallet_manager, "get_price_engine", lambda: engine)
+
+    assert wallet_manager._display_price("a", "1.5") == 1.5
+    assert engine.peek("a") is None
+
+    engine.update("a", 2.0)
+    assert wallet_manager._display_price("a", "1.5") == 2.0
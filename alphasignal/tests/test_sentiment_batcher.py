@@ -0,0 +1,52 @@
+import asyncio
+
+from alphasignal.ai.chains import twitter_chains
+from alphasignal.ai.models.sentiment_response import SentimentResponse
+from alphasignal.services.sentiment_batcher import SentimentBatcher
+
+
+def test_burst_is_sent_as_batches(monkeypatch):
+    batches = []
+
+    async def batch_sentiment(tweets):
+        batches.append([text for text, _ in tweets])
+        return [SentimentResponse(response=[]) for _ in tweets]
+
+    async def single_sentiment(text, tokens):
+        raise AssertionError("single call made for a batched tweet")
+
+    monkeypatch.setattr(twitter_chains, "get_batch_tweet_sentiment", batch_sentiment)
+    monkeypatch.setattr(twitter_chains, "get_tweet_sentiment", single_sentiment)
+    batcher = SentimentBatcher(window=0.05, max_size=4)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.classify(f"tweet {i}", []) for i in range(6))
+        )
+
+    assert len(asyncio.run(run())) == 6
+    assert batches == [[f"tweet {i}" for i in range(4)], ["tweet 4", "tweet 5"]]
+
+
+def test_failed_batch_falls_back_to_single_calls(monkeypatch):
+    singles = []
+
+    async def batch_sentiment(tweets):
+        raise ValueError("unparseable")
+
+    async def single_sentiment(text, tokens):
+        singles.append(text)
+        return SentimentResponse(response=[])
+
+    monkeypatch.setattr(twitter_chains, "get_batch_tweet_sentiment", batch_sentiment)
+    monkeypatch.setattr(twitter_chains, "get_tweet_sentiment", single_sentiment)
+    batcher = SentimentBatcher(window=0.01, max_size=4)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.classify("a", []), batcher.classify("b", [])
+        )
+
+    assert len(asyncio.run(run())) == 2
+    assert sorted(singles) == ["a", "b"]
+    assert batcher.fallbacks == 1
@@ -0,0 +1,40 @@
+from alphasignal.ai.models.sentiment_response import SentimentResponse, TokenSentiment
+from alphasignal.database import db as db_module
+from alphasignal.database.connection import connection_manager
+from alphasignal.models.enums import TweetSentiment
+from alphasignal.models.token_info import TokenInfo
+from alphasignal.services.sentiment_cache import SentimentCache, sentiment_cache_key
+
+
+def test_copies_of_a_post_share_a_key():
+    bonk = TokenInfo(ticker="$BONK")
+    wif = TokenInfo(ticker="$WIF")
+    key = sentiment_cache_key("Buy $BONK and $WIF https://t.co/abc", [bonk, wif])
+
+    assert key == sentiment_cache_key(
+        "RT @shill: buy  $BONK and $WIF https://t.co/xyz", [wif, bonk]
+    )
+    assert key != sentiment_cache_key("Sell $BONK and $WIF", [bonk, wif])
+
+
+def test_results_are_cached_and_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "sentiment.db"))
+    try:
+        db_module.SQLiteDB().initialize_database()
+        tokens = [TokenInfo(ticker="$BONK")]
+        response = SentimentResponse(
+            response=[
+                TokenSentiment(token=tokens[0], sentiment=TweetSentiment.POSITIVE)
+            ]
+        )
+        cache = SentimentCache(ttl=60)
+        assert cache.get("buy $BONK", tokens) is None
+        cache.set("buy $BONK", tokens, response)
+        assert cache.get("buy $BONK", tokens) == response
+
+        restarted = SentimentCache(ttl=60)
+        assert restarted.get("Buy $BONK", tokens) == response
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert restarted.stats().hit_rate == 1.0
+    finally:
+        connection_manager.close_thread_connections()
@@ -0,0 +1,76 @@
+import asyncio
+
+from alphasignal.models.tweet_catcher_payload import DataMinimal
+from alphasignal.services.signal_queue import SignalQueue
+
+
+def test_signals_keep_profile_order_and_run_concurrently():
+    handled = []
+    running = 0
+    peak = 0
+
+    async def handler(payload):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        handled.append(payload)
+        running -= 1
+
+    async def run():
+        queue = SignalQueue(handler, workers=4, max_age=60, maxsize=100)
+        queue.start()
+        for i in range(5):
+            for profile in ("a", "b", "c", "d"):
+                assert queue.submit(profile, (profile, i))
+        await queue.join()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(run())
+    assert stats.processed == 20
+    for profile in ("a", "b", "c", "d"):
+        assert [i for p, i in handled if p == profile] == list(range(5))
+    assert peak > 1
+
+
+def test_stale_signals_are_dropped_and_full_queue_rejects():
+    handled = []
+    now = 1000.0
+
+    async def handler(payload):
+        handled.append(payload)
+
+    async def run():
+        queue = SignalQueue(handler, workers=1, max_age=5, maxsize=2, clock=lambda: now)
+        assert not queue.submit("a", "before start")
+        queue.start()
+        # Posted ten seconds before it reached the queue
+        assert queue.submit("a", "stale", received_at=now - 10)
+        assert queue.submit("a", "fresh")
+        assert not queue.submit("a", "overflow")
+        await queue.join()
+        await queue.stop()
+        return queue.stats()
+
+    stats = asyncio.run(run())
+    assert handled == ["fresh"]
+    assert stats.dropped_stale == 1
+    assert stats.rejected == 2
+    assert stats.max_wait_seconds == 10
+
+
+def test_tweet_timestamp_is_read_from_the_payload():
+    data = DataMinimal(
+        is_retweet=False,
+        is_reply=False,
+        created_at="Wed Oct 10 20:19:24 +0000 2018",
+    )
+    assert data.posted_at() == 1539202764.0
+    assert DataMinimal(is_retweet=False, is_reply=False).posted_at() is None
+    assert (
+        DataMinimal(
+            is_retweet=False, is_reply=False, created_at=1539202764000
+        ).posted_at()
+        == 1539202764.0
+    )
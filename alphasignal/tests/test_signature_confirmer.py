@@ -0,0 +1,105 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from websockets.asyncio.server import serve
+
+from alphasignal.services import signature_confirmer
+from alphasignal.services.signature_confirmer import (
+    SignatureConfirmationError,
+    SignatureConfirmer,
+)
+
+CONFIRMED_SIG = "5" * 88
+FAILED_SIG = "4" * 88
+PENDING_SIG = "3" * 88
+
+
+class StubRpcWebsocket:
+    """Answers signatureSubscribe like an RPC node, notifying per outcomes."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes  # signature -> err, left out to never notify
+        self.subscribed = []
+
+    async def handler(self, ws):
+        async for raw in ws:
+            request = json.loads(raw)
+            signature = request["params"][0]
+            self.subscribed.append((signature, request["params"][1]["commitment"]))
+            subscription = request["id"] + 100
+            await ws.send(
+                json.dumps(
+                    {"jsonrpc": "2.0", "result": subscription, "id": request["id"]}
+                )
+            )
+            if signature in self.outcomes:
+                notification = {
+                    "jsonrpc": "2.0",
+                    "method": "signatureNotification",
+                    "params": {
+                        "result": {
+                            "context": {"slot": 1},
+                            "value": {"err": self.outcomes[signature]},
+                        },
+                        "subscription": subscription,
+                    },
+                }
+                await ws.send(json.dumps(notification))
+
+
+class FakeSolanaClient:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    async def get_signature_statuses(self, signatures):
+        self.calls.append(list(signatures))
+        return [self.statuses.get(signature) for signature in signatures]
+
+
+def test_websocket_notification_wakes_waiters():
+    stub = StubRpcWebsocket({CONFIRMED_SIG: None, FAILED_SIG: "AccountInUse"})
+
+    async def run():
+        async with serve(stub.handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            confirmer = SignatureConfirmer(
+                commitment="processed",
+                poll_interval=30,
+                ws_url=f"ws://127.0.0.1:{port}",
+            )
+            results = await asyncio.gather(
+                confirmer.confirm(CONFIRMED_SIG, timeout=5),
+                confirmer.confirm(FAILED_SIG, timeout=5),
+                return_exceptions=True,
+            )
+            assert results[0] is None
+            assert isinstance(results[1], SignatureConfirmationError)
+            with pytest.raises(SignatureConfirmationError):
+                await confirmer.confirm(PENDING_SIG, timeout=0.2)
+            await confirmer.close()
+
+        assert {commitment for _, commitment in stub.subscribed} == {"processed"}
+
+    asyncio.run(run())
+
+
+def test_status_poller_confirms_without_websocket(monkeypatch):
+    status = SimpleNamespace(
+        err=None, confirmation_status=1, confirmations=3  # confirmed
+    )
+    client = FakeSolanaClient({CONFIRMED_SIG: status})
+    monkeypatch.setattr(signature_confirmer, "get_solana_client", lambda: client)
+
+    async def run():
+        # Nothing listens on port 1, so only the status poller can confirm
+        confirmer = SignatureConfirmer(
+            commitment="confirmed", poll_interval=0.05, ws_url="ws://127.0.0.1:1"
+        )
+        await confirmer.confirm(CONFIRMED_SIG, timeout=5)
+        await confirmer.close()
+
+    asyncio.run(run())
+    assert client.calls[0] == [CONFIRMED_SIG]
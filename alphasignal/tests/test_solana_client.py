@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+from alphasignal.apis.solana import solana_client
+from alphasignal.apis.solana.solana_client import SolanaClient, get_solana_client
+
+
+def test_client_replaced_for_a_new_loop_is_closed_on_its_own_loop(monkeypatch):
+    monkeypatch.setattr(solana_client, "_solana_client", None)
+    monkeypatch.setattr(solana_client, "_solana_client_loop", None)
+    monkeypatch.setattr(SolanaClient, "__init__", lambda self: None)
+    closed_on = []
+
+    async def close(self):
+        closed_on.append(asyncio.get_running_loop())
+
+    monkeypatch.setattr(SolanaClient, "close", close)
+
+    # A loop that keeps running in another thread owns the first client
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+
+        async def current():
+            return get_solana_client()
+
+        old = asyncio.run_coroutine_threadsafe(current(), other_loop).result(1)
+        new = asyncio.run(current())
+        # The close was scheduled on the owning loop; wait for it to run
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(1)
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+    assert new is not old
+    assert closed_on == [other_loop]
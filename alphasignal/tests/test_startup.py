@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing an entry point must stay well under a second
+IMPORT_BUDGET_SECONDS = 1.0
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "providers": [m for m in sys.modules if m.split(".")[0] in (
+        "langchain_openai", "langchain_anthropic", "langchain_google_genai",
+        "langchain_deepseek", "langchain_mistralai",
+    )],
+}}))
+"""
+
+
+@pytest.mark.parametrize("module", ["alphasignal.app", "alphasignal.processor"])
+def test_entry_points_import_fast_without_side_effects(module, tmp_path):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    # Warm the bytecode cache so the budget measures imports, not compilation
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"], cwd=tmp_path, env=env, check=True
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["providers"] == []
+    # No database, wallet or other files are created at import
+    assert list(tmp_path.iterdir()) == []
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
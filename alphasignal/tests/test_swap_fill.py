@@ -0,0 +1,68 @@
+import json
+
+from solders.transaction_status import UiTransactionStatusMeta
+
+from alphasignal.models.constants import SOL_MINT_ADDRESS
+from alphasignal.utils.swap_fill import swap_fill_from_meta
+
+OWNER = "8ZdfnJQjEkdR3gRzzpNY2vxBM8YbJ1xx8Y9aU6kQhXrn"
+OTHER = "9xQeWvG816bUx9EPjHmaT23yvVM2ZWbrrpZb9PusVFin"
+MINT = "6d5zHW5B8RkGKd51Lpb9RqFQSqDudr9GJgZ1SgQZpump"
+
+
+def token_balance(index, mint, owner, amount):
+    return {
+        "accountIndex": index,
+        "mint": mint,
+        "owner": owner,
+        "uiTokenAmount": {
+            "uiAmount": amount,
+            "decimals": 6,
+            "amount": str(int(amount * 10**6)),
+            "uiAmountString": str(amount),
+        },
+    }
+
+
+def meta(pre_lamports, post_lamports, pre_tokens, post_tokens, fee=5000):
+    return UiTransactionStatusMeta.from_json(
+        json.dumps(
+            {
+                "err": None,
+                "status": {"Ok": None},
+                "fee": fee,
+                "preBalances": [pre_lamports, 0],
+                "postBalances": [post_lamports, 0],
+                "preTokenBalances": pre_tokens,
+                "postTokenBalances": post_tokens,
+            }
+        )
+    )
+
+
+def test_buy_fill_counts_only_the_owners_token_accounts():
+    # 0.5 SOL spent on 1200 tokens; another wallet's account also moved
+    swap = meta(
+        2_000_000_000,
+        1_499_995_000,
+        [token_balance(1, MINT, OWNER, 100.0), token_balance(2, MINT, OTHER, 5.0)],
+        [token_balance(1, MINT, OWNER, 1300.0), token_balance(2, MINT, OTHER, 0.0)],
+    )
+
+    fill = swap_fill_from_meta("sig", swap, OWNER, SOL_MINT_ADDRESS, MINT)
+
+    assert fill.input_amount == 0.5
+    assert fill.output_amount == 1200.0
+
+
+def test_sell_to_sol_fill_excludes_the_network_fee():
+    swap = meta(
+        1_000_000_000,
+        1_249_995_000,
+        [token_balance(1, MINT, OWNER, 1200.0)],
+        [token_balance(1, MINT, OWNER, 0.0)],
+    )
+
+    fill = swap_fill_from_meta("sig", swap, OWNER, MINT, SOL_MINT_ADDRESS)
+
+    assert (fill.input_amount, fill.output_amount) == (1200.0, 0.25)
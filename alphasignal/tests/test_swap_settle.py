@@ -0,0 +1,144 @@
+import asyncio
+from types import SimpleNamespace
+
+from solders.transaction_status import TransactionConfirmationStatus
+
+from alphasignal.apis.jupiter import jupiter_client
+from alphasignal.apis.jupiter.jupiter_client import JupiterClient, SwapNotSettledError
+from alphasignal.models.constants import SOL_MINT_ADDRESS
+from alphasignal.models.enums import OrderStatus, SellType
+from alphasignal.models.swap_fill import SwapFill
+from alphasignal.services.order_manager import OrderManager
+
+MINT = "Mint111111111111111111111111111111111111111"
+
+
+class FakeSolanaClient:
+    def __init__(self, statuses, block_height=100):
+        self.statuses = list(statuses)
+        self.block_height = block_height
+
+    async def get_signature_statuses(self, signatures):
+        return [self.statuses.pop(0) if self.statuses else None]
+
+    async def get_block_height(self):
+        return self.block_height
+
+
+def _client(monkeypatch, solana_client):
+    monkeypatch.setattr(jupiter_client, "get_solana_client", lambda: solana_client)
+    client = JupiterClient()
+    client.swap_settle_interval = 0
+    return client
+
+
+def _fill(signature="sig"):
+    return SwapFill(
+        signature=signature,
+        input_mint=MINT,
+        output_mint=SOL_MINT_ADDRESS,
+        input_amount=10.0,
+        output_amount=0.5,
+    )
+
+
+def test_settle_swap_returns_none_once_the_blockhash_expired(monkeypatch):
+    client = _client(monkeypatch, FakeSolanaClient([None], block_height=151))
+    error = SwapNotSettledError("sig", 150, "timed out")
+
+    assert asyncio.run(client.settle_swap(error, None, MINT, SOL_MINT_ADDRESS)) is None
+
+
+def test_settle_swap_waits_for_a_pending_swap_and_returns_its_fill(monkeypatch):
+    confirmed = SimpleNamespace(
+        err=None,
+        confirmations=1,
+        confirmation_status=TransactionConfirmationStatus.Confirmed,
+    )
+    client = _client(monkeypatch, FakeSolanaClient([None, confirmed]))
+
+    async def fetch_fill(signature, wallet_manager, from_mint, to_mint):
+        return _fill(signature)
+
+    client._fetch_fill = fetch_fill
+    error = SwapNotSettledError("sig", 150, "timed out")
+
+    fill = asyncio.run(client.settle_swap(error, None, MINT, SOL_MINT_ADDRESS))
+    assert fill.signature == "sig"
+
+
+def test_settle_swap_raises_while_the_outcome_is_unknown(monkeypatch):
+    client = _client(monkeypatch, FakeSolanaClient([]))
+    client.swap_settle_timeout = 0
+    error = SwapNotSettledError("sig", 150, "timed out")
+
+    try:
+        asyncio.run(client.settle_swap(error, None, MINT, SOL_MINT_ADDRESS))
+    except SwapNotSettledError as e:
+        assert e.signature == "sig"
+    else:
+        raise AssertionError("expected SwapNotSettledError")
+
+
+class FakeJupiter:
+    def __init__(self, settled):
+        self.settled = settled
+        self.sent = 0
+
+    async def swap_tokens(self, *args, **kwargs):
+        self.sent += 1
+        raise SwapNotSettledError(f"sig{self.sent}", 150, "timed out")
+
+    async def settle_swap(self, error, wallet_manager, from_mint, to_mint):
+        if isinstance(self.settled, Exception):
+            raise self.settled
+        return self.settled
+
+
+class FakePrices:
+    async def get_price(self, mint):
+        return 100.0
+
+
+def _order_manager(jupiter):
+    manager = OrderManager.__new__(OrderManager)
+    manager.jupiter = jupiter
+    manager.wallet = None
+    manager.prices = FakePrices()
+    manager.statuses = []
+    manager.completed = []
+    manager.set_order_status = lambda order_id, status: manager.statuses.append(status)
+    manager.complete_order = (
+        lambda order_id, profit=None, fill=None: manager.completed.append(
+            (profit, fill)
+        )
+    )
+    return manager
+
+
+def _order():
+    return SimpleNamespace(
+        id=1, mint_address=MINT, sell_type=SellType.SOL, balance=10, slippage=50
+    )
+
+
+def test_sell_that_landed_late_completes_without_resending():
+    jupiter = FakeJupiter(_fill())
+    manager = _order_manager(jupiter)
+
+    asyncio.run(manager._sell_order(_order()))
+
+    assert jupiter.sent == 1
+    assert manager.completed == [(50.0, jupiter.settled)]
+    assert manager.statuses == []
+
+
+def test_unresolved_sell_is_neither_resent_nor_reactivated():
+    jupiter = FakeJupiter(SwapNotSettledError("sig1", 150, "still pending"))
+    manager = _order_manager(jupiter)
+
+    asyncio.run(manager._sell_order(_order()))
+
+    assert jupiter.sent == 1
+    assert manager.completed == []
+    assert OrderStatus.ACTIVE not in manager.statuses
@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+from alphasignal.apis.dexscreener.dexscreener_client import NoPairsFoundError
+from alphasignal.database import db as db_module
+from alphasignal.database.connection import connection_manager
+from alphasignal.services.ticker_resolver import TickerResolver
+
+
+class FakeDexscreener:
+    def __init__(self, mints):
+        self.mints = mints
+        self.calls = []
+
+    async def get_top_volume_mint_address(self, ticker):
+        self.calls.append(ticker)
+        if ticker == "DOWN":
+            # What an outage page served instead of JSON looks like
+            raise json.JSONDecodeError("Expecting value", "<html>", 0)
+        if ticker not in self.mints:
+            raise NoPairsFoundError(f"No pairs found for ticker: {ticker}")
+        return self.mints[ticker]
+
+
+def test_resolutions_are_cached_persisted_and_pinnable(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "tickers.db"))
+    try:
+        db_module.SQLiteDB().initialize_database()
+        resolver = TickerResolver(ttl=60, negative_ttl=60)
+        resolver.dexscreener_client = FakeDexscreener({"BONK": "bonk-mint"})
+
+        async def run():
+            assert await resolver.resolve("$BONK") == "bonk-mint"
+            assert await resolver.resolve("BONK") == "bonk-mint"
+            assert await resolver.resolve("$NOPE") is None
+            assert await resolver.resolve("$NOPE") is None
+
+        asyncio.run(run())
+        assert resolver.dexscreener_client.calls == ["BONK", "NOPE"]
+
+        # A new process reads the resolutions back from the database
+        restarted = TickerResolver(ttl=60, negative_ttl=60)
+        restarted.dexscreener_client = FakeDexscreener({})
+        restarted.pin("$NOPE", "pinned-mint")
+        assert asyncio.run(restarted.resolve("BONK")) == "bonk-mint"
+        assert asyncio.run(restarted.resolve("NOPE")) == "pinned-mint"
+        assert restarted.dexscreener_client.calls == []
+
+        restarted.unpin("NOPE")
+        assert restarted.lookup("NOPE") is None
+    finally:
+        connection_manager.close_thread_connections()
+
+
+def test_failed_searches_are_not_negative_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "tickers.db"))
+    try:
+        db_module.SQLiteDB().initialize_database()
+        resolver = TickerResolver(ttl=60, negative_ttl=60)
+        resolver.dexscreener_client = FakeDexscreener({})
+
+        async def run():
+            assert await resolver.resolve("$DOWN") is None
+            assert await resolver.resolve("$DOWN") is None
+
+        asyncio.run(run())
+        assert resolver.dexscreener_client.calls == ["DOWN", "DOWN"]
+        assert resolver.lookup("DOWN") is None
+    finally:
+        connection_manager.close_thread_connections()
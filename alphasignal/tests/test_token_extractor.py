@@ -0,0 +1,38 @@
+import json
+import os
+
+from alphasignal.utils.token_extractor import extract_tokens
+
+SAMPLE_HOOKS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "sample_hooks",
+)
+PUMP_MINT = "6d5zHW5B8RkGKd51Lpb9RqFQSqDudr9GJgZ1SgQZpump"
+
+
+def load_sample_texts():
+    texts = {}
+    for name in sorted(os.listdir(SAMPLE_HOOKS_DIR)):
+        with open(os.path.join(SAMPLE_HOOKS_DIR, name)) as file:
+            texts[name] = json.load(file)["data"]["full_text"]
+    return texts
+
+
+def test_extracts_deduped_tickers_and_valid_mints():
+    text = (
+        f"$BONK $bonk $WIF ape {PUMP_MINT} again {PUMP_MINT} "
+        "tx 5VERv8NMvzbJMEkV8xnrLkEaWRtSz9CosKDYjCJjBRnbJLgp8uirBgmQpjKhoR4tjF3ZpRzrFmBV6UjKdiSZkQUW "
+        "https://t.co/Ica85GVIuq 123456789ABCDEFGHJKLMNPQRSTUVWXYZab"
+    )
+    tickers, mints = extract_tokens(text)
+
+    assert [t.ticker for t in tickers] == ["$BONK", "$WIF"]
+    assert [m.mint_address for m in mints] == [PUMP_MINT]
+
+
+def test_extracts_tokens_from_sample_hooks():
+    texts = load_sample_texts()
+    assert [m.mint_address for m in extract_tokens(texts["tweet_webhook.json"])[1]] == [
+        PUMP_MINT
+    ]
+    assert extract_tokens(texts["retweet_webhook.json"]) == ([], [])
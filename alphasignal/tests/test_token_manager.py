@@ -0,0 +1,49 @@
+import asyncio
+from types import SimpleNamespace
+
+import alphasignal.database.db as db_module
+import alphasignal.services.token_manager as token_manager_module
+from alphasignal.apis.solana.solana_client import SolanaClient
+from alphasignal.database.db import SQLiteDB
+from alphasignal.models.constants import SOL_MINT_ADDRESS, USDC_MINT_ADDRESS
+from alphasignal.services.token_manager import TokenManager
+
+
+def _mint_account(decimals: int):
+    # SPL mint layout: decimals live at byte offset 44
+    data = bytearray(82)
+    data[44] = decimals
+    return SimpleNamespace(data=bytes(data))
+
+
+def test_decimals_are_fetched_once_in_bulk(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_module, "DB_PATH", str(tmp_path / "test.db"))
+    SQLiteDB().initialize_database()
+    token_manager_module._decimals_cache.clear()
+
+    calls = []
+
+    async def fake_get_multiple_acc_info(self, pubkeys):
+        calls.append([str(p) for p in pubkeys])
+        return [_mint_account(6 if str(p) == USDC_MINT_ADDRESS else 9) for p in pubkeys]
+
+    monkeypatch.setattr(
+        SolanaClient, "get_multiple_acc_info", fake_get_multiple_acc_info
+    )
+
+    decimals = asyncio.run(
+        TokenManager.get_decimals(
+            [USDC_MINT_ADDRESS, SOL_MINT_ADDRESS, USDC_MINT_ADDRESS]
+        )
+    )
+    assert decimals == {USDC_MINT_ADDRESS: 6, SOL_MINT_ADDRESS: 9}
+    assert calls == [[USDC_MINT_ADDRESS, SOL_MINT_ADDRESS]]
+
+    # Served from memory
+    assert asyncio.run(TokenManager(USDC_MINT_ADDRESS).get_token_decimals()) == 6
+    assert len(calls) == 1
+
+    # Served from the token_info table after a restart
+    token_manager_module._decimals_cache.clear()
+    assert asyncio.run(TokenManager(SOL_MINT_ADDRESS).get_token_decimals()) == 9
+    assert len(calls) == 1
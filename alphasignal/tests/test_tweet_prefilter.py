@@ -0,0 +1,61 @@
+from alphasignal.models.configs import PrefilterConfig, ProfilePrefilterConfig
+from alphasignal.models.constants import SOL_MINT_ADDRESS
+from alphasignal.models.enums import TweetSentiment, TweetType
+from alphasignal.models.token_info import TokenInfo
+from alphasignal.services.tweet_prefilter import TweetPrefilter
+
+BONK = TokenInfo(ticker="$BONK")
+
+
+def make_prefilter(**overrides):
+    config = dict(
+        excluded_tickers=["SOL", "USDC"],
+        excluded_mints=[SOL_MINT_ADDRESS],
+        tweet_types=[TweetType.POST, TweetType.REPLY],
+        blocked_keywords=["giveaway"],
+        reply_call_to_action=["buy", "ape"],
+    )
+    config.update(overrides)
+    return TweetPrefilter(PrefilterConfig(**config))
+
+
+def test_rules_drop_tweets_before_the_llm():
+    prefilter = make_prefilter(
+        profiles={"Caller": ProfilePrefilterConfig(tweet_types=[TweetType.RETWEET])}
+    )
+    base_only = [TokenInfo(ticker="$SOL"), TokenInfo(mint_address=SOL_MINT_ADDRESS)]
+
+    assert prefilter.apply("u", TweetType.RETWEET, "$BONK", [BONK]).rule == (
+        "tweet_type:retweet"
+    )
+    assert prefilter.apply("u", TweetType.POST, "$BONK Giveaway!", [BONK]).tokens == []
+    assert prefilter.apply("u", TweetType.REPLY, "nice $BONK", [BONK]).rule == (
+        "reply_without_call_to_action"
+    )
+    assert prefilter.apply("u", TweetType.POST, "$SOL to 500", base_only).rule == (
+        "excluded_tokens"
+    )
+    # Profile overrides replace the global tweet types
+    assert prefilter.apply("caller", TweetType.POST, "$BONK", [BONK]).tokens == []
+
+    passed = prefilter.apply(
+        "u", TweetType.REPLY, "ape $BONK over $SOL", [BONK, base_only[0]]
+    )
+    assert passed.rule is None and passed.tokens == [BONK]
+
+    stats = prefilter.stats()
+    assert stats.evaluated == 6
+    assert stats.llm_calls_avoided == 5
+    assert stats.rules["excluded_tokens"] == 1
+
+
+def test_bare_mentions_can_be_decided_without_the_llm():
+    prefilter = make_prefilter(bare_mention_sentiment=TweetSentiment.POSITIVE)
+
+    decided = prefilter.apply("u", TweetType.POST, "CA: $BONK 🚀", [BONK])
+    assert decided.rule == "bare_mention"
+    assert decided.sentiment.response[0].sentiment == TweetSentiment.POSITIVE.value
+
+    assert (
+        prefilter.apply("u", TweetType.POST, "$BONK is dead", [BONK]).sentiment is None
+    )
@@ -0,0 +1,57 @@
+import asyncio
+
+from langchain_core.runnables import RunnableLambda
+
+from alphasignal.ai.chains import twitter_chains
+from alphasignal.models.token_info import TokenInfo
+
+CALLS = 5
+
+
+class FakeLLM:
+    built = 0
+    in_flight = 0
+    peak = 0
+
+    def __init__(self):
+        FakeLLM.built += 1
+        all_started = asyncio.Event()
+
+        async def respond(prompt):
+            FakeLLM.in_flight += 1
+            FakeLLM.peak = max(FakeLLM.peak, FakeLLM.in_flight)
+            if FakeLLM.in_flight == CALLS:
+                all_started.set()
+            try:
+                # Held open until every call is in flight; serialized calls
+                # would time out here one at a time instead
+                await asyncio.wait_for(all_started.wait(), 0.2)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                FakeLLM.in_flight -= 1
+            return '{"response": [{"token": {"ticker": "$BONK"}, "sentiment": "positive"}]}'
+
+        self.llm = RunnableLambda(respond)
+
+
+def test_chain_is_reused_and_calls_overlap(monkeypatch):
+    monkeypatch.setattr(twitter_chains, "LLM", FakeLLM)
+    monkeypatch.setattr(twitter_chains, "_llm", None)
+    monkeypatch.setattr(twitter_chains, "_sentiment_chain", None)
+    tokens = [TokenInfo(ticker="$BONK")]
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                twitter_chains.get_tweet_sentiment("buy $BONK", tokens)
+                for _ in range(CALLS)
+            )
+        )
+
+    results = asyncio.run(run())
+
+    assert FakeLLM.built == 1
+    assert [r.response[0].sentiment for r in results] == ["positive"] * CALLS
+    # Every call was waiting on the model at the same time
+    assert FakeLLM.peak == CALLS
@@ -1,8 +1,12 @@
+import asyncio
+
 from alphasignal.ai.models.sentiment_response import SentimentResponse, TokenSentiment
+from alphasignal.models.prefilter_result import PrefilterResult
+from alphasignal.models.prepared_buy import PreparedBuy
 from alphasignal.services.twitter_monitor import TwitterMonitor
 from alphasignal.models.token_info import TokenInfo
 from alphasignal.models.tweet_data_extraction import ExtractedTweetData
-from alphasignal.models.enums import Platform, TweetSentiment, TweetType
+from alphasignal.models.enums import AmountType, Platform, TweetSentiment, TweetType
 
 # Language: Python
 
@@ -32,7 +36,7 @@ class FakeAutoManager:
     def __init__(self):
         self.calls = []
 
-    def auto_buy(self, mint_address, platform, username):
+    async def auto_buy(self, mint_address, platform, username, prepared=None):
         self.calls.append(
             {
                 "mint_address": mint_address,
@@ -75,12 +79,15 @@ def test_process_tweet_webhook_calls_auto_buy():
     monitor.auto_manager = fake_manager
 
     # Monkey patch _extract_tweet_info to return our dummy_extracted_data
-    monitor._extract_tweet_info = lambda payload: dummy_extracted_data
+    async def extract_tweet_info(payload, on_tokens=None):
+        return dummy_extracted_data
+
+    monitor._extract_tweet_info = extract_tweet_info
     # Monkey patch _add_tweet_event_to_db to do nothing (avoid DB calls)
     monitor._add_tweet_event_to_db = lambda payload, data: None
 
     # Call process_tweet_webhook
-    monitor.process_tweet_webhook(dummy_payload)
+    asyncio.run(monitor.process_tweet_webhook(dummy_payload))
 
     # Assert that auto_manager.auto_buy was called with expected parameters
     assert len(fake_manager.calls) == 1
@@ -102,10 +109,138 @@ def test_find_tickers():
 
 def test_find_mint_addresses():
     monitor = TwitterMonitor()
-    # A dummy Solana mint address pattern (32 to 44 valid characters)
-    test_message = "Mint address: 123456789ABCDEFGHJKLMNPQRSTUVWXYZab"
+    # A real mint next to a base58-looking string that is not 32 bytes long
+    test_message = (
+        "Mint address: 6d5zHW5B8RkGKd51Lpb9RqFQSqDudr9GJgZ1SgQZpump "
+        "not this one: 123456789ABCDEFGHJKLMNPQRSTUVWXYZab"
+    )
     addresses = monitor._find_mint_addresses(test_message)
-    # Assert at least one address is found and mint_address is set
-    assert len(addresses) >= 1
-    for token in addresses:
-        assert token.mint_address is not None
+    assert [token.mint_address for token in addresses] == [
+        "6d5zHW5B8RkGKd51Lpb9RqFQSqDudr9GJgZ1SgQZpump"
+    ]
+
+
+class FakeResolver:
+    async def resolve(self, ticker):
+        return {"$WIF": "wif_mint"}.get(ticker)
+
+
+class FakePrefilter:
+    def __init__(self, drop=False):
+        self.drop = drop
+
+    def apply(self, user, tweet_type, text, tokens):
+        if self.drop:
+            return PrefilterResult(tokens=[], rule="blocked_keyword")
+        # Rebuilt tokens must still find the buy prepared for them
+        return PrefilterResult(tokens=[token.model_copy() for token in tokens])
+
+
+class SpeculativeAutoManager:
+    def __init__(self):
+        self.prepared = asyncio.Event()
+        self.prepare_cancelled = False
+        self.buys = []
+
+    async def prepare_buy(self, mint_address, platform, username):
+        self.prepared.set()
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.prepare_cancelled = True
+            raise
+        return PreparedBuy(
+            mint_address=mint_address,
+            from_mint_address="sol_mint",
+            swap_balance=1.0,
+            buy_amount_type=AmountType.AMOUNT,
+            buy_amount=1.0,
+            slippage_bps=50,
+            quote={"outAmount": "1"},
+            prepared_at=0,
+        )
+
+    async def auto_buy(self, mint_address, platform, username, prepared=None):
+        self.buys.append((mint_address, prepared))
+        return "order"
+
+
+def _speculative_monitor(sentiment, classify_delay):
+    monitor = TwitterMonitor()
+    monitor.auto_manager = SpeculativeAutoManager()
+    monitor.ticker_resolver = FakeResolver()
+    monitor.prefilter = FakePrefilter()
+    monitor._add_tweet_event_to_db = lambda payload, data: None
+
+    async def classify(text, tokens):
+        await asyncio.sleep(classify_delay)
+        # Mint resolution and quoting started before the verdict came back
+        assert monitor.auto_manager.prepared.is_set()
+        return SentimentResponse(
+            response=[TokenSentiment(token=tokens[0], sentiment=sentiment)]
+        )
+
+    monitor._classify_tokens_sentiment = classify
+    return monitor
+
+
+def _payload(text):
+    return DummyPayload(
+        data=DummyData(full_text=text, text=text, is_retweet=False, is_reply=False),
+        task=DummyTask(user="testuser"),
+    )
+
+
+def test_positive_tweet_buys_with_prepared_quote():
+    monitor = _speculative_monitor(TweetSentiment.POSITIVE, 0.1)
+
+    asyncio.run(monitor.process_tweet_webhook(_payload("aping $WIF")))
+
+    [(mint_address, prepared)] = monitor.auto_manager.buys
+    assert mint_address == "wif_mint"
+    assert prepared.mint_address == "wif_mint"
+
+
+def test_negative_tweet_discards_speculative_quote():
+    monitor = _speculative_monitor(TweetSentiment.NEGATIVE, 0.01)
+
+    asyncio.run(monitor.process_tweet_webhook(_payload("dumping $WIF")))
+
+    assert monitor.auto_manager.buys == []
+    assert monitor.auto_manager.prepare_cancelled
+
+
+def test_dropped_tweet_prepares_no_buy():
+    monitor = _speculative_monitor(TweetSentiment.POSITIVE, 0.01)
+    monitor.prefilter = FakePrefilter(drop=True)
+
+    asyncio.run(monitor.process_tweet_webhook(_payload("giveaway $WIF")))
+
+    assert not monitor.auto_manager.prepared.is_set()
+    assert monitor.auto_manager.buys == []
+
+
+def test_sentiment_parsed_from_the_model_triggers_auto_buy():
+    # The chain parses the model's JSON, which stores the enum's value
+    sentiment = SentimentResponse.model_validate_json(
+        '{"response": [{"token": {"mint_address": "dummy_mint"}, "sentiment": "positive"}]}'
+    )
+    extracted = ExtractedTweetData(
+        tweet_type=TweetType.POST,
+        tokens=[sentiment.response[0].token],
+        token_sentiment=sentiment,
+    )
+    monitor = TwitterMonitor()
+    monitor.auto_manager = FakeAutoManager()
+    monitor._add_tweet_event_to_db = lambda payload, data: None
+
+    async def extract_tweet_info(payload, on_tokens=None):
+        return extracted
+
+    monitor._extract_tweet_info = extract_tweet_info
+
+    asyncio.run(monitor.process_tweet_webhook(_payload("aping dummy_mint")))
+
+    assert [call["mint_address"] for call in monitor.auto_manager.calls] == [
+        "dummy_mint"
+    ]
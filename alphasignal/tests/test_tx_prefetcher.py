@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+from alphasignal.services import tx_prefetcher
+from alphasignal.services.tx_prefetcher import (
+    JUPITER_PROGRAM_ID,
+    PRIORITY_FEE_WINDOW_SLOTS,
+    TxPrefetcher,
+)
+
+
+class FakeSolanaClient:
+    def __init__(self):
+        self.blockhash_calls = 0
+        self.fees = {slot: slot * 10 for slot in range(1, 101)}
+        self.fee_accounts = None
+
+    async def get_latest_blockhash(self):
+        self.blockhash_calls += 1
+        return f"hash-{self.blockhash_calls}"
+
+    async def get_recent_prioritization_fees(self, accounts=None):
+        self.fee_accounts = accounts
+        return dict(self.fees)
+
+
+class FakeOrderBook:
+    def __init__(self, mints=()):
+        self.mints = mints
+
+    def active_orders(self):
+        return [SimpleNamespace(mint_address=mint) for mint in self.mints]
+
+
+def test_blockhash_is_served_from_memory_until_stale(monkeypatch):
+    client = FakeSolanaClient()
+    monkeypatch.setattr(tx_prefetcher, "get_solana_client", lambda: client)
+    prefetcher = TxPrefetcher(max_blockhash_age=60)
+
+    async def run():
+        await prefetcher.refresh()
+        assert await prefetcher.get_blockhash() == "hash-1"
+        assert await prefetcher.get_blockhash() == "hash-1"
+        assert client.blockhash_calls == 1
+
+        prefetcher._blockhash_at -= 61
+        assert await prefetcher.get_blockhash() == "hash-2"
+
+    asyncio.run(run())
+
+
+def test_priority_fee_is_a_capped_percentile_of_recent_slots(monkeypatch):
+    client = FakeSolanaClient()
+    monkeypatch.setattr(tx_prefetcher, "get_solana_client", lambda: client)
+    monkeypatch.setattr(tx_prefetcher, "get_order_book", lambda: FakeOrderBook())
+    prefetcher = TxPrefetcher(fee_percentile=75, max_priority_fee=900)
+    assert prefetcher.get_priority_fee() is None
+
+    async def run():
+        await prefetcher.refresh_fees()
+        assert prefetcher.get_priority_fee() == 750
+
+        # Newer slots push the oldest out of the window and hit the cap
+        client.fees = {slot: 5000 for slot in range(101, 201)}
+        await prefetcher.refresh_fees()
+        assert len(prefetcher._fees) == PRIORITY_FEE_WINDOW_SLOTS
+        assert min(prefetcher._fees) == 51
+        assert prefetcher.get_priority_fee() == 900
+
+    asyncio.run(run())
+
+
+def test_fees_are_sampled_for_the_accounts_swaps_lock(monkeypatch):
+    client = FakeSolanaClient()
+    book = FakeOrderBook(["MintA", "MintB", "MintA"])
+    monkeypatch.setattr(tx_prefetcher, "get_solana_client", lambda: client)
+    monkeypatch.setattr(tx_prefetcher, "get_order_book", lambda: book)
+    prefetcher = TxPrefetcher()
+
+    asyncio.run(prefetcher.refresh_fees())
+
+    assert client.fee_accounts[0] == JUPITER_PROGRAM_ID
+    assert client.fee_accounts[-2:] == ["MintA", "MintB"]
@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+
+from alphasignal.models.wallet import Wallet
+from alphasignal.services import wallet_manager, wallet_snapshot_cache
+from alphasignal.services.wallet_manager import WalletManager
+from alphasignal.services.wallet_snapshot_cache import WalletSnapshotCache
+
+
+def token_account(mint, amount):
+    parsed = {"info": {"mint": mint, "tokenAmount": {"uiAmount": amount}}}
+    return SimpleNamespace(account=SimpleNamespace(data=SimpleNamespace(parsed=parsed)))
+
+
+class FakeSolanaClient:
+    def __init__(self):
+        self.accounts = [token_account("a", 1.5), token_account("b", 2.0)]
+        self.calls = 0
+
+    async def get_owner_token_accounts(self, wallet):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return list(self.accounts)
+
+
+def test_balances_are_cached_and_invalidated(monkeypatch):
+    client = FakeSolanaClient()
+    monkeypatch.setattr(wallet_snapshot_cache, "get_solana_client", lambda: client)
+    cache = WalletSnapshotCache(ttl=60)
+    wallet = Wallet(public_key="owner", wallet_keypair=None)
+
+    async def run():
+        balances = await asyncio.gather(
+            cache.get_balance(wallet, "a"),
+            cache.get_balance(wallet, "b"),
+            cache.get_balance(wallet, "missing"),
+        )
+        assert balances == [1.5, 2.0, 0.0]
+        assert client.calls == 1
+
+        client.accounts.append(token_account("a", 0.5))
+        assert await cache.get_balance(wallet, "a") == 1.5
+        cache.invalidate(wallet)
+        assert await cache.get_balance(wallet, "a") == 2.0
+        assert await cache.get_balance(wallet, "a", max_age=0) == 2.0
+        assert client.calls == 3
+
+    asyncio.run(run())
+
+
+class FakePriceEngine:
+    def __init__(self):
+        self.requested = []
+
+    async def get_price(self, mint_address, max_age=None):
+        self.requested.append(mint_address)
+        return 0.25
+
+
+def test_single_token_balance_skips_other_holdings(monkeypatch):
+    client = FakeSolanaClient()
+    price_engine = FakePriceEngine()
+    monkeypatch.setattr(wallet_snapshot_cache, "get_solana_client", lambda: client)
+    monkeypatch.setattr(
+        wallet_snapshot_cache, "_wallet_snapshot_cache", WalletSnapshotCache(ttl=60)
+    )
+    monkeypatch.setattr(wallet_manager, "get_price_engine", lambda: price_engine)
+    manager = WalletManager.__new__(WalletManager)
+    manager.wallet = Wallet(public_key="owner", wallet_keypair=None)
+
+    async def run():
+        token = await manager.get_token_balance("b")
+        assert (token.balance, token.value) == (2.0, None)
+        token = await manager.get_token_balance("a", with_price=True)
+        assert (token.balance, token.value) == (1.5, 0.25)
+        assert await manager.get_token_balance("missing") is None
+        # Only the requested mint is priced, from one snapshot read
+        assert price_engine.requested == ["a"]
+        assert client.calls == 1
+
+    asyncio.run(run())
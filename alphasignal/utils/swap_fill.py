@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+
+from solders.transaction_status import (
+    UiTransactionStatusMeta,
+    UiTransactionTokenBalance,
+)
+
+from alphasignal.models.constants import SOL_MINT_ADDRESS
+from alphasignal.models.swap_fill import SwapFill
+
+
+def _owner_token_totals(
+    balances: Optional[List[UiTransactionTokenBalance]], owner: str
+) -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    for balance in balances or []:
+        if balance.owner is None or str(balance.owner) != owner:
+            continue
+        mint = str(balance.mint)
+        amount = float(balance.ui_token_amount.ui_amount_string or 0)
+        totals[mint] = totals.get(mint, 0.0) + amount
+    return totals
+
+
+def swap_fill_from_meta(
+    signature: str,
+    meta: UiTransactionStatusMeta,
+    owner: str,
+    input_mint: str,
+    output_mint: str,
+) -> SwapFill:
+    """
+    Works out what a confirmed swap moved from its pre/post balances.
+
+    Token amounts are the change in the owner's token accounts. SOL is wrapped
+    and unwrapped inside the swap, so its amount also includes the change in
+    the fee payer's (the owner's) lamports, with the network fee excluded.
+    Rent for token accounts the swap opened counts as SOL spent.
+    """
+    pre = _owner_token_totals(meta.pre_token_balances, owner)
+    post = _owner_token_totals(meta.post_token_balances, owner)
+
+    def received(mint: str) -> float:
+        amount = post.get(mint, 0.0) - pre.get(mint, 0.0)
+        if mint == SOL_MINT_ADDRESS:
+            lamports = meta.post_balances[0] - meta.pre_balances[0] + meta.fee
+            amount += lamports / 10**9
+        return amount
+
+    return SwapFill(
+        signature=signature,
+        input_mint=input_mint,
+        output_mint=output_mint,
+        input_amount=-received(input_mint),
+        output_amount=received(output_mint),
+    )
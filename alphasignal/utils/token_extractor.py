@@ -0,0 +1,46 @@
+import re
+from typing import List, Tuple
+
+import base58
+
+from alphasignal.models.token_info import TokenInfo
+
+_BASE58 = "1-9A-HJ-NP-Za-km-z"
+
+# One pass finds both $TICKERs and mint candidates. A candidate must be a whole
+# base58 run, so slices of longer hashes or URL paths are not picked up.
+TOKEN_PATTERN = re.compile(
+    rf"(?P<ticker>\$[A-Za-z]{{1,15}})"
+    rf"|(?<![{_BASE58}])(?P<mint>[{_BASE58}]{{32,44}})(?![{_BASE58}])"
+)
+
+
+def is_mint_address(candidate: str) -> bool:
+    """A Solana address is base58 that decodes to exactly 32 bytes."""
+    try:
+        return len(base58.b58decode(candidate)) == 32
+    except ValueError:
+        return False
+
+
+def extract_tokens(text: str) -> Tuple[List[TokenInfo], List[TokenInfo]]:
+    """
+    Returns the tickers and the valid mint addresses mentioned in the text,
+    each deduplicated in order of first mention.
+    """
+    tickers: List[TokenInfo] = []
+    mints: List[TokenInfo] = []
+    seen = set()
+    for match in TOKEN_PATTERN.finditer(text):
+        ticker = match.group("ticker")
+        if ticker is not None:
+            key = ticker.upper()
+            if key not in seen:
+                seen.add(key)
+                tickers.append(TokenInfo(ticker=ticker, mint_address=None))
+            continue
+        mint = match.group("mint")
+        if mint not in seen and is_mint_address(mint):
+            seen.add(mint)
+            mints.append(TokenInfo(mint_address=mint, ticker=None))
+    return tickers, mints